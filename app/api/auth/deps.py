@@ -6,7 +6,11 @@ from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
 from pydantic import ValidationError
 
 from app.api.auth.schemas import TokenPayload
-from app.api.auth.utils import decode_access_token
+from app.api.auth.utils import (
+    cache_principal,
+    decode_access_token,
+    get_cached_principal,
+)
 from app.api.users.deps import get_user_service
 from app.api.users.schemas import User
 from app.api.users.service import UserService
@@ -38,6 +42,10 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
+    cached_user = get_cached_principal(token_data.sub, token_data.exp)
+    if cached_user is not None:
+        return cached_user
+
     user = await user_service.get_user(int(token_data.sub))
 
     if not user:
@@ -45,6 +53,8 @@ async def get_current_user(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
+    user = User.model_validate(user)
+    cache_principal(token_data.sub, token_data.exp, user)
     return user
 
 
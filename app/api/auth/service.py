@@ -0,0 +1,97 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from app.api.auth.utils import get_password_hash, verify_password
+from app.common.base_exceptions import ServiceUnavailableError
+from app.core.metrics import (
+    PASSWORD_HASH_DURATION,
+    PASSWORD_HASH_POOL_BUSY,
+    PASSWORD_HASH_POOL_PENDING,
+    PASSWORD_HASH_POOL_REJECTED,
+)
+from app.core.settings import settings
+
+R = TypeVar("R")
+
+
+class PasswordHashService:
+    """Runs password hashing and verification on a bounded thread pool.
+
+    Argon2 is deliberately slow and releases the GIL while hashing, so running it on
+    worker threads keeps the event loop free for other requests. Jobs beyond
+    `max_workers + max_queue` are rejected instead of piling up behind the pool.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        """Initializes the PasswordHashService.
+
+        Args:
+            max_workers: Number of threads hashing passwords concurrently.
+            max_queue: Number of jobs allowed to wait for a free thread.
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_workers + max_queue
+        self._pending = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs queued or running."""
+        return self._pending
+
+    @staticmethod
+    def _timed(operation: str, func: Callable[..., R], *args) -> R:
+        PASSWORD_HASH_POOL_BUSY.inc()
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            PASSWORD_HASH_DURATION.labels(operation).observe(
+                time.perf_counter() - start
+            )
+            PASSWORD_HASH_POOL_BUSY.dec()
+
+    async def _run(self, operation: str, func: Callable[..., R], *args) -> R:
+        if self._pending >= self.max_pending:
+            PASSWORD_HASH_POOL_REJECTED.inc()
+            raise ServiceUnavailableError(
+                "Too many concurrent password operations, retry later"
+            )
+
+        self._pending += 1
+        PASSWORD_HASH_POOL_PENDING.inc()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._timed, operation, func, *args
+            )
+        finally:
+            self._pending -= 1
+            PASSWORD_HASH_POOL_PENDING.dec()
+
+    async def hash(self, password: str) -> str:
+        """Hashes a password for storing.
+
+        Raises:
+            ServiceUnavailableError: If the hashing queue is full.
+        """
+        return await self._run("hash", get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verifies a password against a hash.
+
+        Raises:
+            ServiceUnavailableError: If the hashing queue is full.
+        """
+        return await self._run(
+            "verify", verify_password, plain_password, hashed_password
+        )
+
+
+password_hash_service = PasswordHashService(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -1,12 +1,38 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional, Union
 
 import jwt
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
+from app.common.cache import LRUCache
 from app.core.settings import settings
 
-password_hash = PasswordHash.recommended()
+password_hash = PasswordHash(
+    (
+        Argon2Hasher(
+            time_cost=settings.PASSWORD_HASH_TIME_COST,
+            memory_cost=settings.PASSWORD_HASH_MEMORY_COST,
+            parallelism=settings.PASSWORD_HASH_PARALLELISM,
+        ),
+    )
+)
+
+# Authenticated users keyed by token subject, each entry remembers the `exp` of the
+# token it was loaded for.
+principal_cache = LRUCache(
+    name="auth_principals",
+    maxsize=settings.AUTH_PRINCIPAL_CACHE_MAXSIZE,
+    ttl=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+# Verified token payloads keyed by the SHA-256 digest of the raw token, each entry
+# expires together with its token.
+token_cache = LRUCache(
+    name="auth_tokens", maxsize=max(settings.JWT_DECODE_CACHE_MAXSIZE, 1)
+)
 
 
 # TODO: Should it be async or not?
@@ -32,10 +58,27 @@ def create_access_token(
 def decode_access_token(token: str) -> dict[str, Any]:
     """
     Decode a JWT access token.
+
+    Signature verification is skipped for tokens that were already verified and
+    have not expired yet.
     """
-    return jwt.decode(
-        token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-    )
+    if settings.JWT_DECODE_CACHE_MAXSIZE == 0:
+        return jwt.decode(
+            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+        )
+
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is None:
+        payload = jwt.decode(
+            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+        )
+        # Tokens without `exp` never expire, so they are not worth the risk.
+        if isinstance(payload.get("exp"), (int, float)):
+            ttl = payload["exp"] - time.time()
+            if ttl > 0:
+                token_cache.set(key, payload, ttl=ttl)
+    return dict(payload)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -50,3 +93,43 @@ def get_password_hash(password: str) -> str:
     Hash a password for storing.
     """
     return password_hash.hash(password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a hash was made with other parameters than the configured ones.
+    """
+    hasher = password_hash.current_hasher
+    return not hasher.identify(hashed_password) or hasher.check_needs_rehash(
+        hashed_password
+    )
+
+
+def get_cached_principal(subject: str, expires_at: Optional[int]) -> Any | None:
+    """
+    Return the user cached for the token `(subject, expires_at)`, if any.
+    """
+    entry = principal_cache.get(subject)
+    if entry is None or entry[0] != expires_at:
+        return None
+    return entry[1]
+
+
+def cache_principal(subject: str, expires_at: Optional[int], user: Any) -> None:
+    """
+    Cache the user loaded for the token `(subject, expires_at)`.
+
+    The entry never outlives the token.
+    """
+    ttl = settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS
+    if expires_at is not None:
+        ttl = min(ttl, expires_at - time.time())
+    if ttl > 0:
+        principal_cache.set(subject, (expires_at, user), ttl=ttl)
+
+
+def invalidate_principal(subject: str) -> None:
+    """
+    Drop the cached user of `subject`, e.g. after it was updated or deleted.
+    """
+    principal_cache.pop(subject)
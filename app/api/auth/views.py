@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, Request
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.api.auth.deps import get_current_user
@@ -8,12 +8,15 @@ from app.api.auth.schemas import Token
 from app.api.users.deps import get_user_service
 from app.api.users.schemas import User, UserCreate
 from app.api.users.service import UserService
+from app.api.users.utils import upgrade_password_hash_in_background
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/login", response_model=Token)
 async def login_access_token(
+    request: Request,
+    background_tasks: BackgroundTasks,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     user_service: Annotated[UserService, Depends(get_user_service)],
 ):
@@ -23,6 +26,13 @@ async def login_access_token(
     auth_result = await user_service.authenticate(
         email=form_data.username, password=form_data.password
     )
+    if auth_result["password_needs_rehash"]:
+        background_tasks.add_task(
+            upgrade_password_hash_in_background,
+            request.app.state.db_session_factory,
+            auth_result["user"].id,
+            form_data.password,
+        )
     return Token(access_token=auth_result["access_token"], token_type="bearer")
 
 
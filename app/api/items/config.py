@@ -0,0 +1,29 @@
+# Upper bound of items accepted by a single request to the bulk endpoints.
+ITEMS_BULK_MAX_SIZE = 50_000
+
+# Upper bound of items accepted by a single request to the import endpoint.
+ITEMS_IMPORT_MAX_SIZE = 200_000
+
+# Upper bound of values accepted by an `__in` filter of `GET /items`.
+ITEMS_FILTER_IN_MAX_SIZE = 100
+
+# Columns `GET /items` can sort and filter by, each mapped to the index serving it so
+# that list queries stay index-backed. Sorting by id, the default, uses the primary key.
+ITEMS_SORTABLE_COLUMNS = {
+    "name": "ix_item_name_id",
+    "description": "ix_item_description_id",
+    "price": "ix_item_price_id",
+}
+ITEMS_FILTERABLE_COLUMNS = {
+    "name": "ix_item_name_id",
+    "description": "ix_item_description_id",
+    "price": "ix_item_price_id",
+}
+
+# Full-text search of `GET /items/search`. Matches in the name weigh more than in the
+# description when ranking, and each snippet shows up to this many words around the
+# matches, wrapped in the highlight markers.
+ITEMS_SEARCH_NAME_WEIGHT = 10.0
+ITEMS_SEARCH_DESCRIPTION_WEIGHT = 1.0
+ITEMS_SEARCH_SNIPPET_WORDS = 12
+ITEMS_SEARCH_HIGHLIGHT = ("<mark>", "</mark>")
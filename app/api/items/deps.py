@@ -1,20 +1,67 @@
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.items.config import ITEMS_FILTER_IN_MAX_SIZE
 from app.api.items.repository import ItemRepository
+from app.api.items.schemas import Item, ItemFilters
 from app.api.items.service import ItemService
+from app.common.base_repositories.cached_repository import CachedRepository
+from app.common.cache import get_repository_cache
 from app.db.deps import get_db_session
 
 
 def get_item_repository(
     session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> ItemRepository:
-    return ItemRepository(session=session)
+) -> ItemRepository | CachedRepository[Item]:
+    repository = ItemRepository(session=session)
+    cache = get_repository_cache("items")
+    if cache is None:
+        return repository
+    return CachedRepository(repository, cache=cache, schema=Item)
 
 
 def get_item_service(
     item_repository: Annotated[ItemRepository, Depends(get_item_repository)],
 ) -> ItemService:
     return ItemService(item_repository)
+
+
+def get_item_filters(  # noqa: PLR0913
+    name: Annotated[str | None, Query(description="Items with this name")] = None,
+    name__in: Annotated[
+        list[str] | None,
+        Query(
+            max_length=ITEMS_FILTER_IN_MAX_SIZE,
+            description="Items with one of these names, repeat the parameter per name",
+        ),
+    ] = None,
+    name__prefix: Annotated[
+        str | None, Query(min_length=1, description="Items whose name starts with this")
+    ] = None,
+    description: Annotated[
+        str | None, Query(description="Items with this description")
+    ] = None,
+    description__prefix: Annotated[
+        str | None,
+        Query(min_length=1, description="Items whose description starts with this"),
+    ] = None,
+    price: Annotated[float | None, Query(description="Items with this price")] = None,
+    price__gt: Annotated[float | None, Query(description="Price above")] = None,
+    price__gte: Annotated[float | None, Query(description="Price at least")] = None,
+    price__lt: Annotated[float | None, Query(description="Price below")] = None,
+    price__lte: Annotated[float | None, Query(description="Price at most")] = None,
+) -> ItemFilters:
+    return ItemFilters(
+        name=name,
+        name__in=name__in,
+        name__prefix=name__prefix,
+        description=description,
+        description__prefix=description__prefix,
+        price=price,
+        price__gt=price__gt,
+        price__gte=price__gte,
+        price__lt=price__lt,
+        price__lte=price__lte,
+    )
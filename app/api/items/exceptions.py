@@ -1,5 +1,7 @@
 """Exception classes for item-related operations."""
 
+from fastapi import status
+
 from app.common.base_exceptions import (
     APIError,
     ResourceAlreadyExistsError,
@@ -23,6 +25,20 @@ class ItemNotFoundError(ResourceNotFoundError):
         super().__init__(detail=detail)
 
 
+class DuplicateItemIdsError(ItemError):
+    """Raised when a bulk request references the same item more than once."""
+
+    def __init__(self, detail: str = "Duplicate item ids"):
+        """Initialize with 422 status and detail message.
+
+        Args:
+            detail: Explanation of which ids are duplicated
+        """
+        super().__init__(
+            detail=detail, status_code=status.HTTP_422_UNPROCESSABLE_CONTENT
+        )
+
+
 class ItemOperationError(ItemError):
     """Raised when an operation on an item fails."""
 
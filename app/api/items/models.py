@@ -1,5 +1,6 @@
+from sqlalchemy import DDL, Index, event
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.sql.sqltypes import String
+from sqlalchemy.sql.sqltypes import Float, String
 
 from app.db.base import BaseSQLAlchemyModel
 
@@ -8,8 +9,92 @@ class ItemModel(BaseSQLAlchemyModel):
     """User model"""
 
     __tablename__ = "item"
+    # Composite with id, the keyset pagination tie-breaker, so that filtering and
+    # `ORDER BY col, id` seek pages are both served by the index.
+    __table_args__ = (
+        Index("ix_item_name_id", "name", "id"),
+        Index("ix_item_description_id", "description", "id"),
+        Index("ix_item_price_id", "price", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(length=200))
     description: Mapped[str | None] = mapped_column(String(length=200), nullable=True)
-    price: Mapped[float] = mapped_column(String(length=200))
+    price: Mapped[float] = mapped_column(Float)
+
+
+# Full-text index over name and description. On SQLite, an FTS5 table with `item` as
+# external content, so the text is not stored twice, kept in sync by triggers. On
+# Postgres, a GIN index over the document expression the search query uses.
+ITEM_SEARCH_TABLE = "item_fts"
+ITEM_SEARCH_INDEX = "ix_item_search"
+ITEM_SEARCH_POSTGRES_CONFIG = "simple"
+ITEM_SEARCH_POSTGRES_DOCUMENT = "coalesce(name, '') || ' ' || coalesce(description, '')"
+ITEM_SEARCH_DDL = {
+    "sqlite": [
+        f"""
+        CREATE VIRTUAL TABLE {ITEM_SEARCH_TABLE} USING fts5(
+            name, description, content='item', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        """,
+        f"""
+        CREATE TRIGGER {ITEM_SEARCH_TABLE}_ai AFTER INSERT ON item BEGIN
+            INSERT INTO {ITEM_SEARCH_TABLE}(rowid, name, description)
+            VALUES (new.id, new.name, new.description);
+        END
+        """,
+        f"""
+        CREATE TRIGGER {ITEM_SEARCH_TABLE}_ad AFTER DELETE ON item BEGIN
+            INSERT INTO {ITEM_SEARCH_TABLE}({ITEM_SEARCH_TABLE}, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+        END
+        """,
+        f"""
+        CREATE TRIGGER {ITEM_SEARCH_TABLE}_au AFTER UPDATE OF name, description ON item
+        BEGIN
+            INSERT INTO {ITEM_SEARCH_TABLE}({ITEM_SEARCH_TABLE}, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+            INSERT INTO {ITEM_SEARCH_TABLE}(rowid, name, description)
+            VALUES (new.id, new.name, new.description);
+        END
+        """,
+    ],
+    "postgresql": [
+        f"""
+        CREATE INDEX {ITEM_SEARCH_INDEX} ON item USING gin (
+            to_tsvector('{ITEM_SEARCH_POSTGRES_CONFIG}'::regconfig,
+                        {ITEM_SEARCH_POSTGRES_DOCUMENT})
+        )
+        """,
+    ],
+}
+
+for _dialect, _statements in ITEM_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(
+            ItemModel.__table__,
+            "after_create",
+            DDL(_statement).execute_if(dialect=_dialect),
+        )
+# Triggers and indexes go with the table, the FTS5 table has to be dropped by hand.
+event.listen(
+    ItemModel.__table__,
+    "after_drop",
+    DDL(f"DROP TABLE IF EXISTS {ITEM_SEARCH_TABLE}").execute_if(dialect="sqlite"),
+)
+
+# Prefix filters compare in the "C" collation on Postgres, where the indexes above use
+# the database collation. On SQLite, they already compare bytes.
+ITEM_PREFIX_POSTGRES_INDEXES = {
+    "ix_item_name_c_id": "name",
+    "ix_item_description_c_id": "description",
+}
+for _index, _column in ITEM_PREFIX_POSTGRES_INDEXES.items():
+    event.listen(
+        ItemModel.__table__,
+        "after_create",
+        DDL(f'CREATE INDEX {_index} ON item ({_column} COLLATE "C", id)').execute_if(
+            dialect="postgresql"
+        ),
+    )
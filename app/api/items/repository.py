@@ -1,25 +1,125 @@
-from app.api.items.models import ItemModel
+from sqlalchemy import Row, Select, column, func, literal_column, select, table
+
+from app.api.items.config import (
+    ITEMS_FILTERABLE_COLUMNS,
+    ITEMS_SEARCH_DESCRIPTION_WEIGHT,
+    ITEMS_SEARCH_HIGHLIGHT,
+    ITEMS_SEARCH_NAME_WEIGHT,
+    ITEMS_SEARCH_SNIPPET_WORDS,
+    ITEMS_SORTABLE_COLUMNS,
+)
+from app.api.items.models import (
+    ITEM_SEARCH_POSTGRES_CONFIG,
+    ITEM_SEARCH_POSTGRES_DOCUMENT,
+    ITEM_SEARCH_TABLE,
+    ItemModel,
+)
 from app.api.items.schemas import Item
+from app.api.items.utils import fts5_match_query, tsquery
 from app.common.base_repositories.base_db_repository import BaseDBRepository
-from app.common.base_repositories.in_memory_repository import InMemoryRepository
+from app.common.base_repositories.in_memory_repository import (
+    InMemoryRepository,
+    InMemoryStore,
+)
 
 # NOTE: Data defined here instead of __init__. It is because, in each request
 # init is called and it will reset the data.
-item_inmemory_data = [
-    Item(id=1, name="Item 1", description="Description for Item 1", price=10.5),
-    Item(id=2, name="Item 2", price=20.0),
-]
+item_inmemory_store = InMemoryStore(
+    [
+        Item(id=1, name="Item 1", description="Description for Item 1", price=10.5),
+        Item(id=2, name="Item 2", price=20.0),
+    ],
+    indexes=ITEMS_FILTERABLE_COLUMNS,
+    sorted_fields=ITEMS_SORTABLE_COLUMNS,
+)
 
 
 class ItemInMemoryRepository(InMemoryRepository[Item]):
     """Repository for Item data access."""
 
     def __init__(self):
-        super().__init__(initial_data=item_inmemory_data)
+        super().__init__(initial_data=item_inmemory_store)
 
 
 class ItemRepository(BaseDBRepository[ItemModel]):
     """SQLAlchemy Repository for Item data access."""
 
+    sortable_columns = ITEMS_SORTABLE_COLUMNS
+    filterable_columns = ITEMS_FILTERABLE_COLUMNS
+
     def __init__(self, session):
         super().__init__(model=ItemModel, session=session)
+
+    async def search(
+        self, terms: list[str], skip: int = 0, limit: int = 20
+    ) -> list[Row[tuple[ItemModel, str, float]]]:
+        """Full-text search of item names and descriptions, best matches first.
+
+        Args:
+            terms: Words that must all appear, the last one as a prefix.
+            skip: Number of results to skip.
+            limit: Maximum number of results to return.
+
+        Returns:
+            Rows of the matching item, a highlighted snippet of the matched text and
+            a relevance score, higher is better.
+        """
+        if self.session.bind.dialect.name == "postgresql":
+            query = self._postgres_search(terms)
+        else:
+            query = self._sqlite_search(terms)
+        result = await self.session.execute(query.offset(skip).limit(limit))
+        return list(result.all())
+
+    @staticmethod
+    def _sqlite_search(terms: list[str]) -> Select:
+        fts_table = table(ITEM_SEARCH_TABLE, column("rowid"))
+        fts = literal_column(ITEM_SEARCH_TABLE)
+        # bm25 is lower for better matches.
+        score = -func.bm25(
+            fts, ITEMS_SEARCH_NAME_WEIGHT, ITEMS_SEARCH_DESCRIPTION_WEIGHT
+        )
+        snippet = func.snippet(
+            fts, -1, *ITEMS_SEARCH_HIGHLIGHT, "…", ITEMS_SEARCH_SNIPPET_WORDS
+        )
+        return (
+            select(ItemModel, snippet.label("snippet"), score.label("score"))
+            .join_from(ItemModel, fts_table, ItemModel.id == fts_table.c.rowid)
+            .where(fts.op("MATCH")(fts5_match_query(terms)))
+            .order_by(score.desc(), ItemModel.id)
+        )
+
+    @staticmethod
+    def _postgres_search(terms: list[str]) -> Select:
+        config = literal_column(f"'{ITEM_SEARCH_POSTGRES_CONFIG}'::regconfig")
+        document = literal_column(ITEM_SEARCH_POSTGRES_DOCUMENT)
+        query = func.to_tsquery(config, tsquery(terms))
+        # Matching goes through the `ITEM_SEARCH_INDEX` expression index, ranking only
+        # looks at the matches and weighs names, label A, above descriptions, label D.
+        weighted = func.setweight(
+            func.to_tsvector(config, func.coalesce(ItemModel.name, "")), "A"
+        ).op("||")(
+            func.setweight(
+                func.to_tsvector(config, func.coalesce(ItemModel.description, "")),
+                "D",
+            )
+        )
+        weights = literal_column(
+            f"'{{{ITEMS_SEARCH_DESCRIPTION_WEIGHT / ITEMS_SEARCH_NAME_WEIGHT},0,0,1}}'"
+            "::float4[]"
+        )
+        score = func.ts_rank_cd(weights, weighted, query)
+        start, stop = ITEMS_SEARCH_HIGHLIGHT
+        snippet = func.ts_headline(
+            config,
+            document,
+            query,
+            f'StartSel="{start}", StopSel="{stop}", '
+            f"MaxWords={ITEMS_SEARCH_SNIPPET_WORDS}, "
+            f"MinWords={ITEMS_SEARCH_SNIPPET_WORDS // 2}",
+        )
+        return (
+            select(ItemModel, snippet.label("snippet"), score.label("score"))
+            .where(func.to_tsvector(config, document).op("@@")(query))
+            .order_by(score.desc(), ItemModel.id)
+        )
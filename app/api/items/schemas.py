@@ -1,6 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.api.items.config import ITEMS_BULK_MAX_SIZE
 
 
 class ItemBase(BaseModel):
@@ -17,6 +19,29 @@ class ItemUpdate(ItemBase):
     pass
 
 
+class ItemBulkUpdate(ItemUpdate):
+    id: int
+
+
+class ItemBulkDelete(BaseModel):
+    ids: list[int] = Field(max_length=ITEMS_BULK_MAX_SIZE)
+
+
+class ItemFilters(BaseModel):
+    """Filters of `GET /items`, all of them must match."""
+
+    name: Optional[str] = None
+    name__in: Optional[list[str]] = None
+    name__prefix: Optional[str] = None
+    description: Optional[str] = None
+    description__prefix: Optional[str] = None
+    price: Optional[float] = None
+    price__gt: Optional[float] = None
+    price__gte: Optional[float] = None
+    price__lt: Optional[float] = None
+    price__lte: Optional[float] = None
+
+
 class ItemInMemoryDB(ItemBase):
     id: int
 
@@ -25,3 +50,8 @@ class ItemInMemoryDB(ItemBase):
 
 class Item(ItemInMemoryDB):
     pass
+
+
+class ItemSearchResult(Item):
+    snippet: str
+    score: float
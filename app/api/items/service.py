@@ -1,8 +1,17 @@
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from typing import List, Optional, Tuple
 
-from app.api.items.exceptions import ItemNotFoundError
+from app.api.items.exceptions import DuplicateItemIdsError, ItemNotFoundError
 from app.api.items.repository import ItemRepository
-from app.api.items.schemas import Item, ItemCreate, ItemUpdate
+from app.api.items.schemas import (
+    Item,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemFilters,
+    ItemSearchResult,
+    ItemUpdate,
+)
+from app.api.items.utils import search_terms
 
 
 class ItemService:
@@ -20,34 +29,86 @@ class ItemService:
         self,
         skip: int = 0,
         limit: int = 100,
-        name: Optional[str] = None,
-        description: Optional[str] = None,
+        filters: Optional[ItemFilters] = None,
         sort_by: Optional[str] = None,
         order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
     ) -> List[Item]:
         """Retrieves a list of items with optional filtering and sorting.
 
         Args:
             skip: Number of items to skip (pagination).
             limit: Maximum number of items to return (pagination).
-            name: Optional filter by item name.
-            description: Optional filter by item description.
-            sort_by: Optional field to sort results by.
+            filters: Optional filters, all of them must match.
+            sort_by: Optional comma separated columns to sort results by, a leading
+                `-` sorts a column in the opposite `order`.
             order: Sort order, either "asc" or "desc".
+            cursor: Optional keyset pagination cursor, replaces `skip` when given.
 
         Returns:
             A list of item objects matching the criteria.
-        """
-        filters: Dict[str, Any] = {}
-        if name:
-            filters["name"] = name
-        if description:
-            filters["description"] = description
 
+        Raises:
+            InvalidQueryError: If `sort_by` names a column that is not indexed for
+                sorting.
+        """
         return await self.item_repository.get_all(
-            skip=skip, limit=limit, filters=filters, sort_by=sort_by, order=order
+            skip=skip,
+            limit=limit,
+            filters=filters.model_dump(exclude_none=True) if filters else None,
+            sort_by=sort_by,
+            order=order,
+            cursor=cursor,
+        )
+
+    async def get_items_with_total(  # noqa: PLR0913
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ItemFilters] = None,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Item], int]:
+        """Retrieves a list of items, as `get_items`, and the total matching `filters`.
+
+        Returns:
+            The items and the number of items matching `filters`, whatever the page.
+        """
+        return await self.item_repository.get_all_with_total(
+            skip=skip,
+            limit=limit,
+            filters=filters.model_dump(exclude_none=True) if filters else None,
+            sort_by=sort_by,
+            order=order,
+            cursor=cursor,
         )
 
+    async def search_items(
+        self, query: str, skip: int = 0, limit: int = 20
+    ) -> List[ItemSearchResult]:
+        """Full-text searches item names and descriptions.
+
+        Args:
+            query: Words that must all appear in the name or description, the last
+                one matching as a prefix.
+            skip: Number of results to skip (pagination).
+            limit: Maximum number of results to return (pagination).
+
+        Returns:
+            The matching items, best matches first, each with a highlighted snippet.
+        """
+        terms = search_terms(query)
+        if not terms:
+            return []
+        rows = await self.item_repository.search(terms, skip=skip, limit=limit)
+        return [
+            ItemSearchResult(
+                **Item.model_validate(item).model_dump(), snippet=snippet, score=score
+            )
+            for item, snippet, score in rows
+        ]
+
     async def get_item(self, item_id: int) -> Item:
         """Retrieves an item by its ID.
 
@@ -111,3 +172,85 @@ class ItemService:
         if not success:
             raise ItemNotFoundError(f"Item with id {item_id} not found")
         return success
+
+    async def create_items(self, items_in: List[ItemCreate]) -> List[Item]:
+        """Creates several items at once.
+
+        Args:
+            items_in: The data for the new items.
+
+        Returns:
+            The newly created item objects, in the same order as `items_in`.
+        """
+        return await self.item_repository.create_many(items_in)
+
+    async def import_items(self, items_in: List[ItemCreate]) -> int:
+        """Imports several items without returning them.
+
+        Uses `COPY ... FROM STDIN` on Postgres, the fastest way to load many rows.
+
+        Args:
+            items_in: The data for the new items.
+
+        Returns:
+            The number of imported items.
+        """
+        return await self.item_repository.import_many(items_in)
+
+    async def _check_items_exist(self, item_ids: List[int]) -> None:
+        existing_ids = await self.item_repository.get_existing_ids(item_ids)
+        missing_ids = set(item_ids) - existing_ids
+        if missing_ids:
+            raise ItemNotFoundError(f"Items with ids {sorted(missing_ids)} not found")
+
+    async def update_items(self, items_in: List[ItemBulkUpdate]) -> List[Item]:
+        """Updates several existing items at once.
+
+        Args:
+            items_in: The data to update the items with, each carrying its item ID.
+
+        Returns:
+            The updated item objects.
+
+        Raises:
+            DuplicateItemIdsError: If an ID is given more than once.
+            ItemNotFoundError: If any of the given IDs is not found. IDs are checked
+                before writing, so no item is updated in that case.
+        """
+        counts = Counter(item_in.id for item_in in items_in)
+        duplicate_ids = sorted(id for id, count in counts.items() if count > 1)
+        if duplicate_ids:
+            raise DuplicateItemIdsError(
+                f"Items with ids {duplicate_ids} are given more than once"
+            )
+        await self._check_items_exist(list(counts))
+
+        updates = {item_in.id: item_in for item_in in items_in}
+        updated_items = await self.item_repository.update_many(updates)
+        # An item deleted since the check is reported too, on a database the request
+        # transaction is then rolled back.
+        missing_ids = updates.keys() - {item.id for item in updated_items}
+        if missing_ids:
+            raise ItemNotFoundError(f"Items with ids {sorted(missing_ids)} not found")
+        return updated_items
+
+    async def delete_items(self, item_ids: List[int]) -> List[int]:
+        """Deletes several items at once.
+
+        Args:
+            item_ids: The IDs of the items to delete.
+
+        Returns:
+            The IDs of the deleted items.
+
+        Raises:
+            ItemNotFoundError: If any of the given IDs is not found. IDs are checked
+                before writing, so no item is deleted in that case.
+        """
+        await self._check_items_exist(item_ids)
+
+        deleted_ids = await self.item_repository.delete_many(item_ids)
+        missing_ids = set(item_ids) - set(deleted_ids)
+        if missing_ids:
+            raise ItemNotFoundError(f"Items with ids {sorted(missing_ids)} not found")
+        return deleted_ids
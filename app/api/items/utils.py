@@ -0,0 +1,21 @@
+def search_terms(query: str) -> list[str]:
+    """Split a search query into the words to look for, ignoring bare punctuation."""
+    return [term for term in query.split() if any(char.isalnum() for char in term)]
+
+
+def fts5_match_query(terms: list[str]) -> str:
+    """Build an FTS5 `MATCH` expression requiring every term.
+
+    Terms are quoted so that user input can not use the FTS5 query syntax, and the
+    last one matches as a prefix, for search-as-you-type.
+    """
+    quoted = ['"{}"'.format(term.replace('"', '""')) for term in terms]
+    return " ".join(quoted) + "*"
+
+
+def tsquery(terms: list[str]) -> str:
+    """Build the Postgres `to_tsquery` counterpart of `fts5_match_query`."""
+    quoted = [
+        "'{}'".format(term.replace("\\", "\\\\").replace("'", "''")) for term in terms
+    ]
+    return " & ".join(quoted) + ":*"
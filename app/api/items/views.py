@@ -1,36 +1,130 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Body, Depends, Query, Response
 
-from app.api.items.deps import get_item_service
-from app.api.items.schemas import Item, ItemCreate, ItemUpdate
+from app.api.items.config import (
+    ITEMS_BULK_MAX_SIZE,
+    ITEMS_IMPORT_MAX_SIZE,
+    ITEMS_SORTABLE_COLUMNS,
+)
+from app.api.items.deps import get_item_filters, get_item_service
+from app.api.items.schemas import (
+    Item,
+    ItemBulkDelete,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemFilters,
+    ItemSearchResult,
+    ItemUpdate,
+)
 from app.api.items.service import ItemService
+from app.common.pagination import next_cursor
 
 router = APIRouter(prefix="/items", tags=["items"])
 
 
 @router.get("/")
 async def get_items(  # noqa: PLR0913
+    response: Response,
     item_service: Annotated[ItemService, Depends(get_item_service)],
+    filters: Annotated[ItemFilters, Depends(get_item_filters)],
     skip: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
     limit: Annotated[
         int, Query(ge=1, le=100, description="Number of items to return")
     ] = 100,
-    name: Annotated[str | None, Query(description="Filter items by name")] = None,
-    description: Annotated[
-        str | None, Query(description="Filter items by description")
+    sort_by: Annotated[
+        str | None,
+        Query(
+            description="Comma separated fields to sort by, a leading `-` sorts a "
+            f"field the other way. One of: id, {', '.join(ITEMS_SORTABLE_COLUMNS)}",
+            examples=["name,-price"],
+        ),
     ] = None,
-    sort_by: Annotated[str | None, Query(description="Field to sort by")] = None,
     order: Annotated[str | None, Query(description="Sort order (asc or desc)")] = "asc",
+    cursor: Annotated[
+        str | None,
+        Query(
+            description="Keyset pagination cursor from the `X-Next-Cursor` header of "
+            "the previous page. Replaces `skip` when given."
+        ),
+    ] = None,
+    include_total: Annotated[
+        bool,
+        Query(
+            description="Return the number of items matching the filters in the "
+            "`X-Total-Count` header"
+        ),
+    ] = False,
+) -> list[Item]:
+    query = {
+        "skip": skip,
+        "limit": limit,
+        "filters": filters,
+        "sort_by": sort_by,
+        "order": order,
+        "cursor": cursor,
+    }
+    if include_total:
+        items, total = await item_service.get_items_with_total(**query)
+        response.headers["X-Total-Count"] = str(total)
+    else:
+        items = await item_service.get_items(**query)
+    if token := next_cursor(items, limit=limit, sort_by=sort_by, order=order):
+        response.headers["X-Next-Cursor"] = token
+    return items
+
+
+@router.post("/bulk")
+async def create_items(
+    items_in: Annotated[list[ItemCreate], Body(max_length=ITEMS_BULK_MAX_SIZE)],
+    item_service: Annotated[ItemService, Depends(get_item_service)],
 ) -> list[Item]:
-    return await item_service.get_items(
-        skip=skip,
-        limit=limit,
-        name=name,
-        description=description,
-        sort_by=sort_by,
-        order=order,
-    )
+    return await item_service.create_items(items_in)
+
+
+@router.post("/import")
+async def import_items(
+    items_in: Annotated[list[ItemCreate], Body(max_length=ITEMS_IMPORT_MAX_SIZE)],
+    item_service: Annotated[ItemService, Depends(get_item_service)],
+) -> dict:
+    imported = await item_service.import_items(items_in)
+    return {"message": f"{imported} items imported successfully"}
+
+
+@router.put("/bulk")
+async def update_items(
+    items_in: Annotated[list[ItemBulkUpdate], Body(max_length=ITEMS_BULK_MAX_SIZE)],
+    item_service: Annotated[ItemService, Depends(get_item_service)],
+) -> list[Item]:
+    return await item_service.update_items(items_in)
+
+
+@router.delete("/bulk")
+async def delete_items(
+    items_in: ItemBulkDelete,
+    item_service: Annotated[ItemService, Depends(get_item_service)],
+) -> dict:
+    deleted_ids = await item_service.delete_items(items_in.ids)
+    return {"message": f"{len(deleted_ids)} items deleted successfully"}
+
+
+@router.get("/search")
+async def search_items(
+    q: Annotated[
+        str,
+        Query(
+            min_length=1,
+            max_length=200,
+            description="Words to look for in item names and descriptions",
+        ),
+    ],
+    item_service: Annotated[ItemService, Depends(get_item_service)],
+    skip: Annotated[int, Query(ge=0, description="Number of results to skip")] = 0,
+    limit: Annotated[
+        int, Query(ge=1, le=100, description="Number of results to return")
+    ] = 20,
+) -> list[ItemSearchResult]:
+    return await item_service.search_items(q, skip=skip, limit=limit)
 
 
 @router.get("/{item_id}")
@@ -4,6 +4,9 @@ from typing import AsyncGenerator
 from api_shared.hatchet_client import ensure_hatchet_connection
 from fastapi import FastAPI
 
+from app.api.tasks.config import TASKS, TASKS_EVENTS_LOG_POLL_SECONDS
+from app.core.hatchet import ExternalRunner
+from app.core.task_events import TaskEventHub
 from app.core.telemetry import setup_opentelemetry, setup_prometheus, stop_opentelemetry
 from app.db.utils import setup_db
 
@@ -17,6 +20,10 @@ async def lifespan_setup(
     app.middleware_stack = None
 
     await ensure_hatchet_connection()
+    app.state.task_runner = ExternalRunner(tasks=TASKS)
+    app.state.task_events = TaskEventHub(
+        app.state.task_runner, log_poll_interval=TASKS_EVENTS_LOG_POLL_SECONDS
+    )
 
     setup_db(app)
     setup_opentelemetry(app)
@@ -26,4 +33,6 @@ async def lifespan_setup(
     yield
 
     await app.state.db_engine.dispose()
+    if app.state.db_read_engine is not None:
+        await app.state.db_read_engine.dispose()
     stop_opentelemetry(app)
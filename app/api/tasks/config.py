@@ -0,0 +1,58 @@
+from api_shared.tasks.general import (
+    FAILING_PROCESS_TASK,
+    LONG_RUNNING_PROCESS_TASK,
+    PYDANTIC_PARSE_CHECK_TASK,
+    FailingProcessInput,
+    LongRunningProcessInput,
+    LongRunningProcessResult,
+    PydanticParseInput,
+    PydanticParseResult,
+)
+from api_shared.tasks.ml import (
+    ML_INFERENCE_TASK,
+    TRAIN_MODEL_TASK,
+    MLInferenceInput,
+    MLInferenceResult,
+    MLTrainingInput,
+    MLTrainingResult,
+)
+
+from app.core.hatchet import TaskDefinition
+
+# Tasks the API can trigger, their stubs are built once by the application runner.
+TASKS = (
+    TaskDefinition(
+        name=LONG_RUNNING_PROCESS_TASK,
+        input_validator=LongRunningProcessInput,
+        output_validator=LongRunningProcessResult,
+    ),
+    TaskDefinition(name=FAILING_PROCESS_TASK, input_validator=FailingProcessInput),
+    TaskDefinition(
+        name=PYDANTIC_PARSE_CHECK_TASK,
+        input_validator=PydanticParseInput,
+        output_validator=PydanticParseResult,
+    ),
+    TaskDefinition(
+        name=ML_INFERENCE_TASK,
+        input_validator=MLInferenceInput,
+        output_validator=MLInferenceResult,
+    ),
+    TaskDefinition(
+        name=TRAIN_MODEL_TASK,
+        input_validator=MLTrainingInput,
+        output_validator=MLTrainingResult,
+    ),
+)
+
+# Upper bound of inputs accepted by a single request to the bulk endpoints, and the
+# number of runs enqueued per call to Hatchet.
+TASKS_BULK_MAX_SIZE = 10_000
+TASKS_BULK_CHUNK_SIZE = 500
+
+# Seconds between two reads of the log lines of a watched run, and between two
+# keep-alive comments of `GET /tasks/{task_id}/events`.
+TASKS_EVENTS_LOG_POLL_SECONDS = 1.0
+TASKS_EVENTS_PING_SECONDS = 15.0
+
+# Upper bound of the `wait` parameter of the task result endpoints, in seconds.
+TASKS_RESULT_WAIT_MAX_SECONDS = 60.0
@@ -1,5 +1,14 @@
+from fastapi import Request
+
 from app.core.hatchet import ExternalRunner
+from app.core.task_events import TaskEventHub
+
+
+def get_runner(request: Request) -> ExternalRunner:
+    """Return the application-wide runner created on startup."""
+    return request.app.state.task_runner
 
 
-def get_runner() -> ExternalRunner:
-    return ExternalRunner()
+def get_task_events(request: Request) -> TaskEventHub:
+    """Return the application-wide hub of task run events created on startup."""
+    return request.app.state.task_events
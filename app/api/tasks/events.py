@@ -0,0 +1,45 @@
+"""Server-Sent Events stream of task runs."""
+
+import asyncio
+import json
+from typing import Annotated, AsyncIterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from app.api.tasks.config import TASKS_EVENTS_PING_SECONDS
+from app.api.tasks.deps import get_task_events
+from app.core.task_events import TaskEventHub
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+
+async def _event_stream(hub: TaskEventHub, task_id: str) -> AsyncIterator[str]:
+    async with hub.subscribe(task_id) as queue:
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=TASKS_EVENTS_PING_SECONDS
+                )
+            except TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if event is None:
+                return
+            yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
+
+
+@router.get("/{task_id}/events", response_class=StreamingResponse)
+async def stream_task_events(
+    task_id: str,
+    hub: Annotated[TaskEventHub, Depends(get_task_events)],
+) -> StreamingResponse:
+    """Stream status changes, log lines and the result of a task run.
+
+    Every client watching the same run shares one subscription to Hatchet.
+    """
+    return StreamingResponse(
+        _event_stream(hub, task_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
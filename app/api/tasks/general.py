@@ -1,6 +1,6 @@
 """General Hatchet task endpoints."""
 
-from typing import Annotated
+from typing import Annotated, Any
 
 from api_shared.tasks.general import (
     FAILING_PROCESS_TASK,
@@ -12,61 +12,120 @@ from api_shared.tasks.general import (
     PydanticParseInput,
     PydanticParseResult,
 )
-from fastapi import APIRouter, Depends, HTTPException
-from hatchet_sdk.clients.rest.models.v1_workflow_run import V1WorkflowRun
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from hatchet_sdk.clients.rest.models.v1_workflow_run_details import (
     V1WorkflowRunDetails,
 )
 
-from app.api.tasks.deps import get_runner
-from app.core.hatchet import ExternalRunner
+from app.api.tasks.config import (
+    TASKS_BULK_CHUNK_SIZE,
+    TASKS_BULK_MAX_SIZE,
+    TASKS_RESULT_WAIT_MAX_SECONDS,
+)
+from app.api.tasks.deps import get_runner, get_task_events
+from app.core.hatchet import ExternalRunner, TaskBulkSubmission, TaskSubmission
+from app.core.task_events import TaskEventHub, TaskResult
 
 router = APIRouter(prefix="/tasks/general", tags=["tasks"])
 
+# Outputs are parsed by the output model of their task, runs of tasks without one
+# keep their raw output.
+GeneralTaskResult = TaskResult[
+    LongRunningProcessResult | PydanticParseResult | dict[str, Any]
+]
+
 
-@router.post("/long-running", response_model=V1WorkflowRun)
+@router.post("/long-running", response_model=TaskSubmission)
 async def trigger_task(
     params: LongRunningProcessInput,
     runner: Annotated[ExternalRunner, Depends(get_runner)],
-) -> V1WorkflowRun:
+) -> TaskSubmission:
     return await runner.trigger_task(
         name=LONG_RUNNING_PROCESS_TASK,
         input=params,
-        input_validator=LongRunningProcessInput,
-        output_validator=LongRunningProcessResult,
     )
 
 
-@router.post("/fail", response_model=V1WorkflowRun)
+@router.post("/long-running/bulk", response_model=TaskBulkSubmission)
+async def trigger_tasks(
+    params: Annotated[
+        list[LongRunningProcessInput], Body(max_length=TASKS_BULK_MAX_SIZE)
+    ],
+    runner: Annotated[ExternalRunner, Depends(get_runner)],
+) -> TaskBulkSubmission:
+    return await runner.trigger_tasks(
+        name=LONG_RUNNING_PROCESS_TASK,
+        inputs=params,
+        chunk_size=TASKS_BULK_CHUNK_SIZE,
+    )
+
+
+@router.post("/fail", response_model=TaskSubmission)
 async def trigger_failing_task(
     params: FailingProcessInput,
     runner: Annotated[ExternalRunner, Depends(get_runner)],
-) -> V1WorkflowRun:
+) -> TaskSubmission:
     return await runner.trigger_task(
         name=FAILING_PROCESS_TASK,
         input=params,
-        input_validator=FailingProcessInput,
     )
 
 
-@router.post("/pydantic", response_model=V1WorkflowRun)
+@router.post("/fail/bulk", response_model=TaskBulkSubmission)
+async def trigger_failing_tasks(
+    params: Annotated[list[FailingProcessInput], Body(max_length=TASKS_BULK_MAX_SIZE)],
+    runner: Annotated[ExternalRunner, Depends(get_runner)],
+) -> TaskBulkSubmission:
+    return await runner.trigger_tasks(
+        name=FAILING_PROCESS_TASK,
+        inputs=params,
+        chunk_size=TASKS_BULK_CHUNK_SIZE,
+    )
+
+
+@router.post("/pydantic", response_model=TaskSubmission)
 async def trigger_pydantic_parse(
     params: PydanticParseInput,
     runner: Annotated[ExternalRunner, Depends(get_runner)],
-) -> V1WorkflowRun:
+) -> TaskSubmission:
     return await runner.trigger_task(
         name=PYDANTIC_PARSE_CHECK_TASK,
         input=params,
-        input_validator=PydanticParseInput,
-        output_validator=PydanticParseResult,
     )
 
 
-@router.get("/{task_id}", response_model=V1WorkflowRunDetails)
+@router.post("/pydantic/bulk", response_model=TaskBulkSubmission)
+async def trigger_pydantic_parses(
+    params: Annotated[list[PydanticParseInput], Body(max_length=TASKS_BULK_MAX_SIZE)],
+    runner: Annotated[ExternalRunner, Depends(get_runner)],
+) -> TaskBulkSubmission:
+    return await runner.trigger_tasks(
+        name=PYDANTIC_PARSE_CHECK_TASK,
+        inputs=params,
+        chunk_size=TASKS_BULK_CHUNK_SIZE,
+    )
+
+
+@router.get("/{task_id}", response_model=V1WorkflowRunDetails | GeneralTaskResult)
 async def get_task_result(
     task_id: str,
     runner: Annotated[ExternalRunner, Depends(get_runner)],
-) -> V1WorkflowRunDetails:
+    hub: Annotated[TaskEventHub, Depends(get_task_events)],
+    wait: Annotated[
+        float | None,
+        Query(
+            gt=0,
+            le=TASKS_RESULT_WAIT_MAX_SECONDS,
+            description="Seconds to wait for the run to be over, returns its result",
+        ),
+    ] = None,
+) -> V1WorkflowRunDetails | GeneralTaskResult:
+    if wait is not None:
+        result = await hub.wait(task_id, seconds=wait)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        return result
+
     try:
         return await runner.get_task(task_id)
     except Exception as exc:
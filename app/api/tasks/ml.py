@@ -1,6 +1,6 @@
 """ML Hatchet task endpoints."""
 
-from typing import Annotated
+from typing import Annotated, Any
 
 from api_shared.tasks.ml import (
     ML_INFERENCE_TASK,
@@ -10,49 +10,93 @@ from api_shared.tasks.ml import (
     MLTrainingInput,
     MLTrainingResult,
 )
-from fastapi import APIRouter, Depends, HTTPException
-from hatchet_sdk.clients.rest.models.v1_workflow_run import V1WorkflowRun
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from hatchet_sdk.clients.rest.models.v1_workflow_run_details import (
     V1WorkflowRunDetails,
 )
 
-from app.api.tasks.deps import get_runner
-from app.core.hatchet import ExternalRunner
+from app.api.tasks.config import (
+    TASKS_BULK_CHUNK_SIZE,
+    TASKS_BULK_MAX_SIZE,
+    TASKS_RESULT_WAIT_MAX_SECONDS,
+)
+from app.api.tasks.deps import get_runner, get_task_events
+from app.core.hatchet import ExternalRunner, TaskBulkSubmission, TaskSubmission
+from app.core.task_events import TaskEventHub, TaskResult
 
 router = APIRouter(prefix="/tasks/ml", tags=["ml-tasks"])
 
+# Outputs are parsed by the output model of their task, runs of tasks without one
+# keep their raw output.
+MLTaskResult = TaskResult[MLInferenceResult | MLTrainingResult | dict[str, Any]]
+
 
-@router.post("/inference", response_model=V1WorkflowRun)
+@router.post("/inference", response_model=TaskSubmission)
 async def trigger_ml_inference(
     params: MLInferenceInput,
     runner: Annotated[ExternalRunner, Depends(get_runner)],
-) -> V1WorkflowRun:
+) -> TaskSubmission:
     return await runner.trigger_task(
         name=ML_INFERENCE_TASK,
         input=params,
-        input_validator=MLInferenceInput,
-        output_validator=MLInferenceResult,
     )
 
 
-@router.post("/training", response_model=V1WorkflowRun)
+@router.post("/inference/bulk", response_model=TaskBulkSubmission)
+async def trigger_ml_inferences(
+    params: Annotated[list[MLInferenceInput], Body(max_length=TASKS_BULK_MAX_SIZE)],
+    runner: Annotated[ExternalRunner, Depends(get_runner)],
+) -> TaskBulkSubmission:
+    return await runner.trigger_tasks(
+        name=ML_INFERENCE_TASK,
+        inputs=params,
+        chunk_size=TASKS_BULK_CHUNK_SIZE,
+    )
+
+
+@router.post("/training", response_model=TaskSubmission)
 async def trigger_ml_training(
     params: MLTrainingInput,
     runner: Annotated[ExternalRunner, Depends(get_runner)],
-) -> V1WorkflowRun:
+) -> TaskSubmission:
     return await runner.trigger_task(
         name=TRAIN_MODEL_TASK,
         input=params,
-        input_validator=MLTrainingInput,
-        output_validator=MLTrainingResult,
     )
 
 
-@router.get("/{task_id}", response_model=V1WorkflowRunDetails)
+@router.post("/training/bulk", response_model=TaskBulkSubmission)
+async def trigger_ml_trainings(
+    params: Annotated[list[MLTrainingInput], Body(max_length=TASKS_BULK_MAX_SIZE)],
+    runner: Annotated[ExternalRunner, Depends(get_runner)],
+) -> TaskBulkSubmission:
+    return await runner.trigger_tasks(
+        name=TRAIN_MODEL_TASK,
+        inputs=params,
+        chunk_size=TASKS_BULK_CHUNK_SIZE,
+    )
+
+
+@router.get("/{task_id}", response_model=V1WorkflowRunDetails | MLTaskResult)
 async def get_ml_task_result(
     task_id: str,
     runner: Annotated[ExternalRunner, Depends(get_runner)],
-) -> V1WorkflowRunDetails:
+    hub: Annotated[TaskEventHub, Depends(get_task_events)],
+    wait: Annotated[
+        float | None,
+        Query(
+            gt=0,
+            le=TASKS_RESULT_WAIT_MAX_SECONDS,
+            description="Seconds to wait for the run to be over, returns its result",
+        ),
+    ] = None,
+) -> V1WorkflowRunDetails | MLTaskResult:
+    if wait is not None:
+        result = await hub.wait(task_id, seconds=wait)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        return result
+
     try:
         return await runner.get_task(task_id)
     except Exception as exc:
@@ -4,14 +4,21 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.users.repository import UserRepository
+from app.api.users.schemas import User
 from app.api.users.service import UserService
+from app.common.base_repositories.cached_repository import CachedRepository
+from app.common.cache import get_repository_cache
 from app.db.deps import get_db_session
 
 
 def get_user_repository(
     session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> UserRepository:
-    return UserRepository(session=session)
+) -> UserRepository | CachedRepository[User]:
+    repository = UserRepository(session=session)
+    cache = get_repository_cache("users")
+    if cache is None:
+        return repository
+    return CachedRepository(repository, cache=cache, schema=User)
 
 
 def get_user_service(
@@ -1,43 +1,54 @@
+from functools import cache
+
 from sqlalchemy import select
 
+from app.api.auth.service import password_hash_service
 from app.api.auth.utils import get_password_hash
 from app.api.users.models import UserModel
 from app.api.users.schemas import UserCreate, UserInMemoryDB
 from app.common.base_repositories.base_db_repository import BaseDBRepository
-from app.common.base_repositories.in_memory_repository import InMemoryRepository
+from app.common.base_repositories.in_memory_repository import (
+    InMemoryRepository,
+    InMemoryStore,
+)
 
-# NOTE: Data defined here instead of __init__. It is because, in each request
-# init is called and it will reset the data.
-user_inmemory_data = [
-    UserInMemoryDB(
-        id=1,
-        name="John Doe",
-        email="john@example.com",
-        hashed_password=get_password_hash("password"),
-    ),
-    UserInMemoryDB(
-        id=2,
-        name="Jane Doe",
-        email="jane@example.com",
-        hashed_password=get_password_hash("password"),
-    ),
-    UserInMemoryDB(
-        id=3,
-        name="admin",
-        email="admin@mail.com",
-        hashed_password=get_password_hash("admin"),
-    ),
+# Plain passwords of the seeded users. Hashes are built on first use, so that importing
+# this module (every worker start) does not pay for Argon2.
+_USER_SEEDS = [
+    (1, "John Doe", "john@example.com", "password"),
+    (2, "Jane Doe", "jane@example.com", "password"),
+    (3, "admin", "admin@mail.com", "admin"),
 ]
 
 
+# NOTE: Data is cached instead of built in __init__. It is because, in each request
+# init is called and it will reset the data.
+@cache
+def get_user_inmemory_data() -> list[UserInMemoryDB]:
+    """Build the seeded in-memory users, hashing the password of each of them."""
+    return [
+        UserInMemoryDB(
+            id=id, name=name, email=email, hashed_password=get_password_hash(password)
+        )
+        for id, name, email, password in _USER_SEEDS
+    ]
+
+
+@cache
+def get_user_inmemory_store() -> InMemoryStore[UserInMemoryDB]:
+    """Store of the seeded in-memory users, indexed by email."""
+    return InMemoryStore(get_user_inmemory_data(), indexes=["email"])
+
+
 class UserInMemoryRepository(InMemoryRepository[UserInMemoryDB]):
     """InMemory Repository for User data access."""
 
     def __init__(self):
-        super().__init__(initial_data=user_inmemory_data)
+        super().__init__(initial_data=get_user_inmemory_store())
 
     async def get_by_email(self, email: str) -> UserInMemoryDB | None:
-        return next((user for user in self._data if user.email == email), None)
+        users = await self.get_all(filters={"email": email}, limit=1)
+        return users[0] if users else None
 
 
 class UserRepository(BaseDBRepository[UserModel]):
@@ -55,7 +66,7 @@ class UserRepository(BaseDBRepository[UserModel]):
     async def create(self, obj_in: UserCreate) -> UserModel:
         """Create a new user with password hashing"""
         user_data = obj_in.model_dump(exclude={"password"})
-        user_data["hashed_password"] = get_password_hash(obj_in.password)
+        user_data["hashed_password"] = await password_hash_service.hash(obj_in.password)
         db_obj = self.model(**user_data)
 
         self.session.add(db_obj)
@@ -1,7 +1,12 @@
 from datetime import timedelta
-from typing import List
+from typing import List, Tuple
 
-from app.api.auth.utils import create_access_token, get_password_hash, verify_password
+from app.api.auth.service import password_hash_service
+from app.api.auth.utils import (
+    create_access_token,
+    invalidate_principal,
+    password_needs_rehash,
+)
 from app.api.users.exceptions import (
     AuthenticationError,
     UserAlreadyExistsError,
@@ -23,6 +28,19 @@ class UserService:
         """
         self.user_repository = user_repository
 
+    async def _invalidate_principal(self, user_id: int) -> None:
+        """Drop the cached principal now, and again once the write is committed.
+
+        A concurrent authenticated request may cache the old principal until then.
+        """
+        subject = str(user_id)
+        invalidate_principal(subject)
+
+        async def invalidate_committed() -> None:
+            invalidate_principal(subject)
+
+        await self.user_repository.on_commit(invalidate_committed)
+
     async def get_user(self, user_id: int) -> User:
         """Retrieves a user by their ID.
 
@@ -40,13 +58,31 @@ class UserService:
             raise UserNotFoundError(f"User with id {user_id} not found")
         return user
 
-    async def get_users(self) -> List[User]:
-        """Retrieves all users.
+    async def get_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+        """Retrieves a page of users.
+
+        Args:
+            skip: Number of users to skip (pagination).
+            limit: Maximum number of users to return (pagination).
+
+        Returns:
+            A list of user objects.
+        """
+        return await self.user_repository.get_all(skip=skip, limit=limit)
+
+    async def get_users_with_total(
+        self, skip: int = 0, limit: int = 100
+    ) -> Tuple[List[User], int]:
+        """Retrieves a page of users and the total number of users.
+
+        Args:
+            skip: Number of users to skip (pagination).
+            limit: Maximum number of users to return (pagination).
 
         Returns:
-            A list of all user objects.
+            The user objects and the total number of users.
         """
-        return await self.user_repository.get_all()
+        return await self.user_repository.get_all_with_total(skip=skip, limit=limit)
 
     async def create_user(self, user_in: UserCreate) -> User:
         """Creates a new user.
@@ -81,14 +117,11 @@ class UserService:
         Raises:
             UserNotFoundError: If the user with the given ID is not found.
             UserAlreadyExistsError: If the email is being changed to one that already exists.
+            ServiceUnavailableError: If the password hashing pool is saturated.
         """
-        existing_user = await self.user_repository.get_by_id(user_id)
-        if not existing_user:
-            raise UserNotFoundError(f"User with id {user_id} not found")
-
         update_data = user_in.model_dump(exclude_unset=True)
 
-        if "email" in update_data and update_data["email"] != existing_user.email:
+        if "email" in update_data:
             conflicting_user = await self.user_repository.get_by_email(
                 update_data["email"]
             )
@@ -97,19 +130,23 @@ class UserService:
                     f"A user with email {update_data['email']} already exists"
                 )
 
-        # Hash password if it's being updated
+        # Hash password if it's being updated. Hashing is expensive, so a missing
+        # user is found with a cheap existence check first.
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data["password"])
+            if not await self.user_repository.get_existing_ids([user_id]):
+                raise UserNotFoundError(f"User with id {user_id} not found")
+            update_data["hashed_password"] = await password_hash_service.hash(
+                update_data["password"]
+            )
             del update_data["password"]
         elif "hashed_password" in update_data:
             del update_data["hashed_password"]
 
+        # Existence is checked by the update statement itself, no pre-read needed.
         updated_user = await self.user_repository.update(id=user_id, obj_in=update_data)
+        await self._invalidate_principal(user_id)
         if updated_user is None:
-            # Should ideally not happen due to the initial check, but handles race conditions/DB issues
-            raise UserNotFoundError(
-                f"User with id {user_id} could not be updated or found after update attempt."
-            )
+            raise UserNotFoundError(f"User with id {user_id} not found")
         return updated_user
 
     async def delete_user(self, user_id: int) -> bool:
@@ -123,15 +160,11 @@ class UserService:
 
         Raises:
             UserNotFoundError: If the user with the given ID is not found.
-            Exception: If the deletion fails unexpectedly after the user was found.
         """
-        user_to_delete = await self.user_repository.get_by_id(user_id)
-        if not user_to_delete:
-            raise UserNotFoundError(f"User with id {user_id} not found")
-
         success = await self.user_repository.delete(user_id)
+        await self._invalidate_principal(user_id)
         if not success:
-            raise Exception(f"Failed to delete user with id {user_id}")
+            raise UserNotFoundError(f"User with id {user_id} not found")
         return success
 
     async def get_by_email(self, email: str) -> User:
@@ -160,13 +193,17 @@ class UserService:
             password: The user's password.
 
         Returns:
-            A dictionary containing the access token, token type, and user object.
+            A dictionary containing the access token, token type, user object and
+            whether the stored password hash uses outdated hashing parameters.
 
         Raises:
             AuthenticationError: If the email/password combination is incorrect.
+            ServiceUnavailableError: If the password hashing pool is saturated.
         """
         user_in_db = await self.user_repository.get_by_email(email)
-        if not user_in_db or not verify_password(password, user_in_db.hashed_password):
+        if not user_in_db or not await password_hash_service.verify(
+            password, user_in_db.hashed_password
+        ):
             raise AuthenticationError("Incorrect email or password")
 
         access_token_expires = timedelta(
@@ -177,4 +214,26 @@ class UserService:
         )
 
         user = User(id=user_in_db.id, name=user_in_db.name, email=user_in_db.email)
-        return {"access_token": access_token, "token_type": "bearer", "user": user}
+        return {
+            "access_token": access_token,
+            "token_type": "bearer",
+            "user": user,
+            "password_needs_rehash": password_needs_rehash(user_in_db.hashed_password),
+        }
+
+    async def upgrade_password_hash(self, user_id: int, password: str) -> None:
+        """Rehashes a verified password with the configured hashing parameters.
+
+        Args:
+            user_id: The ID of the user whose hash is upgraded.
+            password: The user's plain password, already verified.
+
+        Raises:
+            UserNotFoundError: If the user with the given ID is not found.
+        """
+        hashed_password = await password_hash_service.hash(password)
+        updated_user = await self.user_repository.update(
+            id=user_id, obj_in={"hashed_password": hashed_password}
+        )
+        if updated_user is None:
+            raise UserNotFoundError(f"User with id {user_id} not found")
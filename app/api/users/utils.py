@@ -0,0 +1,30 @@
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.users.repository import UserRepository
+from app.api.users.service import UserService
+
+
+async def upgrade_password_hash_in_background(
+    session_factory: async_sessionmaker[AsyncSession], user_id: int, password: str
+) -> None:
+    """Rehash a user's password with the current parameters after a login.
+
+    Runs as a background task, after the response was sent and the request session
+    was closed, hence it uses its own session. Failures are logged only, the old hash
+    keeps working until the next login.
+
+    Args:
+        session_factory: Factory of the application's database sessions.
+        user_id: The ID of the user who just logged in.
+        password: The verified plain password.
+    """
+    async with session_factory() as session:
+        try:
+            await UserService(UserRepository(session)).upgrade_password_hash(
+                user_id, password
+            )
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            logger.exception("Failed to upgrade password hash of user {}", user_id)
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 
 from app.api.auth.deps import get_current_user
 from app.api.users.deps import get_user_service
@@ -12,9 +12,22 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 @router.get("/")
 async def get_users(
+    response: Response,
     user_service: Annotated[UserService, Depends(get_user_service)],
+    skip: Annotated[int, Query(ge=0, description="Number of users to skip")] = 0,
+    limit: Annotated[
+        int, Query(ge=1, le=100, description="Number of users to return")
+    ] = 100,
+    include_total: Annotated[
+        bool,
+        Query(description="Return the number of users in the `X-Total-Count` header"),
+    ] = False,
 ) -> list[User]:
-    return await user_service.get_users()
+    if include_total:
+        users, total = await user_service.get_users_with_total(skip=skip, limit=limit)
+        response.headers["X-Total-Count"] = str(total)
+        return users
+    return await user_service.get_users(skip=skip, limit=limit)
 
 
 @router.get("/me")
@@ -62,3 +62,39 @@ class PermissionDeniedError(APIError):
             detail: Explanation of why permission was denied
         """
         super().__init__(detail=detail, status_code=status.HTTP_403_FORBIDDEN)
+
+
+class InvalidCursorError(APIError):
+    """Raised when a pagination cursor is malformed or does not match the query."""
+
+    def __init__(self, detail: str = "Invalid pagination cursor"):
+        """Initialize with 400 status and detail message.
+
+        Args:
+            detail: Explanation of why the cursor is invalid
+        """
+        super().__init__(detail=detail, status_code=status.HTTP_400_BAD_REQUEST)
+
+
+class InvalidQueryError(APIError):
+    """Raised when a list query sorts or filters by an unsupported field."""
+
+    def __init__(self, detail: str = "Invalid query"):
+        """Initialize with 400 status and detail message.
+
+        Args:
+            detail: Explanation of which field is not supported
+        """
+        super().__init__(detail=detail, status_code=status.HTTP_400_BAD_REQUEST)
+
+
+class ServiceUnavailableError(APIError):
+    """Raised when a request cannot be served because a resource is saturated."""
+
+    def __init__(self, detail: str = "Service temporarily unavailable"):
+        """Initialize with 503 status and detail message.
+
+        Args:
+            detail: Explanation of which resource is unavailable
+        """
+        super().__init__(detail=detail, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
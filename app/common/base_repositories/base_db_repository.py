@@ -1,16 +1,80 @@
-from typing import Any, Generic, Type, TypeVar
+import json
+from typing import Any, Awaitable, Callable, Generic, Mapping, Sequence, Type, TypeVar
 
 from pydantic import BaseModel
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Select,
+    and_,
+    delete,
+    false,
+    func,
+    insert,
+    or_,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
 
+from app.common.base_exceptions import InvalidQueryError
 from app.common.base_repositories.base_repository import BaseRepository
+from app.common.cache import list_total_cache
+from app.common.filtering import (
+    COMPARISONS,
+    FilterOperator,
+    parse_filter_key,
+    prefix_upper_bound,
+)
+from app.common.pagination import decode_cursor, id_descending, parse_sort
+from app.core.settings import settings
 from app.db.base import BaseSQLAlchemyModel
+from app.db.session import add_after_commit
 
 T = TypeVar("T", bound=BaseSQLAlchemyModel)
 
 
+def _copy_value(column: Column, value: Any) -> Any:
+    """Convert a value to the Python type asyncpg's binary COPY expects."""
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    return value if isinstance(value, python_type) else python_type(value)
+
+
+def _order_by(column: ColumnElement, descending: bool) -> ColumnElement:
+    """Order clause sorting NULLs first, as SQLite does by default and Postgres not."""
+    if not column.expression.nullable:
+        return column.desc() if descending else column
+    return column.desc().nulls_last() if descending else column.nulls_first()
+
+
+def _null_aware_seek(
+    column: ColumnElement, descending: bool, value: Any
+) -> tuple[ColumnElement, ColumnElement]:
+    """Predicates matching rows after `value` and rows equal to it, in `_order_by`."""
+    if value is None:
+        after = false() if descending else column.is_not(None)
+        return after, column.is_(None)
+    after = column < value if descending else column > value
+    if descending and column.expression.nullable:
+        after = or_(after, column.is_(None))
+    return after, column == value
+
+
 class BaseDBRepository(BaseRepository[T], Generic[T]):
+    # Upper bound of ids bound into a single `IN (...)` list, kept well below the
+    # bind parameter limits of SQLite and Postgres.
+    bulk_chunk_size: int = 1000
+    # Columns `get_all` may sort or filter by, mapped to the name of the index serving
+    # them, so that list queries cannot fall back to full scans as tables grow.
+    # `None` allows every column. Sorting and filtering by id, through the primary
+    # key, is always allowed.
+    sortable_columns: Mapping[str, str] | None = None
+    filterable_columns: Mapping[str, str] | None = None
+
     def __init__(self, model: Type[T], session: AsyncSession):
         self.model = model
         self.session = session
@@ -21,27 +85,173 @@ class BaseDBRepository(BaseRepository[T], Generic[T]):
         )
         return result.scalar_one_or_none()
 
-    async def get_all(
+    async def get_existing_ids(self, ids: Sequence[int]) -> set[int]:
+        ids = list(ids)
+        existing: set[int] = set()
+        for start in range(0, len(ids), self.bulk_chunk_size):
+            chunk = ids[start : start + self.bulk_chunk_size]
+            result = await self.session.scalars(
+                select(self.model.id).where(self.model.id.in_(chunk))
+            )
+            existing.update(result.all())
+        return existing
+
+    async def get_all(  # noqa: PLR0913
         self,
         skip: int = 0,
         limit: int = 100,
         filters: dict[str, Any] | None = None,
         sort_by: str | None = None,
         order: str | None = "asc",
+        cursor: str | None = None,
     ) -> list[T]:
-        query = select(self.model)
-        if filters:
-            for field, value in filters.items():
-                query = query.where(getattr(self.model, field) == value)
-        if sort_by:
-            sort_col = getattr(self.model, sort_by)
-            if order and order.lower() == "desc":
-                sort_col = sort_col.desc()
-            query = query.order_by(sort_col)
-        query = query.offset(skip).limit(limit)
+        query = self._list_query(skip, limit, filters, sort_by, order, cursor)
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def count(self, filters: dict[str, Any] | None = None) -> int:
+        query = select(func.count()).select_from(self.model)
+        return await self.session.scalar(
+            query.where(*self._filter_clauses(filters or {}))
+        )
+
+    async def get_all_with_total(  # noqa: PLR0913
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        order: str | None = "asc",
+        cursor: str | None = None,
+    ) -> tuple[list[T], int]:
+        """Return a page of objects and the total, with `COUNT(*) OVER()`.
+
+        Totals of at least `LIST_TOTAL_CACHE_MIN_ROWS` rows are cached for a while,
+        so that paging through large tables does not count them on every page.
+        """
+        total_key = (self.model.__tablename__, json.dumps(filters, sort_keys=True))
+        total = list_total_cache.get(total_key)
+        if total is not None:
+            items = await self.get_all(skip, limit, filters, sort_by, order, cursor)
+            return items, total
+
+        query = self._list_query(
+            skip, limit, filters, sort_by, order, cursor, with_total=True
+        )
+        rows = (await self.session.execute(query)).all()
+        # Past the last page there is no row to carry the total.
+        total = rows[0].total if rows else await self.count(filters)
+        if total >= settings.LIST_TOTAL_CACHE_MIN_ROWS:
+            list_total_cache.set(total_key, total)
+        return [row[0] for row in rows], total
+
+    def _list_query(  # noqa: PLR0913
+        self,
+        skip: int,
+        limit: int,
+        filters: dict[str, Any] | None,
+        sort_by: str | None,
+        order: str | None,
+        cursor: str | None,
+        with_total: bool = False,
+    ) -> Select:
+        sort_keys = parse_sort(sort_by, order)
+        query = select(self.model).where(*self._filter_clauses(filters or {}))
+        entity = self.model
+        if with_total:
+            # Counted in a subquery, before seeking, so that the total is the one of
+            # the filters whatever page `cursor` points to.
+            counted = query.add_columns(func.count().over().label("total")).subquery()
+            entity = aliased(self.model, counted)
+            query = select(entity, counted.c.total)
+
+        sort_cols = [
+            getattr(entity, self._column(key.field, self.sortable_columns, "Sorting"))
+            for key in sort_keys
+        ]
+        directions = [key.descending for key in sort_keys]
+        sort_cols.append(entity.id)
+        directions.append(id_descending(sort_keys, order))
+
+        if cursor:
+            position = decode_cursor(cursor, sort_by=sort_by, order=order)
+            query = query.where(
+                self._seek_clause(
+                    sort_cols, directions, [*position.values, position.id]
+                )
+            )
+        else:
+            query = query.offset(skip)
+
+        return query.order_by(
+            *(
+                _order_by(col, descending)
+                for col, descending in zip(sort_cols, directions, strict=True)
+            )
+        ).limit(limit)
+
+    def _column(
+        self, field: str, allowed: Mapping[str, str] | None, action: str
+    ) -> str:
+        """Check that `field` is a column that may be used for `action`."""
+        if field != "id" and allowed is not None and field not in allowed:
+            names = ", ".join(["id", *allowed])
+            raise InvalidQueryError(
+                f"{action} by {field!r} is not supported, use one of: {names}"
+            )
+        if field not in self.model.__table__.columns:
+            raise InvalidQueryError(f"{action} by {field!r} is not supported")
+        return field
+
+    def _filter_clauses(self, filters: Mapping[str, Any]) -> list[ColumnElement]:
+        clauses = []
+        for key, value in filters.items():
+            field, operator = parse_filter_key(key)
+            column = getattr(
+                self.model, self._column(field, self.filterable_columns, "Filtering")
+            )
+            if operator == FilterOperator.EQ:
+                clauses.append(column == value)
+            elif operator == FilterOperator.IN:
+                clauses.append(column.in_(value))
+            elif operator == FilterOperator.PREFIX:
+                # Range instead of `LIKE 'prefix%'`, which SQLite can not serve from
+                # a regular index. The range only matches prefixes when comparing
+                # bytes, as SQLite does, Postgres' default collation does not.
+                if self.session.bind.dialect.name == "postgresql":
+                    column = column.collate("C")
+                clauses.append(column >= value)
+                if (upper_bound := prefix_upper_bound(value)) is not None:
+                    clauses.append(column < upper_bound)
+            else:
+                clauses.append(COMPARISONS[operator](column, value))
+        return clauses
+
+    @staticmethod
+    def _seek_clause(
+        columns: list[ColumnElement], directions: list[bool], values: list[Any]
+    ) -> ColumnElement:
+        """Keyset predicate selecting the rows after `values` in the sort order.
+
+        Used instead of OFFSET so that deep pages cost the same as the first one.
+        """
+        if len(set(directions)) == 1 and not any(
+            column.expression.nullable for column in columns
+        ):
+            # Row value comparison, `(a, b, id) > (:a, :b, :id)`, seeks an index.
+            seek = tuple_(*columns)
+            return seek < tuple_(*values) if directions[0] else seek > tuple_(*values)
+
+        # Mixed directions or NULLs, which compare neither greater nor smaller:
+        # `a > :a OR (a = :a AND (b < :b OR (b = :b AND ...)))`.
+        clause = None
+        for column, descending, value in reversed(
+            list(zip(columns, directions, values, strict=True))
+        ):
+            after, equal = _null_aware_seek(column, descending, value)
+            clause = after if clause is None else or_(after, and_(equal, clause))
+        return clause
+
     async def create(self, obj_in: BaseModel) -> T:
         obj = self.model(**obj_in.model_dump())
         self.session.add(obj)
@@ -50,31 +260,116 @@ class BaseDBRepository(BaseRepository[T], Generic[T]):
         return obj
 
     async def update(self, id: int, obj_in: BaseModel) -> T | None:
-        result = await self.session.execute(
-            select(self.model).where(self.model.id == id)
-        )
-        obj = result.scalar_one_or_none()
-        if not obj:
-            return None
         update_data = (
             obj_in.model_dump(exclude_unset=True)
             if hasattr(obj_in, "model_dump")
             else obj_in
         )
-        for key, value in update_data.items():
-            setattr(obj, key, value)
-        self.session.add(obj)
-        await self.session.flush()
-        await self.session.refresh(obj)
-        return obj
+        if not update_data:
+            return await self.get_by_id(id)
+
+        # Single `UPDATE ... WHERE id = :id RETURNING *`, no row means not found.
+        result = await self.session.scalars(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**update_data)
+            .returning(self.model)
+        )
+        return result.one_or_none()
 
     async def delete(self, id: int) -> bool:
-        result = await self.session.execute(
-            select(self.model).where(self.model.id == id)
+        # Single `DELETE ... WHERE id = :id RETURNING id`, no row means not found.
+        result = await self.session.scalars(
+            delete(self.model).where(self.model.id == id).returning(self.model.id)
         )
-        obj = result.scalar_one_or_none()
-        if not obj:
-            return False
-        await self.session.delete(obj)
-        await self.session.flush()
-        return True
+        return result.one_or_none() is not None
+
+    async def create_many(self, objs_in: Sequence[BaseModel]) -> list[T]:
+        if not objs_in:
+            return []
+        # Multi-row `INSERT ... RETURNING`, SQLAlchemy batches the VALUES clause.
+        result = await self.session.scalars(
+            insert(self.model).returning(self.model),
+            [obj_in.model_dump() for obj_in in objs_in],
+        )
+        return list(result.all())
+
+    async def import_many(self, objs_in: Sequence[BaseModel]) -> int:
+        if not objs_in:
+            return 0
+        rows = [obj_in.model_dump() for obj_in in objs_in]
+
+        connection = await self.session.connection()
+        if connection.dialect.name == "postgresql":
+            await self._copy_rows(rows)
+        else:
+            # executemany `INSERT` without RETURNING, nothing is read back.
+            await self.session.execute(insert(self.model), rows)
+        return len(rows)
+
+    async def _copy_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Load rows with Postgres' binary `COPY ... FROM STDIN`."""
+        table = self.model.__table__
+        columns = [column for column in table.columns if column.name in rows[0]]
+        connection = await self.session.connection()
+        # The asyncpg adapter opens its transaction on the first statement, run one
+        # so that COPY is part of the request transaction instead of autocommitted.
+        await connection.exec_driver_sql("SELECT 1")
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name,
+            schema_name=table.schema,
+            columns=[column.name for column in columns],
+            records=[
+                tuple(_copy_value(column, row[column.name]) for column in columns)
+                for row in rows
+            ],
+        )
+
+    async def update_many(self, objs_in: Mapping[int, BaseModel]) -> list[T]:
+        ids = list(objs_in)
+        updated: list[T] = []
+        for start in range(0, len(ids), self.bulk_chunk_size):
+            chunk = ids[start : start + self.bulk_chunk_size]
+            existing = (
+                await self.session.scalars(
+                    select(self.model.id).where(self.model.id.in_(chunk))
+                )
+            ).all()
+            if not existing:
+                continue
+
+            # executemany-style `UPDATE ... WHERE id = :id` for the whole chunk.
+            await self.session.execute(
+                update(self.model),
+                [
+                    {
+                        **objs_in[id].model_dump(exclude_unset=True, exclude={"id"}),
+                        "id": id,
+                    }
+                    for id in existing
+                ],
+            )
+            result = await self.session.scalars(
+                select(self.model)
+                .where(self.model.id.in_(existing))
+                .execution_options(populate_existing=True)
+            )
+            updated.extend(result.all())
+        return updated
+
+    async def delete_many(self, ids: Sequence[int]) -> list[int]:
+        ids = list(ids)
+        deleted: list[int] = []
+        for start in range(0, len(ids), self.bulk_chunk_size):
+            chunk = ids[start : start + self.bulk_chunk_size]
+            result = await self.session.scalars(
+                delete(self.model)
+                .where(self.model.id.in_(chunk))
+                .returning(self.model.id)
+            )
+            deleted.extend(result.all())
+        return deleted
+
+    async def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        add_after_commit(self.session.sync_session, callback)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from typing import Any, Awaitable, Callable, Generic, Mapping, Sequence, TypeVar
 
 T = TypeVar("T")
 
@@ -11,14 +11,46 @@ class BaseRepository(ABC, Generic[T]):
     async def get_by_id(self, id: int) -> T | None: ...
 
     @abstractmethod
-    async def get_all(
+    async def get_all(  # noqa: PLR0913
         self,
         skip: int = 0,
         limit: int = 100,
         filters: dict[str, Any] | None = None,
         sort_by: str | None = None,
         order: str | None = "asc",
-    ) -> list[T]: ...
+        cursor: str | None = None,
+    ) -> list[T]:
+        """Return a page of objects.
+
+        `filters` are keyed `field` for equality or `field__op` for the operators of
+        `FilterOperator`. `sort_by` is a comma separated list of columns sorted in
+        `order`, a leading `-` sorts a column the other way.
+
+        Pages are selected with `skip`/`limit`, or, when `cursor` is given, by seeking
+        past the position of the sort columns encoded in the cursor. Results are always
+        ordered by `id` after the sort columns so that cursors are stable.
+        """
+
+    @abstractmethod
+    async def count(self, filters: dict[str, Any] | None = None) -> int:
+        """Return the number of objects matching `filters`."""
+
+    async def get_all_with_total(  # noqa: PLR0913
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        order: str | None = "asc",
+        cursor: str | None = None,
+    ) -> tuple[list[T], int]:
+        """Return a page of objects, as `get_all`, and the total matching `filters`."""
+        items = await self.get_all(skip, limit, filters, sort_by, order, cursor)
+        return items, await self.count(filters)
+
+    @abstractmethod
+    async def get_existing_ids(self, ids: Sequence[int]) -> set[int]:
+        """Return which of `ids` exist, without loading the objects."""
 
     @abstractmethod
     async def create(self, obj_in) -> T: ...
@@ -28,3 +60,25 @@ class BaseRepository(ABC, Generic[T]):
 
     @abstractmethod
     async def delete(self, id: int) -> bool: ...
+
+    @abstractmethod
+    async def create_many(self, objs_in: Sequence[Any]) -> list[T]: ...
+
+    @abstractmethod
+    async def import_many(self, objs_in: Sequence[Any]) -> int:
+        """Insert several objects without reading them back, return how many."""
+
+    @abstractmethod
+    async def update_many(self, objs_in: Mapping[int, Any]) -> list[T]:
+        """Update several objects keyed by id, ids that do not exist are skipped."""
+
+    @abstractmethod
+    async def delete_many(self, ids: Sequence[int]) -> list[int]:
+        """Delete several objects and return the ids that were actually deleted."""
+
+    async def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run `callback` once the writes made so far are committed.
+
+        Repositories without transactions have nothing to wait for and run it now.
+        """
+        await callback()
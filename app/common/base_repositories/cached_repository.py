@@ -0,0 +1,139 @@
+from typing import Any, Awaitable, Callable, Generic, Mapping, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+from app.common.base_repositories.base_repository import BaseRepository
+from app.common.cache import CacheBackend
+
+S = TypeVar("S", bound=BaseModel)
+
+
+class CachedRepository(BaseRepository[S], Generic[S]):
+    """Read-through cache in front of another repository.
+
+    `get_by_id` is served from the cache and falls back to the wrapped repository on
+    a miss. Writes go to the wrapped repository and invalidate the ids they touch,
+    right away so that the transaction reads its own writes, and again once it is
+    committed, as a concurrent read may have cached the old row in between.
+    List queries are not cached. Any other attribute, e.g. `get_by_email`, is looked
+    up on the wrapped repository.
+
+    Cached objects are stored as the JSON representation of `schema`, hence
+    `get_by_id` always returns `schema` instances, whatever the wrapped repository
+    returns.
+    """
+
+    def __init__(
+        self,
+        repository: BaseRepository[Any],
+        cache: CacheBackend,
+        schema: type[S],
+    ):
+        """Initialize the cached repository.
+
+        Args:
+            repository: Repository that owns the data.
+            cache: Cache backend to store `schema` dumps keyed by id.
+            schema: Pydantic model used to (de)serialize the cached objects.
+        """
+        self.repository = repository
+        self.cache = cache
+        self.schema = schema
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.repository, name)
+
+    async def _invalidate(self, ids: Sequence[int]) -> None:
+        keys = [str(id) for id in ids]
+        await self.cache.delete(*keys)
+
+        async def invalidate_committed() -> None:
+            await self.cache.delete(*keys)
+
+        await self.repository.on_commit(invalidate_committed)
+
+    async def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        await self.repository.on_commit(callback)
+
+    async def get_by_id(self, id: int) -> S | None:
+        cached = await self.cache.get(str(id))
+        if cached is not None:
+            return self.schema.model_validate(cached)
+
+        obj = await self.repository.get_by_id(id)
+        if obj is None:
+            return None
+        obj = self.schema.model_validate(obj)
+        await self.cache.set(str(id), obj.model_dump(mode="json"))
+        return obj
+
+    async def get_all(  # noqa: PLR0913
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        order: str | None = "asc",
+        cursor: str | None = None,
+    ) -> list[Any]:
+        return await self.repository.get_all(
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            sort_by=sort_by,
+            order=order,
+            cursor=cursor,
+        )
+
+    async def count(self, filters: dict[str, Any] | None = None) -> int:
+        return await self.repository.count(filters)
+
+    async def get_all_with_total(  # noqa: PLR0913
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        order: str | None = "asc",
+        cursor: str | None = None,
+    ) -> tuple[list[Any], int]:
+        return await self.repository.get_all_with_total(
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            sort_by=sort_by,
+            order=order,
+            cursor=cursor,
+        )
+
+    async def get_existing_ids(self, ids: Sequence[int]) -> set[int]:
+        return await self.repository.get_existing_ids(ids)
+
+    async def create(self, obj_in) -> Any:
+        return await self.repository.create(obj_in)
+
+    async def update(self, id: int, obj_in) -> Any | None:
+        obj = await self.repository.update(id, obj_in)
+        await self._invalidate([id])
+        return obj
+
+    async def delete(self, id: int) -> bool:
+        deleted = await self.repository.delete(id)
+        await self._invalidate([id])
+        return deleted
+
+    async def create_many(self, objs_in: Sequence[Any]) -> list[Any]:
+        return await self.repository.create_many(objs_in)
+
+    async def import_many(self, objs_in: Sequence[Any]) -> int:
+        return await self.repository.import_many(objs_in)
+
+    async def update_many(self, objs_in: Mapping[int, Any]) -> list[Any]:
+        updated = await self.repository.update_many(objs_in)
+        await self._invalidate(list(objs_in))
+        return updated
+
+    async def delete_many(self, ids: Sequence[int]) -> list[int]:
+        deleted = await self.repository.delete_many(ids)
+        await self._invalidate(ids)
+        return deleted
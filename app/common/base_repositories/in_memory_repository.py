@@ -1,83 +1,408 @@
-from typing import Any, Generic, TypeVar
+import asyncio
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    TypeVar,
+)
 
 from app.common.base_repositories.base_repository import BaseRepository
+from app.common.filtering import FilterOperator, matches, parse_filter_key
+from app.common.pagination import Cursor, decode_cursor, id_descending, parse_sort
 
 T = TypeVar("T")
 
 
+def _sort_value(item: Any, field: str) -> tuple[bool, Any]:
+    # Sorts missing values first, like SQLite does with NULLs.
+    value = getattr(item, field, None)
+    return (value is not None, value)
+
+
+class StoreSnapshot(Generic[T]):
+    """Rows and indexes of an `InMemoryStore` at one point in time.
+
+    Views hold `(sort value, id)` pairs, so that ties are ordered by id. Rows are
+    always viewed sorted by id.
+    """
+
+    def __init__(
+        self,
+        rows: dict[int, T],
+        indexes: dict[str, defaultdict[Any, set[int]]],
+        views: dict[str, list[tuple[Any, int]]],
+    ):
+        self._rows = rows
+        self._indexes = indexes
+        self._views = views
+        # Number of readers holding the snapshot, writers work on a copy meanwhile.
+        self.readers = 0
+
+    @classmethod
+    def build(
+        cls, items: Iterable[T], indexes: Iterable[str], sorted_fields: Iterable[str]
+    ) -> "StoreSnapshot[T]":
+        rows = {item.id: item for item in sorted(items, key=lambda item: item.id)}
+        snapshot = cls(rows, {field: defaultdict(set) for field in indexes}, {})
+        for item in rows.values():
+            for field, index in snapshot._indexes.items():
+                index[getattr(item, field, None)].add(item.id)
+        snapshot._views = {
+            field: sorted(snapshot._view_key(item, field) for item in rows.values())
+            for field in {"id", *sorted_fields}
+        }
+        return snapshot
+
+    def copy(self) -> "StoreSnapshot[T]":
+        return StoreSnapshot(
+            dict(self._rows),
+            {
+                field: defaultdict(
+                    set, {value: set(ids) for value, ids in index.items()}
+                )
+                for field, index in self._indexes.items()
+            },
+            {field: list(view) for field, view in self._views.items()},
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._rows[id] for _, id in self._views["id"])
+
+    @staticmethod
+    def _view_key(item: T, field: str) -> tuple[Any, int]:
+        return (_sort_value(item, field), item.id)
+
+    def get(self, id: int) -> T | None:
+        return self._rows.get(id)
+
+    def lookup(
+        self, filters: Iterable[tuple[str, FilterOperator, Any]]
+    ) -> set[int] | None:
+        """Ids of the rows matching the indexed equality and `IN` filters.
+
+        Args:
+            filters: `(field, operator, operand)` filters, the others are ignored.
+
+        Returns:
+            The matching ids, or `None` if no filter can use an index.
+        """
+        ids = None
+        for field, operator, operand in filters:
+            index = self._indexes.get(field)
+            if index is None or operator not in (FilterOperator.EQ, FilterOperator.IN):
+                continue
+            values = operand if operator == FilterOperator.IN else [operand]
+            found = set().union(*(index.get(value, ()) for value in values))
+            ids = found if ids is None else ids & found
+        return ids
+
+    def scan(
+        self, field: str, descending: bool, after: tuple[Any, int] | None = None
+    ) -> Iterator[T] | None:
+        """Iterate rows sorted by `field` then id, starting after the `after` key.
+
+        Returns:
+            The rows, or `None` if `field` has no sorted view.
+        """
+        view = self._views.get(field)
+        if view is None:
+            return None
+        if descending:
+            end = len(view) if after is None else bisect_left(view, after)
+            positions = range(end - 1, -1, -1)
+        else:
+            start = 0 if after is None else bisect_right(view, after)
+            positions = range(start, len(view))
+        return (self._rows[view[position][1]] for position in positions)
+
+    def insert(self, item: T) -> None:
+        self._rows[item.id] = item
+        for field, index in self._indexes.items():
+            index[getattr(item, field, None)].add(item.id)
+        for field, view in self._views.items():
+            insort(view, self._view_key(item, field))
+
+    def remove(self, id: int) -> T | None:
+        item = self._rows.pop(id, None)
+        if item is None:
+            return None
+        for field, index in self._indexes.items():
+            value = getattr(item, field, None)
+            index[value].discard(id)
+            if not index[value]:
+                del index[value]
+        for field, view in self._views.items():
+            del view[bisect_left(view, self._view_key(item, field))]
+        return item
+
+
+class InMemoryStore(Generic[T]):
+    """Rows of an `InMemoryRepository`, indexed so that lookups do not scan them.
+
+    Rows are kept in a dict by id and new ids come from a counter, they are never
+    reused. `indexes` declares fields with a hash index, used by equality and `IN`
+    filters. `sorted_fields` declares fields with a sorted view, which serves
+    `sort_by` on that single field without sorting and seeks cursors by bisection.
+
+    Readers hold a snapshot with `read`, which never changes under them and never
+    waits for writers. Writers take the `write` lock, one at a time, and copy the rows
+    and indexes first only while a reader still holds the current snapshot.
+    """
+
+    def __init__(
+        self,
+        initial_data: Iterable[T] = (),
+        indexes: Iterable[str] = (),
+        sorted_fields: Iterable[str] = (),
+    ):
+        """Initialize the store.
+
+        Args:
+            initial_data: Rows to load, each with an `id`.
+            indexes: Fields to build a hash index on.
+            sorted_fields: Fields to keep a sorted view of.
+        """
+        self._snapshot: StoreSnapshot[T] = StoreSnapshot.build(
+            initial_data, indexes, sorted_fields
+        )
+        self._next_id = max((item.id for item in self._snapshot), default=0) + 1
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def __iter__(self) -> Iterator[T]:
+        with self.read() as snapshot:
+            yield from snapshot
+
+    def get(self, id: int) -> T | None:
+        return self._snapshot.get(id)
+
+    @contextmanager
+    def read(self) -> Iterator[StoreSnapshot[T]]:
+        """Hold the current rows, later writes are not visible through them.
+
+        Writes copy the rows while they are held, so release them once read.
+        """
+        snapshot = self._snapshot
+        snapshot.readers += 1
+        try:
+            yield snapshot
+        finally:
+            snapshot.readers -= 1
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator["InMemoryStore[T]"]:
+        """Serialize writers, `new_id`, `insert` and `remove` must run under it."""
+        # Stores outlive event loops, e.g. module level ones across tests, while an
+        # asyncio lock is bound to the loop it first waited on.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock, self._lock_loop = asyncio.Lock(), loop
+        async with self._lock:
+            yield self
+
+    def _writable(self) -> StoreSnapshot[T]:
+        if self._snapshot.readers:
+            self._snapshot = self._snapshot.copy()
+        return self._snapshot
+
+    def new_id(self) -> int:
+        id, self._next_id = self._next_id, self._next_id + 1
+        return id
+
+    def insert(self, item: T) -> None:
+        self._writable().insert(item)
+        self._next_id = max(self._next_id, item.id + 1)
+
+    def remove(self, id: int) -> T | None:
+        if self._snapshot.get(id) is None:
+            return None
+        return self._writable().remove(id)
+
+    def replace(self, item: T) -> None:
+        """Replace the row with the same id as `item`."""
+        snapshot = self._writable()
+        snapshot.remove(item.id)
+        snapshot.insert(item)
+
+
 class InMemoryRepository(BaseRepository[T], Generic[T]):
-    def __init__(self, initial_data: list[T]):
+    def __init__(self, initial_data: list[T] | InMemoryStore[T]):
         """Initialize the in-memory repository with initial data.
 
         NOTE:
-            `initial_data` should be used as pass by reference. It is because, fastapi
-            reinitialize the depencency on each request. So, if we pass by value,
-            it will reset the data. Hence, CRUD operations will not work as expected.
+            `initial_data` should be a store shared between repositories. It is
+            because, fastapi reinitialize the depencency on each request. So, if we
+            pass a list, a new store is built from it each time, which resets the
+            data. Hence, CRUD operations will not work as expected.
 
             Actually, this is not a good practice to use in-memory repository as database.
             This is just for testing purpose. In production, we should use a proper database
             like PostgreSQL, MySQL, etc.
         """
-        self._data = initial_data
+        self._store = (
+            initial_data
+            if isinstance(initial_data, InMemoryStore)
+            else InMemoryStore(initial_data)
+        )
 
     async def get_by_id(self, id: int) -> T | None:
-        return next(
-            (item for item in self._data if getattr(item, "id", None) == id), None
-        )
+        return self._store.get(id)
+
+    async def get_existing_ids(self, ids: Sequence[int]) -> set[int]:
+        with self._store.read() as snapshot:
+            return {id for id in ids if snapshot.get(id) is not None}
 
-    async def get_all(
+    async def get_all(  # noqa: PLR0913
         self,
         skip: int = 0,
         limit: int = 100,
         filters: dict[str, Any] | None = None,
         sort_by: str | None = None,
         order: str | None = "asc",
+        cursor: str | None = None,
     ) -> list[T]:
-        items = list(self._data)
-        if filters:
-            for field, value in filters.items():
-                items = [item for item in items if getattr(item, field, None) == value]
-        if sort_by and items and hasattr(items[0], sort_by):
-            reverse = order.lower() == "desc"
-            items.sort(key=lambda x: getattr(x, sort_by), reverse=reverse)
+        filters = [
+            (*parse_filter_key(key), operand)
+            for key, operand in (filters or {}).items()
+        ]
+        sort_keys = parse_sort(sort_by, order)
+        columns = [(key.field, key.descending) for key in sort_keys]
+        columns.append(("id", id_descending(sort_keys, order)))
+        position = (
+            decode_cursor(cursor, sort_by=sort_by, order=order) if cursor else None
+        )
+
+        def is_match(item: T) -> bool:
+            return _matches_all(item, filters)
+
+        with self._store.read() as snapshot:
+            ids = snapshot.lookup(filters)
+            if ids is None and len(sort_keys) <= 1:
+                rows = _scan(snapshot, *columns[0], position=position)
+                if rows is not None:
+                    # Rows come sorted from the view, stop once the page is full.
+                    offset = 0 if position else skip
+                    return list(islice(filter(is_match, rows), offset, offset + limit))
+
+            rows = snapshot if ids is None else map(snapshot.get, sorted(ids))
+            items = [item for item in rows if is_match(item)]
+        # Stable sorts from the last column to the first give the multi-column order.
+        for field, descending in reversed(columns):
+            items.sort(key=lambda item: _sort_value(item, field), reverse=descending)
+
+        if position:
+            return [item for item in items if _is_after(item, columns, position)][
+                :limit
+            ]
         return items[skip : skip + limit]
 
+    async def count(self, filters: dict[str, Any] | None = None) -> int:
+        filters = [
+            (*parse_filter_key(key), operand)
+            for key, operand in (filters or {}).items()
+        ]
+        with self._store.read() as snapshot:
+            ids = snapshot.lookup(filters)
+            if ids is None and not filters:
+                return len(snapshot)
+            items = snapshot if ids is None else map(snapshot.get, ids)
+            return sum(_matches_all(item, filters) for item in items)
+
     async def create(self, obj_in) -> T:
-        new_id = max((getattr(item, "id", 0) for item in self._data), default=0) + 1
+        async with self._store.write():
+            return self._create(obj_in)
+
+    async def update(self, id: int, obj_in) -> T | None:
+        async with self._store.write():
+            return self._update(id, obj_in)
+
+    async def delete(self, id: int) -> bool:
+        async with self._store.write():
+            return self._store.remove(id) is not None
+
+    async def create_many(self, objs_in: Sequence[Any]) -> list[T]:
+        async with self._store.write():
+            return [self._create(obj_in) for obj_in in objs_in]
+
+    async def import_many(self, objs_in: Sequence[Any]) -> int:
+        return len(await self.create_many(objs_in))
+
+    async def update_many(self, objs_in: Mapping[int, Any]) -> list[T]:
+        async with self._store.write():
+            updated = [self._update(id, obj_in) for id, obj_in in objs_in.items()]
+        return [item for item in updated if item is not None]
+
+    async def delete_many(self, ids: Sequence[int]) -> list[int]:
+        async with self._store.write():
+            return [id for id in ids if self._store.remove(id) is not None]
+
+    # Writers below must run under `self._store.write()`.
+
+    def _create(self, obj_in) -> T:
         obj = (
-            obj_in.model_copy(update={"id": new_id})
+            obj_in.model_copy(update={"id": self._store.new_id()})
             if hasattr(obj_in, "model_copy")
             else obj_in
         )
-        self._data.append(obj)
+        self._store.insert(obj)
         return obj
 
-    async def update(self, id: int, obj_in) -> T | None:
-        item = await self.get_by_id(id)
+    def _update(self, id: int, obj_in) -> T | None:
+        item = self._store.get(id)
         if item:
             update_data = (
                 obj_in.model_dump(exclude_unset=True)
                 if hasattr(obj_in, "model_dump")
-                else {}
+                else dict(obj_in)
             )
             updated_item = (
                 item.model_copy(update=update_data)
                 if hasattr(item, "model_copy")
                 else item
             )
-            idx = next(
-                (i for i, v in enumerate(self._data) if getattr(v, "id", None) == id),
-                None,
-            )
-            if idx is not None:
-                self._data.pop(idx)
-                self._data.insert(idx, updated_item)
+            self._store.replace(updated_item)
             return updated_item
         return None
 
-    async def delete(self, id: int) -> bool:
-        item = await self.get_by_id(id)
-        if item:
-            self._data.remove(item)
-            return True
-        return False
+
+def _matches_all(item: Any, filters: list[tuple[str, FilterOperator, Any]]) -> bool:
+    return all(
+        matches(getattr(item, field, None), operator, operand)
+        for field, operator, operand in filters
+    )
+
+
+def _scan(
+    snapshot: StoreSnapshot[T], field: str, descending: bool, position: Cursor | None
+) -> Iterator[T] | None:
+    # With a single sort column, ties are broken by id in the same direction,
+    # which is the order of the column's sorted view.
+    after = None
+    if position:
+        value = position.values[0] if position.values else position.id
+        after = ((value is not None, value), position.id)
+    return snapshot.scan(field, descending, after)
+
+
+def _is_after(item: Any, columns: list[tuple[str, bool]], position: Cursor) -> bool:
+    """Whether `item` comes after the cursor position in the `columns` order."""
+    values = [*position.values, position.id]
+    for (field, descending), value in zip(columns, values, strict=True):
+        current, last = _sort_value(item, field), (value is not None, value)
+        if current != last:
+            return current < last if descending else current > last
+    return False
@@ -0,0 +1,192 @@
+"""Cache backends used to avoid repeated database reads."""
+
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import cache
+from importlib import import_module
+from typing import Any, Hashable
+
+from api_shared.utils.general import is_module_installed
+
+from app.core.metrics import CACHE_EVICTIONS, CACHE_HITS, CACHE_MISSES
+from app.core.settings import CacheBackendType, settings
+
+
+class LRUCache:
+    """Bounded in-process cache with least-recently-used eviction and TTL expiry.
+
+    Not thread-safe, it is meant to be used from the event loop only.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float | None = None):
+        """Initialize the cache.
+
+        Args:
+            name: Name of the cache, used as the `cache` label of the metrics.
+            maxsize: Maximum number of entries kept in the cache.
+            ttl: Default time to live of an entry in seconds, `None` means forever.
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._data.move_to_end(key)
+                CACHE_HITS.labels(self.name).inc()
+                return value
+            del self._data[key]
+        CACHE_MISSES.labels(self.name).inc()
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store a value, `ttl` overrides the default time to live of the cache."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            CACHE_EVICTIONS.labels(self.name).inc()
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Totals of large list queries, keyed by table and filters. Counts are approximate
+# for up to the time to live, as writes do not invalidate them.
+list_total_cache = LRUCache(
+    name="list_totals",
+    maxsize=settings.LIST_TOTAL_CACHE_MAXSIZE,
+    ttl=settings.LIST_TOTAL_CACHE_TTL_SECONDS,
+)
+
+
+class CacheBackend(ABC):
+    """Async key/value cache interface.
+
+    Values must be JSON serializable so that backends can store them out of process.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None: ...
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Cache backend storing values in a per-process `LRUCache`."""
+
+    def __init__(self, name: str, maxsize: int, ttl: float | None = None):
+        self._cache = LRUCache(name=name, maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Any | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any) -> None:
+        self._cache.set(key, value)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.pop(key)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache backend shared between processes through a Redis compatible server.
+
+    Eviction is left to the server's `maxmemory-policy`, so only hits and misses are
+    counted here.
+    """
+
+    def __init__(self, name: str, client: Any, ttl: float | None = None):
+        """Initialize the backend.
+
+        Args:
+            name: Name of the cache, used as key prefix and as the metrics label.
+            client: `redis.asyncio.Redis` compatible client.
+            ttl: Time to live of an entry in seconds, `None` means forever.
+        """
+        self.name = name
+        self.client = client
+        self.ttl = ttl
+
+    def _key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    async def get(self, key: str) -> Any | None:
+        raw = await self.client.get(self._key(key))
+        if raw is None:
+            CACHE_MISSES.labels(self.name).inc()
+            return None
+        CACHE_HITS.labels(self.name).inc()
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Any) -> None:
+        ttl_ms = int(self.ttl * 1000) if self.ttl is not None else None
+        await self.client.set(self._key(key), json.dumps(value), px=ttl_ms)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self._key(key) for key in keys))
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=self._key("*"))]
+        if keys:
+            await self.client.delete(*keys)
+
+
+@cache
+def _get_redis_client() -> Any:
+    if not is_module_installed("redis"):  # pragma: no cover
+        raise RuntimeError(
+            "REPOSITORY_CACHE_BACKEND=redis requires optional dependency 'redis'. "
+            "Install extras with `uv sync --extra redis`."
+        )
+
+    return import_module("redis.asyncio").Redis.from_url(settings.REDIS_URL)
+
+
+@cache
+def get_repository_cache(name: str) -> CacheBackend | None:
+    """Return the process-wide repository cache named `name`.
+
+    Returns:
+        The configured cache backend, or `None` if repository caching is disabled.
+    """
+    if settings.REPOSITORY_CACHE_BACKEND == CacheBackendType.NONE:
+        return None
+
+    if settings.REPOSITORY_CACHE_BACKEND == CacheBackendType.REDIS:
+        return RedisCacheBackend(
+            name=name,
+            client=_get_redis_client(),
+            ttl=settings.REPOSITORY_CACHE_TTL_SECONDS,
+        )
+
+    return InMemoryCacheBackend(
+        name=name,
+        maxsize=settings.REPOSITORY_CACHE_MAXSIZE,
+        ttl=settings.REPOSITORY_CACHE_TTL_SECONDS,
+    )
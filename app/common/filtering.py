@@ -0,0 +1,77 @@
+"""Filter expressions shared by the repositories.
+
+Filters are keyed `field` for equality or `field__op` for other comparisons, e.g.
+`{"price__gte": 10, "name__in": ["a", "b"], "name__prefix": "It"}`.
+"""
+
+from enum import StrEnum
+from operator import ge, gt, le, lt
+from typing import Any, Callable
+
+from app.common.base_exceptions import InvalidQueryError
+
+
+class FilterOperator(StrEnum):
+    """Possible filter comparisons."""
+
+    EQ = "eq"
+    GT = "gt"
+    GTE = "gte"
+    LT = "lt"
+    LTE = "lte"
+    IN = "in"
+    PREFIX = "prefix"
+
+
+# Range comparisons, written so that they apply to Python values as well as to
+# SQLAlchemy columns.
+COMPARISONS: dict[FilterOperator, Callable[[Any, Any], Any]] = {
+    FilterOperator.GT: gt,
+    FilterOperator.GTE: ge,
+    FilterOperator.LT: lt,
+    FilterOperator.LTE: le,
+}
+
+
+def parse_filter_key(key: str) -> tuple[str, FilterOperator]:
+    """Split a filter key into its field and operator.
+
+    Raises:
+        InvalidQueryError: If the operator is unknown.
+    """
+    field, separator, operator = key.rpartition("__")
+    if not separator:
+        return key, FilterOperator.EQ
+    try:
+        return field, FilterOperator(operator)
+    except ValueError as e:
+        raise InvalidQueryError(
+            f"Unknown filter operator {operator!r} in {key!r}"
+        ) from e
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    """Return the smallest string greater than every string starting with `prefix`.
+
+    `prefix <= value < prefix_upper_bound(prefix)` is a prefix match that, unlike
+    `LIKE`, is served by a regular index. It only holds under a binary collation,
+    e.g. "C" on Postgres. `None` means there is no upper bound.
+    """
+    prefix = prefix.rstrip(chr(0x10FFFF))
+    if not prefix:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def matches(value: Any, operator: FilterOperator, operand: Any) -> bool:
+    """Evaluate a filter in Python, with the semantics of the compiled SQL."""
+    if operator == FilterOperator.EQ:
+        return value == operand
+    if operator == FilterOperator.IN:
+        return value in operand
+    if value is None:
+        # Comparisons with NULL are never true in SQL.
+        return False
+    if operator == FilterOperator.PREFIX:
+        return str(value).startswith(operand)
+    return COMPARISONS[operator](value, operand)
@@ -0,0 +1,160 @@
+"""Sort specifications and opaque cursor helpers for keyset pagination."""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from app.common.base_exceptions import InvalidCursorError
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a sort specification.
+
+    Attributes:
+        field: Name of the column.
+        descending: Whether the column is sorted in descending order.
+    """
+
+    field: str
+    descending: bool
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position of the last row of a page in keyset pagination.
+
+    Attributes:
+        sort_by: Normalized sort specification of the page, `None` means sorted by id
+            only.
+        order: Default sort order of the page, either "asc" or "desc".
+        values: Values of the sort columns of the last row.
+        id: Id of the last row, used as a tie-breaker.
+    """
+
+    sort_by: str | None
+    order: str
+    values: list[Any]
+    id: int
+
+
+def normalize_order(order: str | None) -> str:
+    """Normalize user provided sort order to either "asc" or "desc"."""
+    return "desc" if order and order.lower() == "desc" else "asc"
+
+
+def parse_sort(sort_by: str | None, order: str | None = "asc") -> list[SortKey]:
+    """Parse a comma separated sort specification such as `name,-price`.
+
+    Columns are sorted in `order`, a leading `-` sorts a column the other way.
+    """
+    default_descending = normalize_order(order) == "desc"
+    keys = []
+    for part in (sort_by or "").split(","):
+        field = part.strip()
+        if not field:
+            continue
+        descending = default_descending
+        if field.startswith("-"):
+            field, descending = field[1:].strip(), not default_descending
+        keys.append(SortKey(field=field, descending=descending))
+    return keys
+
+
+def normalize_sort(sort_by: str | None) -> str | None:
+    """Normalize a sort specification, so that equivalent ones compare equal."""
+    keys = parse_sort(sort_by)
+    if not keys:
+        return None
+    return ",".join(f"-{key.field}" if key.descending else key.field for key in keys)
+
+
+def id_descending(keys: Sequence[SortKey], order: str | None) -> bool:
+    """Direction of the id tie-breaker, the one of the last sort column."""
+    return keys[-1].descending if keys else normalize_order(order) == "desc"
+
+
+def _is_id(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_sort_value(value: Any) -> bool:
+    """Check that a decoded cursor value is a scalar a sort column can hold."""
+    return value is None or (
+        isinstance(value, (str, int, float)) and not isinstance(value, bool)
+    )
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Encode a cursor into an opaque url-safe token."""
+    payload = json.dumps(
+        [cursor.sort_by, cursor.order, cursor.values, cursor.id],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    token: str, sort_by: str | None = None, order: str | None = "asc"
+) -> Cursor:
+    """Decode an opaque cursor token and check that it matches the requested sort.
+
+    Args:
+        token: Token previously returned by `encode_cursor`.
+        sort_by: Sort specification of the current request.
+        order: Sort order of the current request.
+
+    Returns:
+        The decoded cursor.
+
+    Raises:
+        InvalidCursorError: If the token is malformed or was issued for a different
+            sort specification or order.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        cursor_sort_by, cursor_order, values, id = json.loads(
+            base64.urlsafe_b64decode(padded.encode())
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError() from e
+
+    if not _is_id(id) or not isinstance(values, list):
+        raise InvalidCursorError()
+    if not all(_is_sort_value(value) for value in values):
+        raise InvalidCursorError()
+    if cursor_sort_by != normalize_sort(sort_by) or cursor_order != normalize_order(
+        order
+    ):
+        raise InvalidCursorError("Cursor does not match the requested sort order")
+    if len(values) != len(parse_sort(sort_by)):
+        raise InvalidCursorError()
+
+    return Cursor(sort_by=cursor_sort_by, order=cursor_order, values=values, id=id)
+
+
+def next_cursor(
+    items: Sequence[Any],
+    limit: int,
+    sort_by: str | None = None,
+    order: str | None = "asc",
+) -> str | None:
+    """Build the cursor of the page following `items`.
+
+    Returns:
+        Opaque cursor token, or `None` if `items` is the last page.
+    """
+    if not items or len(items) < limit:
+        return None
+
+    last = items[-1]
+    return encode_cursor(
+        Cursor(
+            sort_by=normalize_sort(sort_by),
+            order=normalize_order(order),
+            values=[getattr(last, key.field, None) for key in parse_sort(sort_by)],
+            id=last.id,
+        )
+    )
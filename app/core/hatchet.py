@@ -1,34 +1,163 @@
-from typing import Any
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from api_shared.hatchet_client import get_hatchet
 from hatchet_sdk import Hatchet
-from hatchet_sdk.clients.rest.models.v1_workflow_run import V1WorkflowRun
+from hatchet_sdk.clients.listeners.run_event_listener import StepRunEvent
+from hatchet_sdk.clients.rest.models.v1_log_line import V1LogLine
 from hatchet_sdk.clients.rest.models.v1_workflow_run_details import (
     V1WorkflowRunDetails,
 )
+from pydantic import BaseModel
+
+from app.core.metrics import TASK_BULK_TRIGGER_DURATION, TASK_TRIGGER_DURATION
+
+
+@dataclass(frozen=True)
+class TaskDefinition:
+    """A task the application can trigger.
+
+    Attributes:
+        name: Name of the task registered by the workers.
+        input_validator: Model of the task input.
+        output_validator: Model of the task output, `None` if it returns nothing.
+    """
+
+    name: str
+    input_validator: type[BaseModel]
+    output_validator: type[BaseModel] | None = None
+
+
+class TaskSubmission(BaseModel):
+    """Reference to a task run, returned as soon as the run is enqueued.
+
+    Attributes:
+        id: Id of the workflow run, used to fetch its details and result.
+        task: Name of the triggered task.
+        triggered_at: Time the run was enqueued.
+    """
+
+    id: str
+    task: str
+    triggered_at: datetime
+
+
+class TaskBulkSubmission(BaseModel):
+    """References to task runs enqueued by one bulk request.
+
+    Attributes:
+        ids: Ids of the workflow runs, in the order of the inputs.
+        task: Name of the triggered task.
+        triggered_at: Time the first run was enqueued.
+    """
+
+    ids: list[str]
+    task: str
+    triggered_at: datetime
 
 
 class ExternalRunner:
-    """Abstraction over external task execution/read operations."""
+    """Abstraction over external task execution/read operations.
+
+    Stubs of the known tasks are built once, so triggering a task only serializes
+    its input and enqueues it. A runner is meant to live as long as the application.
+    """
+
+    def __init__(
+        self, hatchet: Hatchet | None = None, tasks: Iterable[TaskDefinition] = ()
+    ):
+        """Initializes the ExternalRunner.
 
-    def __init__(self, hatchet: Hatchet | None = None):
+        Args:
+            hatchet: Hatchet client, defaults to the process-wide one.
+            tasks: Tasks this runner can trigger.
+        """
         self.hatchet = hatchet or get_hatchet()
+        self._tasks = {task.name: task for task in tasks}
+        self._stubs = {
+            task.name: self.hatchet.stubs.task(
+                name=task.name,
+                input_validator=task.input_validator,
+                output_validator=task.output_validator,
+            )
+            for task in self._tasks.values()
+        }
 
-    async def trigger_task(
-        self,
-        *,
-        name: str,
-        input: Any,
-        input_validator: type[Any] | None = None,
-        output_validator: type[Any] | None = None,
-    ) -> V1WorkflowRun:
-        stub = self.hatchet.stubs.task(
-            name=name,
-            input_validator=input_validator,
-            output_validator=output_validator,
+    async def trigger_task(self, *, name: str, input: BaseModel) -> TaskSubmission:
+        """Enqueue a task run without waiting for Hatchet to report its details.
+
+        Only the enqueue call goes to Hatchet, full run details are fetched on demand
+        through `get_task`.
+
+        Raises:
+            KeyError: If the task is not registered on this runner.
+        """
+        stub = self._stubs[name]
+        triggered_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        try:
+            run_ref = await stub.aio_run_no_wait(input=input)
+        finally:
+            TASK_TRIGGER_DURATION.labels(name).observe(time.perf_counter() - start)
+        return TaskSubmission(
+            id=run_ref.workflow_run_id, task=name, triggered_at=triggered_at
         )
-        run_ref = await stub.aio_run_no_wait(input=input)
-        return (await self.hatchet.runs.aio_get(run_ref.workflow_run_id)).run
+
+    async def trigger_tasks(
+        self, *, name: str, inputs: Sequence[BaseModel], chunk_size: int
+    ) -> TaskBulkSubmission:
+        """Enqueue one run per input through the bulk-run API.
+
+        Inputs are sent in chunks of `chunk_size`, each chunk is a single call to
+        Hatchet.
+
+        Raises:
+            KeyError: If the task is not registered on this runner.
+        """
+        stub = self._stubs[name]
+        triggered_at = datetime.now(timezone.utc)
+        ids: list[str] = []
+        for offset in range(0, len(inputs), chunk_size):
+            chunk = inputs[offset : offset + chunk_size]
+            start = time.perf_counter()
+            try:
+                run_refs = await stub.aio_run_many_no_wait(
+                    [stub.create_bulk_run_item(input=input) for input in chunk]
+                )
+            finally:
+                TASK_BULK_TRIGGER_DURATION.labels(name).observe(
+                    time.perf_counter() - start
+                )
+            ids.extend(run_ref.workflow_run_id for run_ref in run_refs)
+        return TaskBulkSubmission(ids=ids, task=name, triggered_at=triggered_at)
 
     async def get_task(self, task_id: str) -> V1WorkflowRunDetails:
         return await self.hatchet.runs.aio_get(task_id)
+
+    def stream(self, task_id: str) -> AsyncIterator[StepRunEvent]:
+        """Subscribe to the status and stream events of a run."""
+        return aiter(self.hatchet.runs.get_run_ref(task_id).stream())
+
+    async def get_logs(
+        self, task_run_id: str, since: datetime | None = None
+    ) -> list[V1LogLine]:
+        """Return the lines logged by a task run, oldest first."""
+        logs = await self.hatchet.logs.aio_list(task_run_id, since=since)
+        return sorted(logs.rows or [], key=lambda line: line.created_at)
+
+    def parse_output(self, details: V1WorkflowRunDetails) -> Any:
+        """Return the output of a run, validated by its task output model if known.
+
+        Outputs of tasks this runner does not know about are returned as is.
+        """
+        namespace = self.hatchet.config.namespace
+        for summary in details.tasks:
+            name = (summary.workflow_name or "").removeprefix(namespace)
+            task = self._tasks.get(name)
+            if task is not None:
+                if task.output_validator is None:
+                    return summary.output
+                return task.output_validator.model_validate(summary.output)
+        return details.run.output
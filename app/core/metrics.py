@@ -0,0 +1,68 @@
+"""Application level Prometheus metrics.
+
+Metrics are registered on the default registry, which is the one exposed by
+`PrometheusFastApiInstrumentator` on `/metrics`.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+CACHE_HITS = Counter(
+    "cache_hits",
+    "Number of cache lookups that found a value.",
+    ["cache"],
+)
+CACHE_MISSES = Counter(
+    "cache_misses",
+    "Number of cache lookups that did not find a value.",
+    ["cache"],
+)
+CACHE_EVICTIONS = Counter(
+    "cache_evictions",
+    "Number of cache entries dropped because the cache was full.",
+    ["cache"],
+)
+
+PASSWORD_HASH_POOL_BUSY = Gauge(
+    "password_hash_pool_busy",
+    "Number of password hashing workers currently running a hash.",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_POOL_PENDING = Gauge(
+    "password_hash_pool_pending",
+    "Number of password hashing jobs queued or running.",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_POOL_REJECTED = Counter(
+    "password_hash_pool_rejected",
+    "Number of password hashing jobs rejected because the queue was full.",
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent hashing or verifying a password on a worker.",
+    ["operation"],
+)
+
+DB_CONNECTION_CHECKOUTS = Counter(
+    "db_connection_checkouts",
+    "Number of connections checked out of the pool.",
+    ["engine"],
+)
+DB_CONNECTION_HOLD_DURATION = Histogram(
+    "db_connection_hold_seconds",
+    "Time a connection was held between pool checkout and checkin.",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+TASK_TRIGGER_DURATION = Histogram(
+    "task_trigger_duration_seconds",
+    "Time spent enqueueing a task run on Hatchet.",
+    ["task"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+TASK_BULK_TRIGGER_DURATION = Histogram(
+    "task_bulk_trigger_duration_seconds",
+    "Time spent enqueueing one chunk of a bulk task submission on Hatchet.",
+    ["task"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
@@ -1,6 +1,7 @@
 from enum import StrEnum
 from pathlib import Path
 from tempfile import gettempdir
+from urllib.parse import quote
 
 from api_shared.core.settings import SharedBaseSettings
 from pydantic import Field
@@ -20,23 +21,204 @@ class LogLevel(StrEnum):
     FATAL = "FATAL"
 
 
+class CacheBackendType(StrEnum):
+    """Possible repository cache backends."""
+
+    NONE = "none"
+    MEMORY = "memory"
+    REDIS = "redis"
+
+
+class DBBackend(StrEnum):
+    """Possible database backends."""
+
+    SQLITE = "sqlite"
+    POSTGRES = "postgres"
+
+
+class SQLiteJournalMode(StrEnum):
+    """Possible SQLite journal modes."""
+
+    DELETE = "DELETE"
+    TRUNCATE = "TRUNCATE"
+    PERSIST = "PERSIST"
+    MEMORY = "MEMORY"
+    WAL = "WAL"
+    OFF = "OFF"
+
+
+class SQLiteSynchronous(StrEnum):
+    """Possible SQLite synchronous levels."""
+
+    OFF = "OFF"
+    NORMAL = "NORMAL"
+    FULL = "FULL"
+    EXTRA = "EXTRA"
+
+
+class SQLiteTempStore(StrEnum):
+    """Possible SQLite temporary storage locations."""
+
+    DEFAULT = "DEFAULT"
+    FILE = "FILE"
+    MEMORY = "MEMORY"
+
+
 class Settings(SharedBaseSettings):
+    AUTH_PRINCIPAL_CACHE_MAXSIZE: int = Field(
+        default=10_000,
+        ge=1,
+        description="Maximum number of authenticated users cached per process.",
+    )
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description="Time to live of cached authenticated users, 0 disables the cache.",
+    )
     JWT_ACCESS_TOKEN_EXPIRY_MINUTES: int = 30
     JWT_ALGORITHM: str = "HS256"
+    JWT_DECODE_CACHE_MAXSIZE: int = Field(
+        default=10_000,
+        ge=0,
+        description="Maximum number of verified tokens cached per process, 0 disables the cache.",
+    )
     API_PREFIX: str = "/api/v1"
     CORS_ORIGINS: list[str] = Field(default_factory=lambda: ["*"])
+    DB_BACKEND: DBBackend = DBBackend.SQLITE
+    DB_COMMAND_TIMEOUT_SECONDS: float | None = Field(
+        default=60.0,
+        gt=0,
+        description="Postgres only, statement timeout enforced by asyncpg.",
+    )
     DB_ECHO: bool = False
     DB_FILE: str = "db.sqlite3"
+    DB_HOST: str = "localhost"
+    DB_MAX_OVERFLOW: int = Field(
+        default=10,
+        ge=0,
+        description="Connections opened on top of DB_POOL_SIZE under load.",
+    )
+    DB_NAME: str = "fastapi_template"
+    DB_PASSWORD: str = "postgres"
+    DB_POOL_PRE_PING: bool = Field(
+        default=False,
+        description="Check pooled connections before use, survives server restarts.",
+    )
+    DB_POOL_RECYCLE_SECONDS: int = Field(
+        default=3600,
+        ge=-1,
+        description="Replace pooled connections older than this, -1 disables it.",
+    )
+    DB_POOL_SIZE: int = Field(
+        default=5,
+        ge=1,
+        description="Connections kept open in the pool.",
+    )
+    DB_POOL_TIMEOUT_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="Time to wait for a free connection before failing.",
+    )
+    DB_PORT: int = 5432
+    DB_READ_ENGINE_ENABLED: bool = Field(
+        default=True,
+        description="Route plain reads to a separate read-only connection pool.",
+    )
+    DB_READ_POOL_SIZE: int = Field(
+        default=10,
+        ge=1,
+        description="Connections kept open in the read-only pool.",
+    )
+    DB_READ_REPLICA_URL: str | None = Field(
+        default=None,
+        description="Read replica URL, defaults to a read-only handle on DB_FILE.",
+    )
+    DB_USER: str = "postgres"
     HOST: str = "0.0.0.0"
     LOG_LEVEL: LogLevel = LogLevel.INFO
+    PASSWORD_HASH_MEMORY_COST: int = Field(
+        default=65536,
+        ge=8,
+        description="Argon2 memory cost in KiB. Use `make calibrate-password-hash` to tune it.",
+    )
+    PASSWORD_HASH_PARALLELISM: int = Field(
+        default=4,
+        ge=1,
+        description="Argon2 parallelism (lanes).",
+    )
+    PASSWORD_HASH_TIME_COST: int = Field(
+        default=3,
+        ge=1,
+        description="Argon2 time cost (iterations). Use `make calibrate-password-hash` to tune it.",
+    )
+    PASSWORD_HASH_MAX_QUEUE: int = Field(
+        default=32,
+        ge=0,
+        description="Password hashing jobs allowed to wait for a worker before requests get 503.",
+    )
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=2,
+        ge=1,
+        description="Threads dedicated to Argon2 password hashing and verification.",
+    )
     PORT: int = 8000
     PROJECT_NAME: str = "FastAPI Template"
     PROMETHEUS_DIR: Path = Field(
         default=TEMP_DIR / "prom",
         description="This variable is used to define multiproc_dir.It's required for [uvi|guni]corn projects.",
     )
+    LIST_TOTAL_CACHE_MAXSIZE: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum number of cached list totals.",
+    )
+    LIST_TOTAL_CACHE_MIN_ROWS: int = Field(
+        default=10_000,
+        ge=0,
+        description="List totals from this many rows are cached instead of counted per page.",
+    )
+    LIST_TOTAL_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="Time a cached list total is served, bounds how far off it can be.",
+    )
+    REDIS_URL: str = "redis://localhost:6379/0"
     RELOAD: bool = False
+    REPOSITORY_CACHE_BACKEND: CacheBackendType = Field(
+        default=CacheBackendType.NONE,
+        description=(
+            "Only `redis` is safe with several workers, `memory` invalidates entries "
+            "in the local process only."
+        ),
+    )
+    REPOSITORY_CACHE_MAXSIZE: int = Field(
+        default=10_000,
+        ge=1,
+        description="Maximum number of entries per repository for the memory backend.",
+    )
+    REPOSITORY_CACHE_TTL_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="Time to live of cached repository reads, bounds cross-process staleness.",
+    )
     JWT_SECRET_KEY: str = "CHANGE_ME_IN_PRODUCTION"
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(
+        default=5000,
+        ge=0,
+        description="Time a connection waits on a locked database before failing.",
+    )
+    SQLITE_CACHE_SIZE: int = Field(
+        default=-64000,
+        description="Page cache per connection, negative values are in KiB.",
+    )
+    SQLITE_JOURNAL_MODE: SQLiteJournalMode = SQLiteJournalMode.WAL
+    SQLITE_MMAP_SIZE: int = Field(
+        default=268_435_456,
+        ge=0,
+        description="Bytes of the database file read through mmap, 0 disables it.",
+    )
+    SQLITE_SYNCHRONOUS: SQLiteSynchronous = SQLiteSynchronous.NORMAL
+    SQLITE_TEMP_STORE: SQLiteTempStore = SQLiteTempStore.MEMORY
     UVICORN_WORKERS: int = 1
 
     @property
@@ -46,8 +228,29 @@ class Settings(SharedBaseSettings):
         Return:
             Database URL.
         """
+        if self.DB_BACKEND == DBBackend.POSTGRES:
+            return (
+                f"postgresql+asyncpg://{quote(self.DB_USER, safe='')}:"
+                f"{quote(self.DB_PASSWORD, safe='')}@{self.DB_HOST}:{self.DB_PORT}/"
+                f"{self.DB_NAME}"
+            )
         return f"sqlite+aiosqlite:///{self.DB_FILE}"
 
+    @property
+    def DB_READ_URL(self) -> str | None:
+        """Assemble the read-only database URL from settings.
+
+        Return:
+            Read-only database URL, `None` if reads can not be split from writes.
+        """
+        if not self.DB_READ_ENGINE_ENABLED:
+            return None
+        if self.DB_READ_REPLICA_URL:
+            return self.DB_READ_REPLICA_URL
+        if self.DB_BACKEND != DBBackend.SQLITE or self.DB_FILE in ("", ":memory:"):
+            return None
+        return f"sqlite+aiosqlite:///file:{self.DB_FILE}?mode=ro&uri=true"
+
     model_config = SettingsConfigDict(
         env_file=".env",
         # env_prefix="FASTAPI_TEMPLATE_",
@@ -0,0 +1,324 @@
+"""Fan-out of Hatchet run events to every client watching the same run.
+
+Each watched run has a single `RunWatcher`, which holds one upstream subscription to
+the run events and one log poller, no matter how many clients are watching it.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Generic, TypeVar
+
+from hatchet_sdk.clients.listeners.run_event_listener import StepRunEventType
+from hatchet_sdk.clients.rest.models.v1_task_status import V1TaskStatus
+from hatchet_sdk.clients.rest.models.v1_workflow_run_details import (
+    V1WorkflowRunDetails,
+)
+from loguru import logger
+from pydantic import BaseModel
+
+from app.core.hatchet import ExternalRunner
+
+OutputT = TypeVar("OutputT")
+
+TERMINAL_STATUSES = frozenset(
+    {V1TaskStatus.COMPLETED, V1TaskStatus.FAILED, V1TaskStatus.CANCELLED}
+)
+
+# Run status reached by each event of the upstream subscription, stream events
+# published with `ctx.put_stream` do not change it.
+STREAM_EVENT_STATUSES = {
+    StepRunEventType.STEP_RUN_EVENT_TYPE_STARTED: V1TaskStatus.RUNNING,
+    StepRunEventType.STEP_RUN_EVENT_TYPE_COMPLETED: V1TaskStatus.COMPLETED,
+    StepRunEventType.STEP_RUN_EVENT_TYPE_FAILED: V1TaskStatus.FAILED,
+    StepRunEventType.STEP_RUN_EVENT_TYPE_CANCELLED: V1TaskStatus.CANCELLED,
+    StepRunEventType.STEP_RUN_EVENT_TYPE_TIMED_OUT: V1TaskStatus.FAILED,
+}
+
+
+class TaskResult(BaseModel, Generic[OutputT]):
+    """State of a run once it is over, or when waiting for it timed out.
+
+    Attributes:
+        id: Id of the workflow run.
+        status: Last known status of the run, `None` if it was not read yet.
+        output: Output of the run parsed by the output model of its task, `None`
+            unless the run completed.
+        error: Error message of the run, if it failed.
+    """
+
+    id: str
+    status: V1TaskStatus | None
+    output: OutputT | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class TaskEvent:
+    """One event of a task run.
+
+    Attributes:
+        event: Kind of the event, one of "status", "log", "result" or "error".
+        data: JSON serializable payload of the event.
+    """
+
+    event: str
+    data: dict[str, Any]
+
+
+class RunWatcher:
+    """Follows one run and publishes its events to every subscriber.
+
+    Events are kept, so that subscribers joining late first receive the events they
+    missed. A subscriber queue receives `None` once the run is over. Log lines are
+    only read while at least one subscriber asked for them.
+    """
+
+    def __init__(self, runner: ExternalRunner, run_id: str, log_poll_interval: float):
+        """Initializes the RunWatcher.
+
+        Args:
+            runner: Runner used to read the run.
+            run_id: Id of the workflow run to follow.
+            log_poll_interval: Seconds between two reads of the run log lines.
+        """
+        self.runner = runner
+        self.run_id = run_id
+        self.log_poll_interval = log_poll_interval
+        self.history: list[TaskEvent] = []
+        self.subscribers: set[asyncio.Queue[TaskEvent | None]] = set()
+        self.log_subscribers: set[asyncio.Queue[TaskEvent | None]] = set()
+        self.result: TaskResult | None = None
+        self.done = False
+        self._status: V1TaskStatus | None = None
+        self._task_run_id = run_id
+        # Log cursor, the timestamp of the last published line and the number of
+        # published lines sharing it, which the next read returns again.
+        self._logs_since: datetime | None = None
+        self._logs_at_since = 0
+        self._task: asyncio.Task | None = None
+        self._poller: asyncio.Task | None = None
+        self._following = False
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    def subscribe(self, logs: bool = True) -> asyncio.Queue[TaskEvent | None]:
+        queue: asyncio.Queue[TaskEvent | None] = asyncio.Queue()
+        for event in self.history:
+            queue.put_nowait(event)
+        if self.done:
+            queue.put_nowait(None)
+        self.subscribers.add(queue)
+        if logs:
+            self.log_subscribers.add(queue)
+            self._update_poller()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[TaskEvent | None]) -> None:
+        self.subscribers.discard(queue)
+        self.log_subscribers.discard(queue)
+        self._update_poller()
+
+    def _update_poller(self) -> None:
+        """Poll the log lines only while the run is followed and someone reads them."""
+        polling = self._poller is not None and not self._poller.done()
+        wanted = self._following and bool(self.log_subscribers)
+        if wanted and not polling:
+            self._poller = asyncio.create_task(self._poll_logs())
+        elif polling and not wanted:
+            self._poller.cancel()
+            self._poller = None
+
+    def _publish(self, event: TaskEvent) -> None:
+        self.history.append(event)
+        for queue in self.subscribers:
+            queue.put_nowait(event)
+
+    def _publish_status(self, status: V1TaskStatus) -> None:
+        if status != self._status:
+            self._status = status
+            self._publish(TaskEvent("status", {"status": status.value}))
+
+    def _publish_result(self, details: V1WorkflowRunDetails) -> None:
+        output = None
+        if details.run.status == V1TaskStatus.COMPLETED:
+            output = self.runner.parse_output(details)
+        self.result = TaskResult(
+            id=self.run_id,
+            status=details.run.status,
+            output=output,
+            error=details.run.error_message,
+        )
+        self._publish(
+            TaskEvent("result", self.result.model_dump(mode="json", exclude={"id"}))
+        )
+
+    async def _publish_logs(self) -> None:
+        try:
+            lines = await self.runner.get_logs(self._task_run_id, self._logs_since)
+        except Exception as exc:
+            logger.warning("Failed to read logs of run {}: {}", self.run_id, exc)
+            return
+
+        seen_at_since = 0
+        for line in lines:
+            if self._logs_since is not None and line.created_at < self._logs_since:
+                continue
+            if line.created_at == self._logs_since:
+                seen_at_since += 1
+                if seen_at_since <= self._logs_at_since:
+                    continue
+                self._logs_at_since += 1
+            else:
+                self._logs_since, self._logs_at_since = line.created_at, 1
+                seen_at_since = 1
+            self._publish(
+                TaskEvent(
+                    "log",
+                    {
+                        "message": line.message,
+                        "level": line.level.value if line.level else None,
+                        "created_at": line.created_at.isoformat(),
+                    },
+                )
+            )
+
+    async def _poll_logs(self) -> None:
+        while True:
+            await asyncio.sleep(self.log_poll_interval)
+            await self._publish_logs()
+
+    async def _follow(self) -> None:
+        self._following = True
+        self._update_poller()
+        events = self.runner.stream(self.run_id)
+        try:
+            async for event in events:
+                status = STREAM_EVENT_STATUSES.get(event.type)
+                if status is None:
+                    continue
+                self._publish_status(status)
+                if status in TERMINAL_STATUSES:
+                    break
+        finally:
+            self._following = False
+            self._update_poller()
+            with suppress(Exception):
+                await events.aclose()
+
+    async def _watch(self, details: V1WorkflowRunDetails) -> None:
+        if details.tasks:
+            self._task_run_id = details.tasks[0].task_external_id
+        self._publish_status(details.run.status)
+        if details.run.status not in TERMINAL_STATUSES:
+            await self._follow()
+            details = await self.runner.get_task(self.run_id)
+            self._publish_status(details.run.status)
+        if self.log_subscribers:
+            await self._publish_logs()
+        if details.run.status in TERMINAL_STATUSES:
+            self._publish_result(details)
+        else:
+            self._publish(TaskEvent("error", {"detail": "Lost the task event stream"}))
+
+    async def _run(self) -> None:
+        try:
+            details = await self.runner.get_task(self.run_id)
+        except Exception:
+            self._publish(TaskEvent("error", {"detail": "Task not found"}))
+        else:
+            try:
+                await self._watch(details)
+            except Exception as exc:
+                logger.warning("Failed to follow run {}: {}", self.run_id, exc)
+                self._publish(TaskEvent("error", {"detail": "Failed to follow task"}))
+        finally:
+            self.done = True
+            for queue in self.subscribers:
+                queue.put_nowait(None)
+
+
+class TaskEventHub:
+    """Shares one `RunWatcher` between all the clients watching the same run.
+
+    A watcher starts with its first subscriber and is stopped when its last
+    subscriber leaves. Meant to be used from the event loop only.
+    """
+
+    def __init__(self, runner: ExternalRunner, log_poll_interval: float):
+        """Initializes the TaskEventHub.
+
+        Args:
+            runner: Runner used to read the runs.
+            log_poll_interval: Seconds between two reads of the log lines of a run.
+        """
+        self.runner = runner
+        self.log_poll_interval = log_poll_interval
+        self._watchers: dict[str, RunWatcher] = {}
+
+    def __len__(self) -> int:
+        return len(self._watchers)
+
+    @asynccontextmanager
+    async def subscribe(
+        self, run_id: str, logs: bool = True
+    ) -> AsyncIterator[asyncio.Queue[TaskEvent | None]]:
+        """Subscribe to the events of a run.
+
+        Args:
+            run_id: Id of the workflow run.
+            logs: Whether to receive the log lines of the run, which are only read
+                from Hatchet while a subscriber wants them.
+
+        Yields:
+            Queue receiving the events of the run, then `None` once it is over.
+        """
+        async with self._subscribe(run_id, logs) as (_, queue):
+            yield queue
+
+    @asynccontextmanager
+    async def _subscribe(
+        self, run_id: str, logs: bool
+    ) -> AsyncIterator[tuple[RunWatcher, asyncio.Queue[TaskEvent | None]]]:
+        watcher = self._watchers.get(run_id)
+        if watcher is None:
+            watcher = RunWatcher(self.runner, run_id, self.log_poll_interval)
+            self._watchers[run_id] = watcher
+            watcher.start()
+
+        queue = watcher.subscribe(logs)
+        try:
+            yield watcher, queue
+        finally:
+            watcher.unsubscribe(queue)
+            if not watcher.subscribers:
+                watcher.stop()
+                if self._watchers.get(run_id) is watcher:
+                    del self._watchers[run_id]
+
+    async def wait(self, run_id: str, seconds: float) -> TaskResult | None:
+        """Wait until a run is over, for at most `seconds`.
+
+        Returns:
+            The result of the run, with the output parsed by the output model of its
+            task, or its last known status if it is still running after `seconds`.
+            `None` if the run does not exist.
+        """
+        status: V1TaskStatus | None = None
+        async with self._subscribe(run_id, logs=False) as (watcher, queue):
+            with suppress(TimeoutError):
+                async with asyncio.timeout(seconds):
+                    while (event := await queue.get()) is not None:
+                        if event.event == "status":
+                            status = V1TaskStatus(event.data["status"])
+                        elif event.event == "result":
+                            return watcher.result
+                        elif event.event == "error" and status is None:
+                            return None
+        return TaskResult(id=run_id, status=status)
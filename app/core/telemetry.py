@@ -1,28 +1,20 @@
 from importlib import import_module
+from typing import Any
 
-import logfire
 from api_shared.core.settings import OLTPLogMethod
 from api_shared.utils.general import is_module_installed
 from fastapi import FastAPI
 from loguru import logger  # noqa: F401
-from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
-from opentelemetry.sdk.resources import (
-    DEPLOYMENT_ENVIRONMENT,
-    SERVICE_NAME,
-    TELEMETRY_SDK_LANGUAGE,
-    Resource,
-)
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from prometheus_fastapi_instrumentator.instrumentation import (
     PrometheusFastApiInstrumentator,
 )
 
 from app.core.settings import settings
 
+# NOTE: Telemetry backends (logfire, langfuse, OpenTelemetry SDK, exporters and
+# instrumentors) take seconds to import. They are imported only once the matching
+# OLTP_LOG_METHOD is selected, so that `none` pays nothing at startup.
+
 
 def _configure_langfuse_or_raise() -> None:
     if not is_module_installed("langfuse"):  # pragma: no cover
@@ -34,6 +26,68 @@ def _configure_langfuse_or_raise() -> None:
     import_module("langfuse").Langfuse()
 
 
+def _instrument_app(app: FastAPI, tracer_provider: Any, excluded_urls: str) -> None:
+    fastapi_instrumentation = import_module("opentelemetry.instrumentation.fastapi")
+    fastapi_instrumentation.FastAPIInstrumentor.instrument_app(
+        app, tracer_provider=tracer_provider, excluded_urls=excluded_urls
+    )
+
+    if settings.OLTP_STD_LOGGING_ENABLED is True:
+        logging_instrumentation = import_module("opentelemetry.instrumentation.logging")
+        logging_instrumentation.LoggingInstrumentor().instrument(
+            tracer_provider=tracer_provider
+        )
+
+
+def _setup_logfire(app: FastAPI, excluded_urls: str) -> None:
+    logfire = import_module("logfire")
+    logfire.configure(environment=settings.ENVIRONMENT.value)
+    logfire.instrument_system_metrics()
+    logfire.instrument_httpx()
+    logfire.instrument_fastapi(app, excluded_urls=excluded_urls)
+
+    # FIXME: Breaks the loguru logger format. Fix this
+    # if settings.OLTP_STD_LOGGING_ENABLED is True:
+    #     logger.configure(handlers=[logfire.loguru_handler()])
+
+
+def _setup_langfuse(app: FastAPI, excluded_urls: str) -> None:
+    _configure_langfuse_or_raise()
+    tracer_provider = import_module("opentelemetry.trace").get_tracer_provider()
+    _instrument_app(app, tracer_provider=tracer_provider, excluded_urls=excluded_urls)
+
+
+def _setup_otlp(app: FastAPI, excluded_urls: str) -> None:
+    trace = import_module("opentelemetry.trace")
+    resources = import_module("opentelemetry.sdk.resources")
+    sdk_trace = import_module("opentelemetry.sdk.trace")
+    sdk_trace_export = import_module("opentelemetry.sdk.trace.export")
+    grpc_exporter = import_module(
+        "opentelemetry.exporter.otlp.proto.grpc.trace_exporter"
+    )
+
+    resource = resources.Resource(
+        attributes={
+            resources.SERVICE_NAME: settings.PROJECT_NAME,
+            resources.TELEMETRY_SDK_LANGUAGE: "python",
+            resources.DEPLOYMENT_ENVIRONMENT: settings.ENVIRONMENT,
+        },
+    )
+
+    trace_provider = sdk_trace.TracerProvider(resource=resource)
+
+    otlp_exporter = grpc_exporter.OTLPSpanExporter(
+        endpoint=settings.OTLP_ENDPOINT, insecure=True
+    )
+    trace_provider.add_span_processor(
+        sdk_trace_export.BatchSpanProcessor(otlp_exporter)
+    )
+
+    _instrument_app(app, tracer_provider=trace_provider, excluded_urls=excluded_urls)
+
+    trace.set_tracer_provider(trace_provider)
+
+
 def setup_opentelemetry(app):  # pragma: no cover
     """Setup OpenTelemetry instrumentation for FastAPI."""
     if settings.OLTP_LOG_METHOD == OLTPLogMethod.NONE:
@@ -50,50 +104,11 @@ def setup_opentelemetry(app):  # pragma: no cover
     excluded_urls = ",".join(excluded_endpoints)
 
     if settings.OLTP_LOG_METHOD == OLTPLogMethod.LOGFIRE:
-        logfire.configure(environment=settings.ENVIRONMENT.value)
-        logfire.instrument_system_metrics()
-        logfire.instrument_httpx()
-        logfire.instrument_fastapi(app, excluded_urls=excluded_urls)
-
-        # FIXME: Breaks the loguru logger format. Fix this
-        # if settings.OLTP_STD_LOGGING_ENABLED is True:
-        #     logger.configure(handlers=[logfire.loguru_handler()])
-
-        return
-
-    if settings.OLTP_LOG_METHOD == OLTPLogMethod.LANGFUSE:
-        _configure_langfuse_or_raise()
-        tracer_provider = trace.get_tracer_provider()
-        FastAPIInstrumentor.instrument_app(
-            app,
-            tracer_provider=tracer_provider,
-            excluded_urls=excluded_urls,
-        )
-        if settings.OLTP_STD_LOGGING_ENABLED is True:
-            LoggingInstrumentor().instrument(tracer_provider=tracer_provider)
-        return
-
-    resource = Resource(
-        attributes={
-            SERVICE_NAME: settings.PROJECT_NAME,
-            TELEMETRY_SDK_LANGUAGE: "python",
-            DEPLOYMENT_ENVIRONMENT: settings.ENVIRONMENT,
-        },
-    )
-
-    trace_provider = TracerProvider(resource=resource)
-
-    otlp_exporter = OTLPSpanExporter(endpoint=settings.OTLP_ENDPOINT, insecure=True)
-    trace_provider.add_span_processor(BatchSpanProcessor(otlp_exporter))
-
-    FastAPIInstrumentor.instrument_app(
-        app, tracer_provider=trace_provider, excluded_urls=excluded_urls
-    )
-
-    if settings.OLTP_STD_LOGGING_ENABLED is True:
-        LoggingInstrumentor().instrument(tracer_provider=trace_provider)
-
-    trace.set_tracer_provider(trace_provider)
+        _setup_logfire(app, excluded_urls)
+    elif settings.OLTP_LOG_METHOD == OLTPLogMethod.LANGFUSE:
+        _setup_langfuse(app, excluded_urls)
+    else:
+        _setup_otlp(app, excluded_urls)
 
 
 def stop_opentelemetry(app: FastAPI) -> None:  # pragma: no cover
@@ -101,7 +116,8 @@ def stop_opentelemetry(app: FastAPI) -> None:  # pragma: no cover
     if settings.OLTP_LOG_METHOD in [OLTPLogMethod.NONE, OLTPLogMethod.LOGFIRE]:
         return
 
-    FastAPIInstrumentor().uninstrument_app(app)
+    fastapi_instrumentation = import_module("opentelemetry.instrumentation.fastapi")
+    fastapi_instrumentation.FastAPIInstrumentor().uninstrument_app(app)
 
 
 def setup_prometheus(app: FastAPI) -> None:  # pragma: no cover
@@ -3,19 +3,28 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
+from app.db.session import discard_after_commit, has_writes, run_after_commit
+
 
 async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Create and get database session.
 
-    Commits on success, rolls back on any exception, and always closes the session.
+    The session checks out a connection on its first statement only, so requests that
+    never touch it (e.g. served from a cache) do not hold one. Commits on success if
+    anything was written, rolls back on any exception, and always closes the session.
+    Callbacks registered with `add_after_commit` run once the commit succeeded.
     """
     session: AsyncSession = request.app.state.db_session_factory()
 
     try:
         yield session
-        await session.commit()
+        if has_writes(session.sync_session):
+            await session.commit()
     except Exception:
         await session.rollback()
+        discard_after_commit(session.sync_session)
         raise
     finally:
         await session.close()
+
+    await run_after_commit(session.sync_session)
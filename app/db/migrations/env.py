@@ -5,6 +5,11 @@ from alembic import context
 from sqlalchemy.ext.asyncio.engine import create_async_engine
 from sqlalchemy.future import Connection
 
+from app.api.items.models import (
+    ITEM_PREFIX_POSTGRES_INDEXES,
+    ITEM_SEARCH_INDEX,
+    ITEM_SEARCH_TABLE,
+)
 from app.core.settings import settings
 from app.db.meta import meta
 from app.db.utils import load_all_db_models
@@ -33,6 +38,17 @@ target_metadata = meta
 # ... etc.
 
 
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Keep autogenerate away from the hand written search and prefix objects."""
+    if reflected and compare_to is None and name:
+        return not (
+            name.startswith(ITEM_SEARCH_TABLE)
+            or name == ITEM_SEARCH_INDEX
+            or name in ITEM_PREFIX_POSTGRES_INDEXES
+        )
+    return True
+
+
 async def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -48,6 +64,7 @@ async def run_migrations_offline() -> None:
     context.configure(
         url=settings.DB_URL,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -62,7 +79,11 @@ def do_run_migrations(connection: Connection) -> None:
 
     :param connection: connection to the database.
     """
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -83,6 +104,9 @@ async def run_migrations_online() -> None:
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
 
+    # aiosqlite runs connections on threads that keep the process alive until closed.
+    await connectable.dispose()
+
 
 loop = asyncio.get_event_loop()
 if context.is_offline_mode():
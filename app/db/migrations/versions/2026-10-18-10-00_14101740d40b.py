@@ -0,0 +1,47 @@
+"""Numeric item price and item indexes.
+
+Revision ID: 14101740d40b
+Revises: 4055da6b4d80
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "14101740d40b"
+down_revision = "4055da6b4d80"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    # Batch mode recreates the table on SQLite, which can not alter column types.
+    with op.batch_alter_table("item") as batch_op:
+        batch_op.alter_column(
+            "price",
+            existing_type=sa.String(length=200),
+            type_=sa.Float(),
+            postgresql_using="price::double precision",
+        )
+
+    op.create_index("ix_item_name_id", "item", ["name", "id"])
+    op.create_index("ix_item_description_id", "item", ["description", "id"])
+    op.create_index("ix_item_price_id", "item", ["price", "id"])
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index("ix_item_price_id", table_name="item")
+    op.drop_index("ix_item_description_id", table_name="item")
+    op.drop_index("ix_item_name_id", table_name="item")
+
+    with op.batch_alter_table("item") as batch_op:
+        batch_op.alter_column(
+            "price",
+            existing_type=sa.Float(),
+            type_=sa.String(length=200),
+            postgresql_using="price::varchar(200)",
+        )
@@ -0,0 +1,78 @@
+"""Full-text search index over item names and descriptions.
+
+Revision ID: 5c1f0d9e2a6b
+Revises: 14101740d40b
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5c1f0d9e2a6b"
+down_revision = "14101740d40b"
+branch_labels = None
+depends_on = None
+
+# DDL as of this revision, copied rather than imported so that later changes to the
+# models do not rewrite the history.
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE item_fts USING fts5(
+        name, description, content='item', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER item_fts_ai AFTER INSERT ON item BEGIN
+        INSERT INTO item_fts(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER item_fts_ad AFTER DELETE ON item BEGIN
+        INSERT INTO item_fts(item_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER item_fts_au AFTER UPDATE OF name, description ON item
+    BEGIN
+        INSERT INTO item_fts(item_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO item_fts(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+]
+POSTGRES_DDL = [
+    """
+    CREATE INDEX ix_item_search ON item USING gin (
+        to_tsvector('simple'::regconfig,
+                    coalesce(name, '') || ' ' || coalesce(description, ''))
+    )
+    """,
+]
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    dialect = op.get_bind().dialect.name
+    ddl = {"sqlite": SQLITE_DDL, "postgresql": POSTGRES_DDL}
+    for statement in ddl.get(dialect, []):
+        op.execute(statement)
+
+    if dialect == "sqlite":
+        # Index the rows that existed before the triggers.
+        op.execute("INSERT INTO item_fts(item_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for trigger in ("ai", "ad", "au"):
+            op.execute(f"DROP TRIGGER IF EXISTS item_fts_{trigger}")
+        op.execute("DROP TABLE IF EXISTS item_fts")
+    elif dialect == "postgresql":
+        op.drop_index("ix_item_search", table_name="item")
@@ -0,0 +1,38 @@
+"""Item indexes serving prefix filters on Postgres.
+
+Revision ID: 9b4e7c2d1f3a
+Revises: 5c1f0d9e2a6b
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b4e7c2d1f3a"
+down_revision = "5c1f0d9e2a6b"
+branch_labels = None
+depends_on = None
+
+# Prefix filters compare in the "C" collation on Postgres. SQLite compares bytes
+# already, its existing indexes serve them.
+POSTGRES_INDEXES = {
+    "ix_item_name_c_id": "name",
+    "ix_item_description_c_id": "description",
+}
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for index, column in POSTGRES_INDEXES.items():
+        op.execute(f'CREATE INDEX {index} ON item ({column} COLLATE "C", id)')
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for index in POSTGRES_INDEXES:
+        op.drop_index(index, table_name="item")
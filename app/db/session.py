@@ -0,0 +1,76 @@
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import Select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+WROTE_KEY = "wrote"
+AFTER_COMMIT_KEY = "after_commit"
+
+
+class RoutingSession(Session):
+    """Session sending plain reads to a read-only engine and the rest to the primary.
+
+    Once the session flushed or executed anything other than a `SELECT`, it sticks to
+    the primary for the rest of its life, so a request always reads its own writes.
+    `SELECT ... FOR UPDATE` is treated as a write.
+    """
+
+    def __init__(self, *args: Any, read_bind: Engine | None = None, **kwargs: Any):
+        """Initialize the session.
+
+        Args:
+            args: Positional arguments of `Session`.
+            read_bind: Engine used for reads, `None` sends everything to the primary.
+            kwargs: Keyword arguments of `Session`.
+        """
+        super().__init__(*args, **kwargs)
+        self.read_bind = read_bind
+
+    def get_bind(
+        self, mapper: Any = None, clause: Any = None, **kwargs: Any
+    ) -> Engine | Connection:
+        is_read = (
+            not self._flushing
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        )
+        if not is_read:
+            self.info[WROTE_KEY] = True
+        elif self.read_bind is not None and not self.info.get(WROTE_KEY):
+            return self.read_bind
+
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+def has_writes(session: Session) -> bool:
+    """Check whether a session wrote, or has pending changes to write, on commit.
+
+    Sessions other than `RoutingSession` do not track their writes and are always
+    assumed to have written.
+    """
+    if not isinstance(session, RoutingSession):
+        return True
+    return bool(
+        session.info.get(WROTE_KEY) or session.new or session.dirty or session.deleted
+    )
+
+
+def add_after_commit(session: Session, callback: Callable[[], Awaitable[None]]) -> None:
+    """Register a callback to run once the session's transaction is committed.
+
+    Callbacks are run by `run_after_commit`, in registration order, and dropped by
+    `discard_after_commit` when the transaction is rolled back.
+    """
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+
+async def run_after_commit(session: Session) -> None:
+    """Run, then forget, the callbacks registered with `add_after_commit`."""
+    for callback in session.info.pop(AFTER_COMMIT_KEY, []):
+        await callback()
+
+
+def discard_after_commit(session: Session) -> None:
+    """Forget the callbacks registered with `add_after_commit` without running them."""
+    session.info.pop(AFTER_COMMIT_KEY, None)
@@ -1,44 +1,193 @@
 import importlib
+import time
 from pathlib import Path
+from typing import Any
 
 import anyio
 from fastapi import FastAPI
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
-from app.core.settings import settings
+from app.core.metrics import DB_CONNECTION_CHECKOUTS, DB_CONNECTION_HOLD_DURATION
+from app.core.settings import DBBackend, settings
+from app.db.session import RoutingSession
+
+
+def _maintenance_engine() -> AsyncEngine:
+    """Engine on the server's `postgres` database, to create or drop ours."""
+    url = make_url(settings.DB_URL).set(database="postgres")
+    return create_async_engine(url, isolation_level="AUTOCOMMIT")
 
 
 async def create_database() -> None:
     """Create a database."""
+    if settings.DB_BACKEND != DBBackend.POSTGRES:
+        # SQLite creates the file on first connection.
+        return
+
+    engine = _maintenance_engine()
+    try:
+        async with engine.connect() as conn:
+            exists = await conn.scalar(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": settings.DB_NAME},
+            )
+            if not exists:
+                await conn.execute(text(f'CREATE DATABASE "{settings.DB_NAME}"'))
+    finally:
+        await engine.dispose()
 
 
 async def drop_database() -> None:
     """Drop current database."""
+    if settings.DB_BACKEND == DBBackend.POSTGRES:
+        engine = _maintenance_engine()
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(
+                    text(f'DROP DATABASE IF EXISTS "{settings.DB_NAME}" WITH (FORCE)')
+                )
+        finally:
+            await engine.dispose()
+        return
+
     db_path = anyio.Path(settings.DB_FILE)
     if await db_path.exists():
         await db_path.unlink()
 
 
+def sqlite_pragmas() -> dict[str, Any]:
+    """Return the SQLite pragmas applied to every new connection."""
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE.value,
+        "synchronous": settings.SQLITE_SYNCHRONOUS.value,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE.value,
+    }
+
+
+def _set_sqlite_pragmas(pragmas: dict[str, Any]):
+    def on_connect(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return on_connect
+
+
+def _record_connection_hold_time(engine: AsyncEngine, name: str) -> None:
+    @event.listens_for(engine.sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        DB_CONNECTION_CHECKOUTS.labels(name).inc()
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            DB_CONNECTION_HOLD_DURATION.labels(name).observe(
+                time.perf_counter() - checked_out_at
+            )
+
+
+def create_db_engine(
+    url: str | None = None,
+    pragmas: dict[str, Any] | None = None,
+    name: str = "primary",
+    **kwargs: Any,
+) -> AsyncEngine:
+    """Create an async engine configured from settings.
+
+    Postgres and file based SQLite databases get a sized connection pool. SQLite
+    connections get the pragmas of the SQLite profile applied on connect, in-memory
+    databases keep SQLAlchemy's single connection pool.
+
+    Args:
+        url: Database URL, defaults to `settings.DB_URL`.
+        pragmas: SQLite pragmas, defaults to `sqlite_pragmas()`.
+        name: Name of the engine, used as the `engine` label of the pool metrics.
+        kwargs: Extra arguments for `create_async_engine`.
+
+    Returns:
+        The engine.
+    """
+    url = url or settings.DB_URL
+    sqlalchemy_url = make_url(url)
+    is_sqlite = sqlalchemy_url.get_backend_name() == "sqlite"
+    in_memory = is_sqlite and sqlalchemy_url.database in (None, "", ":memory:")
+
+    options: dict[str, Any] = {"echo": settings.DB_ECHO}
+    if not in_memory:
+        options |= {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        }
+    if sqlalchemy_url.get_backend_name() == "postgresql":
+        options["connect_args"] = {
+            "command_timeout": settings.DB_COMMAND_TIMEOUT_SECONDS
+        }
+    engine = create_async_engine(url, **(options | kwargs))
+
+    if is_sqlite:
+        event.listen(
+            engine.sync_engine,
+            "connect",
+            _set_sqlite_pragmas(sqlite_pragmas() if pragmas is None else pragmas),
+        )
+    _record_connection_hold_time(engine, name)
+    return engine
+
+
+def create_read_db_engine(url: str | None = None) -> AsyncEngine | None:
+    """Create the engine used for reads, see `RoutingSession`.
+
+    Args:
+        url: Read-only database URL, defaults to `settings.DB_READ_URL`.
+
+    Returns:
+        The engine, or `None` if reads are served by the primary engine.
+    """
+    url = url or settings.DB_READ_URL
+    if url is None:
+        return None
+
+    # Changing the journal mode is a write, a read-only handle can not do it.
+    pragmas = sqlite_pragmas()
+    pragmas.pop("journal_mode")
+    return create_db_engine(
+        url, pragmas=pragmas, name="read", pool_size=settings.DB_READ_POOL_SIZE
+    )
+
+
 def setup_db(app: FastAPI) -> None:  # pragma: no cover
     """Creates connection to the database.
 
-    This function creates SQLAlchemy engine instance,
-    session_factory for creating sessions
+    This function creates SQLAlchemy engine instance, a read-only engine when reads
+    can be split from writes, session_factory for creating sessions
     and stores them in the application's state property.
 
     Args:
         FastAPI application instance.
     """
-    engine = create_async_engine(
-        settings.DB_URL,
-        echo=settings.DB_ECHO,
-        # connect_args={"check_same_thread": True},
-    )
+    engine = create_db_engine()
+    read_engine = create_read_db_engine()
     session_factory = async_sessionmaker(
         engine,
         expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        read_bind=read_engine.sync_engine if read_engine else None,
     )
     app.state.db_engine = engine
+    app.state.db_read_engine = read_engine
     app.state.db_session_factory = session_factory
 
 
@@ -0,0 +1,100 @@
+"""Pick Argon2 parameters that hit a login latency budget on this host.
+
+Usage: `python -m app.scripts.calibrate_password_hash --target-ms 250`
+"""
+
+import argparse
+import statistics
+import time
+
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from app.core.settings import settings
+
+PASSWORD = "calibration-password"
+
+
+def measure_hash_latency(hasher: Argon2Hasher, rounds: int) -> float:
+    """Return the median latency of hashing a password in milliseconds."""
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        hasher.hash(PASSWORD)
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def calibrate(
+    target_ms: float, memory_cost: int, parallelism: int, rounds: int = 5
+) -> tuple[int, float]:
+    """Find the highest Argon2 time cost whose median latency fits the budget.
+
+    Memory cost and parallelism are kept fixed, the time cost is raised until hashing
+    exceeds `target_ms`. A time cost of 1 is returned even if it is over budget, in
+    which case the memory cost should be lowered instead.
+
+    Returns:
+        The chosen time cost and its median latency in milliseconds.
+    """
+    time_cost = 1
+    latency = measure_hash_latency(
+        Argon2Hasher(time_cost=1, memory_cost=memory_cost, parallelism=parallelism),
+        rounds,
+    )
+    while True:
+        next_latency = measure_hash_latency(
+            Argon2Hasher(
+                time_cost=time_cost + 1,
+                memory_cost=memory_cost,
+                parallelism=parallelism,
+            ),
+            rounds,
+        )
+        if next_latency > target_ms:
+            return time_cost, latency
+        time_cost, latency = time_cost + 1, next_latency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=250,
+        help="Login hashing latency budget in milliseconds.",
+    )
+    parser.add_argument(
+        "--memory-cost",
+        type=int,
+        default=settings.PASSWORD_HASH_MEMORY_COST,
+        help="Argon2 memory cost in KiB.",
+    )
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=settings.PASSWORD_HASH_PARALLELISM,
+        help="Argon2 parallelism.",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="Hashes measured per candidate."
+    )
+    args = parser.parse_args()
+
+    time_cost, latency = calibrate(
+        target_ms=args.target_ms,
+        memory_cost=args.memory_cost,
+        parallelism=args.parallelism,
+        rounds=args.rounds,
+    )
+    if latency > args.target_ms:
+        print(  # noqa: T201
+            f"# Even time_cost=1 takes {latency:.1f}ms, lower --memory-cost."
+        )
+    print(f"# Median hash latency: {latency:.1f}ms")  # noqa: T201
+    print(f"PASSWORD_HASH_TIME_COST={time_cost}")  # noqa: T201
+    print(f"PASSWORD_HASH_MEMORY_COST={args.memory_cost}")  # noqa: T201
+    print(f"PASSWORD_HASH_PARALLELISM={args.parallelism}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Profile the cold start of the API: imports, `get_app()` and the lifespan.
+
+Usage: `python -m app.scripts.profile_startup --top 20`
+
+The measurement runs in a fresh interpreter started with `-X importtime`, so that
+module caches of the current process do not hide import costs.
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from importlib import import_module
+
+MEASURE_FLAG = "--measure"
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    """Import time of a single module as reported by `-X importtime`.
+
+    Attributes:
+        module: Fully qualified module name.
+        self_us: Time spent executing the module itself, in microseconds.
+        cumulative_us: Time including the module's own imports, in microseconds.
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """Parse the stderr output of `python -X importtime`."""
+    times = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():  # Header line
+            continue
+        times.append(
+            ImportTime(
+                module=module.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+            )
+        )
+    return times
+
+
+def _measure() -> None:
+    """Time imports, `get_app()` and the lifespan, print them as JSON on stdout."""
+    timings = {}
+
+    start = time.perf_counter()
+    application = import_module("app.api.application")
+    timings["import"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    app = application.get_app()
+    timings["get_app"] = time.perf_counter() - start
+
+    async def run_lifespan() -> None:
+        start = time.perf_counter()
+        async with app.router.lifespan_context(app):
+            timings["lifespan_startup"] = time.perf_counter() - start
+            start = time.perf_counter()
+        timings["lifespan_shutdown"] = time.perf_counter() - start
+
+    error = None
+    try:
+        asyncio.run(run_lifespan())
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    print(json.dumps({"timings": timings, "lifespan_error": error}))  # noqa: T201
+
+
+def profile_startup() -> tuple[dict, list[ImportTime]]:
+    """Run the measurement in a fresh interpreter.
+
+    Returns:
+        The wall-clock report and the import times of every imported module.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-m",
+            "app.scripts.profile_startup",
+            MEASURE_FLAG,
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return report, parse_importtime(result.stderr)
+
+
+def _top_level_packages(times: list[ImportTime]) -> dict[str, int]:
+    totals: dict[str, int] = {}
+    for item in times:
+        package = item.module.split(".")[0]
+        totals[package] = totals.get(package, 0) + item.self_us
+    return totals
+
+
+def main() -> None:
+    if MEASURE_FLAG in sys.argv:
+        _measure()
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--top", type=int, default=15, help="Number of offenders to report."
+    )
+    args = parser.parse_args()
+
+    report, times = profile_startup()
+
+    print("Wall-clock time:")  # noqa: T201
+    for name, seconds in report["timings"].items():
+        print(f"  {name:<20} {seconds * 1000:>10.1f} ms")  # noqa: T201
+    if report["lifespan_error"]:
+        print(f"  lifespan failed: {report['lifespan_error']}")  # noqa: T201
+
+    print(f"\nTop {args.top} packages by import time:")  # noqa: T201
+    packages = sorted(
+        _top_level_packages(times).items(), key=lambda item: item[1], reverse=True
+    )
+    for package, self_us in packages[: args.top]:
+        print(f"  {package:<50} {self_us / 1000:>10.1f} ms")  # noqa: T201
+
+    print(f"\nTop {args.top} modules by self import time:")  # noqa: T201
+    for item in sorted(times, key=lambda item: item.self_us, reverse=True)[: args.top]:
+        print(f"  {item.module:<50} {item.self_us / 1000:>10.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,20 @@
 import pytest
+from app.api.auth.utils import (
+    cache_principal,
+    get_cached_principal,
+    password_needs_rehash,
+    verify_password,
+)
+from app.api.users.models import UserModel
+from app.api.users.repository import UserRepository
+from app.api.users.schemas import User
+from app.api.users.service import UserService
+from app.db.session import run_after_commit
 from fastapi import FastAPI
 from httpx import AsyncClient
+from pwdlib.hashers.argon2 import Argon2Hasher
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from starlette import status
 
 
@@ -26,6 +40,48 @@ async def test_login(
     assert data["token_type"] == "bearer"
 
 
+@pytest.mark.anyio
+async def test_login_upgrades_outdated_password_hash(
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+    dbsession: AsyncSession,
+) -> None:
+    """Test that a hash made with outdated parameters is replaced after login.
+
+    Args:
+        fastapi_app: current application fixture.
+        client: client fixture.
+        dbsession: database session shared with the application.
+    """
+    outdated_hash = Argon2Hasher(time_cost=1, memory_cost=8, parallelism=1).hash(
+        "password"
+    )
+    assert password_needs_rehash(outdated_hash)
+    await dbsession.execute(
+        update(UserModel).where(UserModel.id == 1).values(hashed_password=outdated_hash)
+    )
+    # The background task opens its own session, bind it to the test transaction.
+    fastapi_app.state.db_session_factory = async_sessionmaker(
+        dbsession.bind, expire_on_commit=False
+    )
+
+    url = fastapi_app.url_path_for("login_access_token")
+    response = await client.post(
+        url,
+        data={"username": "john@example.com", "password": "password"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    new_hash = await dbsession.scalar(
+        select(UserModel.hashed_password)
+        .where(UserModel.id == 1)
+        .execution_options(populate_existing=True)
+    )
+    assert new_hash != outdated_hash
+    assert not password_needs_rehash(new_hash)
+    assert verify_password("password", new_hash)
+
+
 @pytest.mark.anyio
 async def test_login_incorrect_password(
     fastapi_app: FastAPI,
@@ -119,3 +175,54 @@ async def test_test_token(
     assert data["id"] == 1
     assert data["email"] == "john@example.com"
     assert data["name"] == "John Doe"
+
+
+@pytest.mark.anyio
+async def test_current_user_is_cached_until_updated(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+    dbsession: AsyncSession,
+) -> None:
+    """Test that the authenticated user is cached and invalidated on update.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+        dbsession: database session shared with the application.
+    """
+    me_url = fastapi_app.url_path_for("get_current_user_info")
+    response = await client_authenticated.get(me_url)
+    assert response.json()["name"] == "John Doe"
+
+    # Bypass the service: the cached principal must be served without a lookup.
+    await dbsession.execute(
+        update(UserModel).where(UserModel.id == 1).values(name="Changed in DB")
+    )
+    response = await client_authenticated.get(me_url)
+    assert response.json()["name"] == "John Doe"
+
+    update_url = fastapi_app.url_path_for("update_user", user_id=1)
+    await client_authenticated.put(update_url, json={"name": "John Updated"})
+    response = await client_authenticated.get(me_url)
+    assert response.json()["name"] == "John Updated"
+
+
+@pytest.mark.anyio
+async def test_deleted_user_principal_is_invalidated_after_commit(
+    fastapi_app: FastAPI,
+    dbsession: AsyncSession,
+) -> None:
+    """Test that a principal cached again before the commit is dropped on commit.
+
+    Args:
+        fastapi_app: current application fixture.
+        dbsession: database session shared with the application.
+    """
+    await UserService(UserRepository(dbsession)).delete_user(2)
+
+    # A concurrent request still sees the committed user and caches it again.
+    cache_principal("2", None, User(id=2, name="Jane Doe", email="jane@example.com"))
+    assert get_cached_principal("2", None) is not None
+
+    await run_after_commit(dbsession.sync_session)
+    assert get_cached_principal("2", None) is None
@@ -0,0 +1,48 @@
+import asyncio
+import threading
+
+import pytest
+from app.api.auth.service import PasswordHashService
+from app.api.auth.utils import get_password_hash
+from app.common.base_exceptions import ServiceUnavailableError
+from app.core.metrics import PASSWORD_HASH_POOL_REJECTED
+
+
+@pytest.mark.anyio
+async def test_password_hash_service_roundtrip():
+    """Test hashing and verification through the worker pool."""
+    service = PasswordHashService(max_workers=1, max_queue=1)
+
+    hashed_password = await service.hash("secret_password")
+
+    assert await service.verify("secret_password", hashed_password) is True
+    assert await service.verify("wrong_password", hashed_password) is False
+    assert service.pending == 0
+
+
+@pytest.mark.anyio
+async def test_password_hash_service_rejects_when_saturated():
+    """Test that jobs beyond workers plus queue are rejected with a 503."""
+    service = PasswordHashService(max_workers=1, max_queue=1)
+    release = threading.Event()
+    rejected = PASSWORD_HASH_POOL_REJECTED._value.get()
+
+    def blocking_hash(password: str) -> str:
+        release.wait(timeout=5)
+        return get_password_hash(password)
+
+    running = [
+        asyncio.create_task(service._run("hash", blocking_hash, "password"))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    assert service.pending == 2
+
+    with pytest.raises(ServiceUnavailableError) as exc_info:
+        await service.hash("password")
+    assert exc_info.value.status_code == 503
+    assert PASSWORD_HASH_POOL_REJECTED._value.get() == rejected + 1
+
+    release.set()
+    await asyncio.gather(*running)
+    assert service.pending == 0
@@ -1,11 +1,19 @@
+import logging
+import time
 from datetime import timedelta
 
+import jwt
 import pytest
 from app.api.auth.utils import (
     create_access_token,
+    decode_access_token,
     get_password_hash,
+    token_cache,
     verify_password,
 )
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
 
 
 def test_password_hashing():
@@ -29,3 +37,75 @@ def test_create_access_token(expires_delta):
     token = create_access_token(subject="test_user_id", expires_delta=expires_delta)
     assert isinstance(token, str)
     assert len(token) > 0
+
+
+def test_decode_access_token_cache():
+    """Test that verified tokens are cached and that forged tokens are not."""
+    token_cache.clear()
+    token = create_access_token(subject="42")
+
+    assert decode_access_token(token)["sub"] == "42"
+    assert len(token_cache) == 1
+    # Callers may mutate the payload, the cached copy must stay intact.
+    decode_access_token(token)["sub"] = "mutated"
+    assert decode_access_token(token)["sub"] == "42"
+
+    with pytest.raises(jwt.exceptions.InvalidTokenError):
+        decode_access_token(token[:-2] + ("AA" if token[-2:] != "AA" else "BB"))
+
+    expired = create_access_token(subject="42", expires_delta=timedelta(seconds=-1))
+    with pytest.raises(jwt.exceptions.ExpiredSignatureError):
+        decode_access_token(expired)
+
+
+def test_decode_access_token_cache_skips_verification(monkeypatch):
+    """Test that repeated requests with one token verify its signature only once."""
+    token_cache.clear()
+    token = create_access_token(subject="42")
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+
+    for _ in range(100):
+        assert decode_access_token(token)["sub"] == "42"
+
+    assert calls == [token]
+
+
+def test_decode_access_token_cache_benchmark():
+    """Benchmark per-request verification cost with and without the token cache.
+
+    Only reports the numbers, wall-clock timings are too noisy to assert on.
+    """
+    rounds = 500
+    token = create_access_token(subject="42")
+
+    def best_per_call(func) -> float:
+        # Best of a few batches, so a noisy neighbour does not skew the numbers.
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                func()
+            timings.append((time.perf_counter() - start) / rounds)
+        return min(timings)
+
+    uncached = best_per_call(
+        lambda: jwt.decode(
+            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+        )
+    )
+    decode_access_token(token)
+    cached = best_per_call(lambda: decode_access_token(token))
+
+    logger.info(
+        "JWT %s verification per request: uncached=%.1fus cached=%.1fus",
+        settings.JWT_ALGORITHM,
+        uncached * 1e6,
+        cached * 1e6,
+    )
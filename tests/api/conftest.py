@@ -1,49 +1,101 @@
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
 
 import pytest
-from app.api.tasks.deps import get_runner
+from app.api.tasks.config import TASKS, TASKS_EVENTS_LOG_POLL_SECONDS
+from app.api.tasks.deps import get_runner, get_task_events
+from app.core.hatchet import ExternalRunner
+from app.core.task_events import TaskEventHub
 from fastapi import FastAPI
+from hatchet_sdk.clients.listeners.run_event_listener import (
+    StepRunEvent,
+    StepRunEventType,
+)
 from hatchet_sdk.clients.rest.models.api_resource_meta import APIResourceMeta
+from hatchet_sdk.clients.rest.models.v1_log_line import V1LogLine
+from hatchet_sdk.clients.rest.models.v1_log_line_list import V1LogLineList
 from hatchet_sdk.clients.rest.models.v1_task_status import V1TaskStatus
+from hatchet_sdk.clients.rest.models.v1_task_summary import V1TaskSummary
 from hatchet_sdk.clients.rest.models.v1_workflow_run import V1WorkflowRun
 from hatchet_sdk.clients.rest.models.v1_workflow_run_details import V1WorkflowRunDetails
+from hatchet_sdk.clients.rest.models.v1_workflow_type import V1WorkflowType
+
+_TENANT_ID = "00000000-0000-0000-0000-000000000000"
+_TASK_EXTERNAL_ID = "00000000-0000-0000-0000-000000000001"
+_STREAM_EVENT_STATUSES = {
+    StepRunEventType.STEP_RUN_EVENT_TYPE_STARTED: V1TaskStatus.RUNNING,
+    StepRunEventType.STEP_RUN_EVENT_TYPE_COMPLETED: V1TaskStatus.COMPLETED,
+    StepRunEventType.STEP_RUN_EVENT_TYPE_FAILED: V1TaskStatus.FAILED,
+}
 
 
 @dataclass
 class FakeRunRef:
     workflow_run_id: str
     result_payload: Any = None
+    runs: "FakeRuns | None" = None
 
     async def aio_result(self) -> Any:
         return self.result_payload
 
+    def stream(self) -> AsyncIterator[StepRunEvent]:
+        assert self.runs is not None
+        return self.runs.stream(self.workflow_run_id)
+
 
 class FakeStub:
     def __init__(self, workflow_run_id: str):
         self._workflow_run_id = workflow_run_id
         self.last_input: Any = None
+        self.bulk_calls: list[list[Any]] = []
 
     async def aio_run_no_wait(self, input: Any) -> FakeRunRef:
         self.last_input = input
         return FakeRunRef(workflow_run_id=self._workflow_run_id)
 
+    def create_bulk_run_item(self, input: Any) -> Any:
+        return input
+
+    async def aio_run_many_no_wait(self, workflows: list[Any]) -> list[FakeRunRef]:
+        self.bulk_calls.append(workflows)
+        offset = sum(len(call) for call in self.bulk_calls[:-1])
+        return [
+            FakeRunRef(workflow_run_id=f"{self._workflow_run_id}-{offset + i}")
+            for i in range(len(workflows))
+        ]
+
 
 class FakeRuns:
     def __init__(self):
         self.status: V1TaskStatus = V1TaskStatus.QUEUED
         self.result_payload: Any = None
         self.error_status: str = "FAILED"
+        self.stream_events: list[StepRunEventType] = []
+        self.stream_gate: asyncio.Event | None = None
+        self.subscriptions = 0
 
     async def aio_get_status(self, workflow_run_id: str) -> V1TaskStatus:
         return self.status
 
     def get_run_ref(self, workflow_run_id: str) -> FakeRunRef:
         return FakeRunRef(
-            workflow_run_id=workflow_run_id, result_payload=self.result_payload
+            workflow_run_id=workflow_run_id,
+            result_payload=self.result_payload,
+            runs=self,
         )
 
+    async def stream(self, workflow_run_id: str) -> AsyncIterator[StepRunEvent]:
+        """Plays `stream_events`, moving the run to the status each one reaches."""
+        self.subscriptions += 1
+        if self.stream_gate is not None:
+            await self.stream_gate.wait()
+        for event_type in self.stream_events:
+            self.status = _STREAM_EVENT_STATUSES.get(event_type, self.status)
+            yield StepRunEvent(type=event_type, payload="")
+
     async def aio_get(self, workflow_run_id: str) -> V1WorkflowRunDetails:
         now = datetime.now(timezone.utc)
         output = self.result_payload if self.status == V1TaskStatus.COMPLETED else {}
@@ -58,7 +110,7 @@ class FakeRuns:
                 updatedAt=now,
             ),
             status=self.status,
-            tenantId="00000000-0000-0000-0000-000000000000",
+            tenantId=_TENANT_ID,
             displayName=workflow_run_id,
             workflowId="workflow-1",
             output=output,
@@ -66,13 +118,51 @@ class FakeRuns:
             input={},
             createdAt=now,
         )
+        task = V1TaskSummary(
+            metadata=APIResourceMeta(
+                id=_TASK_EXTERNAL_ID, createdAt=now, updatedAt=now
+            ),
+            createdAt=now,
+            displayName=workflow_run_id,
+            input={},
+            numSpawnedChildren=0,
+            output=output,
+            status=self.status,
+            taskExternalId=_TASK_EXTERNAL_ID,
+            taskId=1,
+            taskInsertedAt=now,
+            tenantId=_TENANT_ID,
+            type=V1WorkflowType.TASK,
+            workflowId="workflow-1",
+            workflowName=workflow_run_id.removesuffix("-run-id"),
+            workflowRunExternalId=workflow_run_id,
+        )
         return V1WorkflowRunDetails(
             run=run,
             taskEvents=[],
             shape=[],
-            tasks=[],
+            tasks=[task],
+        )
+
+
+class FakeLogs:
+    def __init__(self):
+        self.lines: list[V1LogLine] = []
+        self.reads = 0
+
+    def add(self, message: str) -> None:
+        self.lines.append(
+            V1LogLine(
+                createdAt=datetime.now(timezone.utc), message=message, metadata={}
+            )
         )
 
+    async def aio_list(
+        self, task_run_id: str, since: datetime | None = None
+    ) -> V1LogLineList:
+        self.reads += 1
+        return V1LogLineList(rows=list(self.lines))
+
 
 class FakeStubs:
     def __init__(self):
@@ -88,35 +178,15 @@ class FakeHatchet:
     def __init__(self):
         self.stubs = FakeStubs()
         self.runs = FakeRuns()
-
-
-class FakeExternalRunner:
-    def __init__(self, hatchet: FakeHatchet):
-        self.hatchet = hatchet
-
-    async def trigger_task(
-        self,
-        *,
-        name: str,
-        input: Any,
-        input_validator: type[Any] | None = None,
-        output_validator: type[Any] | None = None,
-    ) -> V1WorkflowRun:
-        stub = self.hatchet.stubs.task(
-            name=name,
-            input_validator=input_validator,
-            output_validator=output_validator,
-        )
-        run_ref = await stub.aio_run_no_wait(input=input)
-        return (await self.hatchet.runs.aio_get(run_ref.workflow_run_id)).run
-
-    async def get_task(self, task_id: str) -> V1WorkflowRunDetails:
-        return await self.hatchet.runs.aio_get(task_id)
+        self.logs = FakeLogs()
+        self.config = SimpleNamespace(namespace="")
 
 
 @pytest.fixture
 def fake_hatchet(fastapi_app: FastAPI) -> FakeHatchet:
     fake = FakeHatchet()
-    runner = FakeExternalRunner(fake)
+    runner = ExternalRunner(fake, tasks=TASKS)
+    hub = TaskEventHub(runner, log_poll_interval=TASKS_EVENTS_LOG_POLL_SECONDS)
     fastapi_app.dependency_overrides[get_runner] = lambda: runner
+    fastapi_app.dependency_overrides[get_task_events] = lambda: hub
     return fake
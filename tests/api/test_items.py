@@ -1,4 +1,5 @@
 import pytest
+from app.common.pagination import Cursor, encode_cursor
 from fastapi import FastAPI
 from httpx import AsyncClient
 from starlette import status
@@ -297,3 +298,395 @@ async def test_access_items_unauthorized(
     response = await getattr(client, method)(url)
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert "detail" in response.json()
+
+
+@pytest.mark.anyio
+async def test_get_items_cursor_pagination(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+) -> None:
+    """Test walking all items with keyset pagination cursors.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+    """
+    url = fastapi_app.url_path_for("get_items")
+    create_url = fastapi_app.url_path_for("create_item")
+    for i in range(3):
+        await client_authenticated.post(
+            create_url, json={"name": f"Paged Item {i}", "price": 5.0}
+        )
+
+    params = {"limit": 2, "sort_by": "name", "order": "desc"}
+    expected = (
+        await client_authenticated.get(url, params={**params, "limit": 100})
+    ).json()
+
+    seen = []
+    cursor = None
+    while True:
+        response = await client_authenticated.get(
+            url, params={**params, "cursor": cursor} if cursor else params
+        )
+        assert response.status_code == status.HTTP_200_OK
+        seen.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert [item["id"] for item in seen] == [item["id"] for item in expected]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"cursor": "not-a-cursor"},
+        {"limit": 1, "sort_by": "name", "order": "asc"},
+    ],
+)
+async def test_get_items_invalid_cursor(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+    params: dict,
+) -> None:
+    """Test that malformed cursors or cursors from another sort order are rejected.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+        params: query parameters used to obtain a cursor, or an invalid cursor.
+    """
+    url = fastapi_app.url_path_for("get_items")
+    if "cursor" not in params:
+        first_page = await client_authenticated.get(url, params=params)
+        params = {"cursor": first_page.headers["X-Next-Cursor"], "sort_by": "price"}
+
+    response = await client_authenticated.get(url, params=params)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        Cursor(sort_by="name", order="asc", values=[["Item 1"]], id=1),
+        Cursor(sort_by="name", order="asc", values=[{"a": 1}], id=1),
+        Cursor(sort_by=None, order="asc", values=[], id=True),
+    ],
+    ids=["list-value", "dict-value", "bool-id"],
+)
+async def test_get_items_crafted_cursor(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+    cursor: Cursor,
+) -> None:
+    """Test that well-formed cursors carrying non-scalar values are rejected.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+        cursor: crafted cursor.
+    """
+    url = fastapi_app.url_path_for("get_items")
+    response = await client_authenticated.get(
+        url, params={"cursor": encode_cursor(cursor), "sort_by": cursor.sort_by or ""}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.anyio
+async def test_bulk_create_update_delete_items(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+) -> None:
+    """Test creating, updating and deleting items through the bulk endpoints.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+    """
+    url = fastapi_app.url_path_for("create_items")
+    response = await client_authenticated.post(
+        url,
+        json=[
+            {"name": "Bulk 1", "price": 1.0},
+            {"name": "Bulk 2", "description": "Second", "price": 2.0},
+            {"name": "Bulk 3", "price": 3.0},
+        ],
+    )
+    assert response.status_code == status.HTTP_200_OK
+    created = response.json()
+    assert [item["name"] for item in created] == ["Bulk 1", "Bulk 2", "Bulk 3"]
+    ids = [item["id"] for item in created]
+    assert len(set(ids)) == 3
+
+    url = fastapi_app.url_path_for("update_items")
+    response = await client_authenticated.put(
+        url,
+        json=[
+            {"id": ids[0], "name": "Bulk 1 updated", "price": 10.0},
+            {
+                "id": ids[1],
+                "name": "Bulk 2 updated",
+                "description": "New",
+                "price": 20.0,
+            },
+        ],
+    )
+    assert response.status_code == status.HTTP_200_OK
+    updated = {item["id"]: item for item in response.json()}
+    assert updated[ids[0]]["name"] == "Bulk 1 updated"
+    assert updated[ids[0]]["price"] == 10.0
+    assert updated[ids[1]]["description"] == "New"
+
+    url = fastapi_app.url_path_for("delete_items")
+    response = await client_authenticated.request("DELETE", url, json={"ids": ids})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["message"] == "3 items deleted successfully"
+
+    get_url = fastapi_app.url_path_for("get_item", item_id=ids[2])
+    response = await client_authenticated.get(get_url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "method,route,payload",
+    [
+        ("PUT", "update_items", [{"id": 999, "name": "Ghost", "price": 1.0}]),
+        ("DELETE", "delete_items", {"ids": [1, 999]}),
+    ],
+)
+async def test_bulk_items_nonexistent(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+    method: str,
+    route: str,
+    payload: list | dict,
+) -> None:
+    """Test that bulk updates and deletes report ids that do not exist.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+        method: HTTP method to use.
+        route: route name to resolve.
+        payload: request body referencing a nonexistent item.
+    """
+    url = fastapi_app.url_path_for(route)
+    response = await client_authenticated.request(method, url, json=payload)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "Items with ids [999] not found"
+
+
+@pytest.mark.anyio
+async def test_bulk_update_items_duplicate_ids(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+) -> None:
+    """Test that a bulk update naming the same item twice is rejected.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+    """
+    url = fastapi_app.url_path_for("update_items")
+    response = await client_authenticated.put(
+        url,
+        json=[
+            {"id": 1, "name": "First", "price": 1.0},
+            {"id": 1, "name": "Second", "price": 2.0},
+        ],
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert response.json()["detail"] == "Items with ids [1] are given more than once"
+
+    get_url = fastapi_app.url_path_for("get_item", item_id=1)
+    response = await client_authenticated.get(get_url)
+    assert response.json()["name"] == "Item 1"
+
+
+@pytest.mark.anyio
+async def test_import_items(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+) -> None:
+    """Test importing items, through COPY on Postgres.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+    """
+    url = fastapi_app.url_path_for("import_items")
+    response = await client_authenticated.post(
+        url,
+        json=[
+            {"name": "Imported", "price": 1.5},
+            {"name": "Imported", "description": "With description", "price": 2},
+        ],
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["message"] == "2 items imported successfully"
+
+    url = fastapi_app.url_path_for("get_items")
+    response = await client_authenticated.get(url, params={"name": "Imported"})
+    items = response.json()
+    assert [item["description"] for item in items] == [None, "With description"]
+    assert len({item["id"] for item in items}) == 2
+
+
+@pytest.mark.anyio
+async def test_get_items_unsupported_sort(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+) -> None:
+    """Test that sorting by a column without an index is rejected.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+    """
+    url = fastapi_app.url_path_for("get_items")
+    response = await client_authenticated.get(url, params={"sort_by": "hashed"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"].startswith("Sorting by 'hashed' is not supported")
+
+
+@pytest.mark.anyio
+async def test_get_items_range_in_prefix_filters_and_multi_sort(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+) -> None:
+    """Test combining range, IN and prefix filters with a multi-column sort.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+    """
+    url = fastapi_app.url_path_for("get_items")
+    await client_authenticated.post(
+        fastapi_app.url_path_for("create_items"),
+        json=[
+            {"name": "Filtered B", "price": 30.0},
+            {"name": "Filtered A", "price": 20.0},
+            {"name": "Filtered A", "price": 40.0},
+            {"name": "Filtered C", "price": 5.0},
+        ],
+    )
+
+    response = await client_authenticated.get(
+        url,
+        params={
+            "name__prefix": "Filtered",
+            "price__gte": 10,
+            "sort_by": "name,-price",
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [(item["name"], item["price"]) for item in response.json()] == [
+        ("Filtered A", 40.0),
+        ("Filtered A", 20.0),
+        ("Filtered B", 30.0),
+    ]
+
+    response = await client_authenticated.get(
+        url, params={"name__in": ["Filtered B", "Filtered C"], "price__lt": 30}
+    )
+    assert [item["name"] for item in response.json()] == ["Filtered C"]
+
+
+@pytest.mark.anyio
+async def test_search_items(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+) -> None:
+    """Test full-text search ranking, highlighting and index synchronization.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+    """
+    url = fastapi_app.url_path_for("search_items")
+    created = await client_authenticated.post(
+        fastapi_app.url_path_for("create_items"),
+        json=[
+            {"name": "Garden hose", "description": "Green rubber widget", "price": 1},
+            {"name": "Blue widget", "description": "Small and shiny", "price": 2},
+            {"name": "Red widget", "price": 3},
+        ],
+    )
+    hose, blue, red = created.json()
+
+    response = await client_authenticated.get(url, params={"q": "widget"})
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()
+    # Name matches rank above the description match.
+    assert {item["id"] for item in results[:2]} == {blue["id"], red["id"]}
+    assert results[2]["id"] == hose["id"]
+    assert "<mark>widget</mark>" in results[2]["snippet"]
+    assert results[0]["score"] >= results[2]["score"]
+
+    # The last word matches as a prefix, all words must match.
+    response = await client_authenticated.get(url, params={"q": "green wid"})
+    assert [item["id"] for item in response.json()] == [hose["id"]]
+
+    await client_authenticated.put(
+        fastapi_app.url_path_for("update_item", item_id=red["id"]),
+        json={"name": "Red gadget", "price": 3},
+    )
+    await client_authenticated.delete(
+        fastapi_app.url_path_for("delete_item", item_id=blue["id"])
+    )
+    response = await client_authenticated.get(url, params={"q": "widget"})
+    assert [item["id"] for item in response.json()] == [hose["id"]]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("q", ['"unbalanced', "widget OR NOT", "* - ( )", "name:x"])
+async def test_search_items_query_syntax_is_escaped(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+    q: str,
+) -> None:
+    """Test that search input is matched literally instead of as query syntax.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+        q: search query containing full-text query operators.
+    """
+    url = fastapi_app.url_path_for("search_items")
+    response = await client_authenticated.get(url, params={"q": q})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+
+@pytest.mark.anyio
+async def test_get_items_include_total(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+) -> None:
+    """Test that the number of matching items comes back in `X-Total-Count`.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+    """
+    url = fastapi_app.url_path_for("get_items")
+    await client_authenticated.post(
+        fastapi_app.url_path_for("create_items"),
+        json=[{"name": f"Counted {i}", "price": i} for i in range(5)],
+    )
+    params = {"name__prefix": "Counted", "limit": 2, "include_total": True}
+
+    response = await client_authenticated.get(url, params=params)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 2
+    assert response.headers["X-Total-Count"] == "5"
+
+    response = await client_authenticated.get(
+        url, params={**params, "cursor": response.headers["X-Next-Cursor"]}
+    )
+    assert response.headers["X-Total-Count"] == "5"
@@ -1,7 +1,20 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+
 import pytest
+from api_shared.tasks.general import PydanticParseResult
+from app.api.tasks import ml as ml_views
+from app.api.tasks.config import TASKS
+from app.api.tasks.deps import get_task_events
+from app.core.hatchet import ExternalRunner
+from app.core.task_events import TaskEvent, TaskEventHub
 from fastapi import FastAPI
+from hatchet_sdk.clients.listeners.run_event_listener import StepRunEventType
+from hatchet_sdk.clients.rest.models.v1_log_line import V1LogLine
 from hatchet_sdk.clients.rest.models.v1_task_status import V1TaskStatus
 from httpx import AsyncClient
+from prometheus_client import REGISTRY
 from starlette import status
 
 
@@ -13,7 +26,8 @@ async def test_trigger_general_task(
     response = await client.post(url, json={"duration": 2})
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["metadata"]["id"] == "long_running_process-run-id"
+    assert response.json()["id"] == "long_running_process-run-id"
+    assert response.json()["task"] == "long_running_process"
     assert fake_hatchet.stubs.created["long_running_process"].last_input.duration == 2
 
 
@@ -45,7 +59,7 @@ async def test_trigger_ml_training_task(
     response = await client.post(url, json=payload)
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["metadata"]["id"] == "train_model-run-id"
+    assert response.json()["id"] == "train_model-run-id"
     assert fake_hatchet.stubs.created["train_model"].last_input.dataset_id == "ds-1"
 
 
@@ -62,3 +76,297 @@ async def test_ml_task_result_failed(
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["run"]["status"] == "FAILED"
     assert response.json()["run"]["errorMessage"] == "FAILED"
+
+
+@pytest.mark.anyio
+async def test_trigger_task_does_not_fetch_run(
+    fastapi_app: FastAPI, client: AsyncClient, fake_hatchet, monkeypatch
+) -> None:
+    async def fail_aio_get(workflow_run_id: str) -> None:
+        raise AssertionError("trigger must not fetch run details")
+
+    monkeypatch.setattr(fake_hatchet.runs, "aio_get", fail_aio_get)
+    before = REGISTRY.get_sample_value(
+        "task_trigger_duration_seconds_count", {"task": "pydantic_parse_check"}
+    )
+
+    url = fastapi_app.url_path_for("trigger_pydantic_parse")
+    response = await client.post(url, json={"text": "hello"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == "pydantic_parse_check-run-id"
+    assert (
+        REGISTRY.get_sample_value(
+            "task_trigger_duration_seconds_count", {"task": "pydantic_parse_check"}
+        )
+        == (before or 0) + 1
+    )
+
+
+@pytest.mark.anyio
+async def test_task_stubs_are_built_once(
+    fastapi_app: FastAPI, client: AsyncClient, fake_hatchet
+) -> None:
+    stubs = dict(fake_hatchet.stubs.created)
+    assert set(stubs) == {task.name for task in TASKS}
+
+    url = fastapi_app.url_path_for("trigger_task")
+    for duration in (1, 2):
+        response = await client.post(url, json={"duration": duration})
+        assert response.status_code == status.HTTP_200_OK
+
+    assert fake_hatchet.stubs.created == stubs
+    assert stubs["long_running_process"].last_input.duration == 2
+
+
+@pytest.mark.anyio
+async def test_trigger_ml_inference_bulk(
+    fastapi_app: FastAPI, client: AsyncClient, fake_hatchet, monkeypatch
+) -> None:
+    monkeypatch.setattr(ml_views, "TASKS_BULK_CHUNK_SIZE", 2)
+    payload = [
+        {"model_id": "m-1", "input_data": {"features": [float(i)]}} for i in range(5)
+    ]
+
+    url = fastapi_app.url_path_for("trigger_ml_inferences")
+    response = await client.post(url, json=payload)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["task"] == "ml_inference"
+    assert response.json()["ids"] == [f"ml_inference-run-id-{i}" for i in range(5)]
+    calls = fake_hatchet.stubs.created["ml_inference"].bulk_calls
+    assert [len(call) for call in calls] == [2, 2, 1]
+    assert calls[2][0].input_data == {"features": [4.0]}
+
+
+@pytest.mark.anyio
+async def test_trigger_bulk_rejects_invalid_input(
+    fastapi_app: FastAPI, client: AsyncClient, fake_hatchet
+) -> None:
+    url = fastapi_app.url_path_for("trigger_tasks")
+    response = await client.post(url, json=[{"duration": 1}, {"duration": "x"}])
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert response.json()["detail"][0]["loc"] == ["body", 1, "duration"]
+    assert fake_hatchet.stubs.created["long_running_process"].bulk_calls == []
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.mark.anyio
+async def test_task_events_stream(
+    fastapi_app: FastAPI, client: AsyncClient, fake_hatchet
+) -> None:
+    fake_hatchet.runs.stream_events = [
+        StepRunEventType.STEP_RUN_EVENT_TYPE_STARTED,
+        StepRunEventType.STEP_RUN_EVENT_TYPE_STREAM,
+        StepRunEventType.STEP_RUN_EVENT_TYPE_COMPLETED,
+    ]
+    fake_hatchet.runs.result_payload = {
+        "received_text": "hi",
+        "received_count": 2,
+        "received_nested": {"name": "n", "value": 1, "tags": []},
+        "doubled_count": 4,
+    }
+    fake_hatchet.logs.add("Processing Pydantic payload: text=hi")
+
+    url = fastapi_app.url_path_for(
+        "stream_task_events", task_id="pydantic_parse_check-run-id"
+    )
+    response = await client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(response.text)
+    assert events[:3] == [
+        ("status", {"status": "QUEUED"}),
+        ("status", {"status": "RUNNING"}),
+        ("status", {"status": "COMPLETED"}),
+    ]
+    assert events[3][0] == "log"
+    assert events[3][1]["message"] == "Processing Pydantic payload: text=hi"
+    assert events[4] == (
+        "result",
+        {
+            "status": "COMPLETED",
+            "output": fake_hatchet.runs.result_payload,
+            "error": None,
+        },
+    )
+
+
+@pytest.mark.anyio
+async def test_task_events_share_one_subscription(
+    fastapi_app: FastAPI, fake_hatchet
+) -> None:
+    hub = fastapi_app.dependency_overrides[get_task_events]()
+    fake_hatchet.runs.stream_gate = asyncio.Event()
+    fake_hatchet.runs.stream_events = [
+        StepRunEventType.STEP_RUN_EVENT_TYPE_STARTED,
+        StepRunEventType.STEP_RUN_EVENT_TYPE_FAILED,
+    ]
+
+    async def watch() -> list[TaskEvent]:
+        events = []
+        async with hub.subscribe("some-run-id") as queue:
+            while (event := await queue.get()) is not None:
+                events.append(event)
+                if event.data.get("status") == "QUEUED":
+                    fake_hatchet.runs.stream_gate.set()
+        return events
+
+    first, second = await asyncio.gather(watch(), watch())
+
+    assert fake_hatchet.runs.subscriptions == 1
+    assert first == second
+    assert [event.event for event in first] == ["status", "status", "status", "result"]
+    assert first[-1].data["status"] == "FAILED"
+    assert first[-1].data["error"] == "FAILED"
+    assert len(hub) == 0
+
+
+@pytest.mark.anyio
+async def test_task_events_keep_log_lines_sharing_a_timestamp(fake_hatchet) -> None:
+    """Test that lines logged at the same instant as a published one are not lost."""
+    hub = TaskEventHub(ExternalRunner(fake_hatchet, tasks=TASKS), log_poll_interval=0)
+    fake_hatchet.runs.stream_gate = asyncio.Event()
+    fake_hatchet.runs.stream_events = [
+        StepRunEventType.STEP_RUN_EVENT_TYPE_STARTED,
+        StepRunEventType.STEP_RUN_EVENT_TYPE_COMPLETED,
+    ]
+    now = datetime.now(timezone.utc)
+    fake_hatchet.logs.lines = [V1LogLine(createdAt=now, message="first", metadata={})]
+
+    messages = []
+    async with hub.subscribe("some-run-id") as queue:
+        while (event := await queue.get()) is not None:
+            if event.event == "log":
+                messages.append(event.data["message"])
+                if len(messages) == 1:
+                    # Read by a later poll, along with the line already published.
+                    fake_hatchet.logs.lines += [
+                        V1LogLine(createdAt=now, message=message, metadata={})
+                        for message in ("second", "second")
+                    ]
+                    fake_hatchet.runs.stream_gate.set()
+
+    assert messages == ["first", "second", "second"]
+
+
+@pytest.mark.anyio
+async def test_task_events_unknown_task(
+    fastapi_app: FastAPI, client: AsyncClient, fake_hatchet, monkeypatch
+) -> None:
+    async def missing(workflow_run_id: str) -> None:
+        raise LookupError(workflow_run_id)
+
+    monkeypatch.setattr(fake_hatchet.runs, "aio_get", missing)
+
+    url = fastapi_app.url_path_for("stream_task_events", task_id="missing")
+    response = await client.get(url)
+
+    assert _parse_sse(response.text) == [("error", {"detail": "Task not found"})]
+
+
+@pytest.mark.anyio
+async def test_task_result_wait_returns_typed_output(
+    fastapi_app: FastAPI, client: AsyncClient, fake_hatchet
+) -> None:
+    fake_hatchet.runs.stream_events = [
+        StepRunEventType.STEP_RUN_EVENT_TYPE_STARTED,
+        StepRunEventType.STEP_RUN_EVENT_TYPE_COMPLETED,
+    ]
+    fake_hatchet.runs.result_payload = {
+        "received_text": "hi",
+        "received_count": "2",
+        "received_nested": {"name": "n", "value": 1, "tags": []},
+        "doubled_count": 4,
+    }
+
+    url = fastapi_app.url_path_for(
+        "get_task_result", task_id="pydantic_parse_check-run-id"
+    )
+    response = await client.get(url, params={"wait": 5})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "id": "pydantic_parse_check-run-id",
+        "status": "COMPLETED",
+        "output": {**fake_hatchet.runs.result_payload, "received_count": 2},
+        "error": None,
+    }
+
+
+@pytest.mark.anyio
+async def test_task_result_wait_parses_output_without_reading_logs(
+    fake_hatchet,
+) -> None:
+    hub = TaskEventHub(ExternalRunner(fake_hatchet, tasks=TASKS), log_poll_interval=0)
+    fake_hatchet.runs.stream_gate = asyncio.Event()
+    fake_hatchet.runs.stream_events = [
+        StepRunEventType.STEP_RUN_EVENT_TYPE_STARTED,
+        StepRunEventType.STEP_RUN_EVENT_TYPE_COMPLETED,
+    ]
+    fake_hatchet.runs.result_payload = {
+        "received_text": "hi",
+        "received_count": "2",
+        "received_nested": {"name": "n", "value": 1, "tags": []},
+        "doubled_count": 4,
+    }
+
+    waiting = asyncio.create_task(hub.wait("pydantic_parse_check-run-id", 5))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    fake_hatchet.runs.stream_gate.set()
+    result = await waiting
+
+    assert isinstance(result.output, PydanticParseResult)
+    assert result.output.received_count == 2
+    # Only streaming clients read the logs, waiting for the result does not.
+    assert fake_hatchet.logs.reads == 0
+
+    fake_hatchet.runs.stream_gate.clear()
+    fake_hatchet.runs.status = V1TaskStatus.QUEUED
+    async with hub.subscribe("pydantic_parse_check-run-id") as queue:
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert fake_hatchet.logs.reads > 0
+        fake_hatchet.runs.stream_gate.set()
+        while await queue.get() is not None:
+            pass
+
+
+@pytest.mark.anyio
+async def test_task_result_wait_times_out(
+    fastapi_app: FastAPI, client: AsyncClient, fake_hatchet
+) -> None:
+    fake_hatchet.runs.stream_gate = asyncio.Event()
+
+    url = fastapi_app.url_path_for("get_ml_task_result", task_id="some-run-id")
+    response = await client.get(url, params={"wait": 0.1})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["status"] == "QUEUED"
+    assert response.json()["output"] is None
+    assert len(fastapi_app.dependency_overrides[get_task_events]()) == 0
+
+
+@pytest.mark.anyio
+async def test_task_result_wait_unknown_task(
+    fastapi_app: FastAPI, client: AsyncClient, fake_hatchet, monkeypatch
+) -> None:
+    async def missing(workflow_run_id: str) -> None:
+        raise LookupError(workflow_run_id)
+
+    monkeypatch.setattr(fake_hatchet.runs, "aio_get", missing)
+
+    url = fastapi_app.url_path_for("get_task_result", task_id="missing")
+    response = await client.get(url, params={"wait": 1})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,4 +1,5 @@
 import pytest
+from app.api.auth.service import password_hash_service
 from fastapi import FastAPI
 from httpx import AsyncClient
 from starlette import status
@@ -153,6 +154,33 @@ async def test_update_nonexistent_user(
     assert response.json()["detail"] == "User with id 999 not found"
 
 
+@pytest.mark.anyio
+async def test_update_nonexistent_user_password_is_not_hashed(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that updating the password of a missing user does not hash it.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+        monkeypatch: pytest monkeypatch fixture.
+    """
+    hashed: list[str] = []
+
+    async def fake_hash(password: str) -> str:
+        hashed.append(password)
+        return password
+
+    monkeypatch.setattr(password_hash_service, "hash", fake_hash)
+    url = fastapi_app.url_path_for("update_user", user_id=999)
+    response = await client_authenticated.put(url, json={"password": "ghost_password"})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "User with id 999 not found"
+    assert hashed == []
+
+
 @pytest.mark.anyio
 async def test_delete_user(
     fastapi_app: FastAPI,
@@ -186,3 +214,27 @@ async def test_delete_user(
     get_url = fastapi_app.url_path_for("get_user", user_id=user_id)
     get_response = await client_authenticated.get(get_url)
     assert get_response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_get_users_include_total(
+    fastapi_app: FastAPI,
+    client_authenticated: AsyncClient,
+) -> None:
+    """Test that the number of users comes back in the `X-Total-Count` header.
+
+    Args:
+        fastapi_app: current application fixture.
+        client_authenticated: client fixture with authentication.
+    """
+    url = fastapi_app.url_path_for("get_users")
+    response = await client_authenticated.get(
+        url, params={"limit": 1, "include_total": True}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 1
+    total = int(response.headers["X-Total-Count"])
+    assert total == len((await client_authenticated.get(url)).json())
+
+    response = await client_authenticated.get(url, params={"limit": 1})
+    assert "X-Total-Count" not in response.headers
@@ -2,22 +2,30 @@ from typing import Any, AsyncGenerator, Generator
 
 import pytest
 from app.api.application import get_app
-from app.api.auth.utils import create_access_token, get_password_hash
+from app.api.auth.utils import (
+    create_access_token,
+    principal_cache,
+)
 from app.api.items.models import ItemModel
 from app.api.users.models import UserModel
+from app.api.users.repository import get_user_inmemory_data
 from app.api.users.schemas import User
-from app.core.settings import settings
+from app.common.cache import get_repository_cache, list_total_cache
 from app.db.deps import get_db_session
 from app.db.meta import meta
-from app.db.utils import create_database, drop_database, load_all_db_models
+from app.db.utils import (
+    create_database,
+    create_db_engine,
+    drop_database,
+    load_all_db_models,
+)
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import insert
+from sqlalchemy import insert, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
-    create_async_engine,
 )
 
 _BASE_URL = "http://test"
@@ -26,27 +34,8 @@ _TIMEOUT = 2.0
 
 @pytest.fixture(scope="session")
 def mock_users_data() -> list[dict[str, Any]]:
-    """Provides mock user data."""
-    return [
-        {
-            "id": 1,
-            "name": "John Doe",
-            "email": "john@example.com",
-            "hashed_password": get_password_hash("password"),
-        },
-        {
-            "id": 2,
-            "name": "Jane Doe",
-            "email": "jane@example.com",
-            "hashed_password": get_password_hash("password"),
-        },
-        {
-            "id": 3,
-            "name": "admin",
-            "email": "admin@mail.com",
-            "hashed_password": get_password_hash("admin"),
-        },
-    ]
+    """Provides mock user data, the users seeded in memory."""
+    return [user.model_dump() for user in get_user_inmemory_data()]
 
 
 @pytest.fixture(scope="session")
@@ -96,10 +85,7 @@ async def _engine(
 
     await create_database()
 
-    engine = create_async_engine(
-        settings.DB_URL,
-        # connect_args={"check_same_thread": True},
-    )
+    engine = create_db_engine()
     async with engine.begin() as conn:
         # Create tables
         await conn.run_sync(meta.create_all)
@@ -108,6 +94,17 @@ async def _engine(
         await conn.execute(insert(UserModel), mock_users_data)
         await conn.execute(insert(ItemModel), mock_items_data)
 
+        if conn.dialect.name == "postgresql":
+            # Mock rows carry explicit ids, move the id sequences past them.
+            for model in (UserModel, ItemModel):
+                table_name = conn.dialect.identifier_preparer.quote(model.__tablename__)
+                await conn.execute(
+                    text(
+                        f"SELECT setval(pg_get_serial_sequence('{table_name}', 'id'), "
+                        f"(SELECT max(id) FROM {table_name}))"
+                    )
+                )
+
     try:
         yield engine
     finally:
@@ -156,6 +153,10 @@ def fastapi_app(
     Returns:
         Fastapi app with mocked dependencies.
     """
+    # Every test rolls its transaction back, so cached reads must not outlive it.
+    get_repository_cache.cache_clear()
+    principal_cache.clear()
+    list_total_cache.clear()
     application = get_app()
     application.dependency_overrides[get_db_session] = lambda: dbsession
     try:
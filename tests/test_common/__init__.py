@@ -0,0 +1 @@
+# Make tests.test_common directory a proper package
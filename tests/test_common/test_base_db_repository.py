@@ -0,0 +1,285 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+import pytest
+from app.api.items.config import ITEMS_FILTERABLE_COLUMNS, ITEMS_SORTABLE_COLUMNS
+from app.api.items.repository import ItemRepository
+from app.api.items.schemas import Item, ItemCreate, ItemUpdate
+from app.common.base_exceptions import InvalidQueryError
+from app.common.base_repositories.in_memory_repository import (
+    InMemoryRepository,
+    InMemoryStore,
+)
+from app.common.cache import list_total_cache
+from app.common.pagination import next_cursor
+from app.core.settings import settings
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+
+@contextmanager
+def count_statements(session: AsyncSession) -> Iterator[list[str]]:
+    """Collect the SQL statements executed through the session's connection."""
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.mark.anyio
+async def test_update_is_single_statement(dbsession: AsyncSession) -> None:
+    """Test that an update issues a single `UPDATE ... RETURNING` statement."""
+    repository = ItemRepository(session=dbsession)
+
+    with count_statements(dbsession) as statements:
+        item = await repository.update(
+            1, ItemUpdate(name="Single statement", price=1.5)
+        )
+        missing = await repository.update(999, ItemUpdate(name="Ghost", price=1.0))
+
+    assert item.name == "Single statement"
+    assert missing is None
+    assert len(statements) == 2
+    assert all(stmt.startswith("UPDATE") for stmt in statements)
+
+
+@pytest.mark.anyio
+async def test_delete_is_single_statement(dbsession: AsyncSession) -> None:
+    """Test that a delete issues a single `DELETE ... RETURNING` statement."""
+    repository = ItemRepository(session=dbsession)
+
+    with count_statements(dbsession) as statements:
+        assert await repository.delete(2) is True
+        assert await repository.delete(2) is False
+
+    assert len(statements) == 2
+    assert all(stmt.startswith("DELETE") for stmt in statements)
+
+
+async def _query_plan(session: AsyncSession, run_query) -> str:
+    """Run a repository read and return SQLite's query plan of its SELECT."""
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args) -> None:
+        queries.append((statement, parameters))
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        await run_query()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    statement, parameters = queries[-1]
+    connection = await session.connection()
+    rows = await connection.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    )
+    return " | ".join(row.detail for row in rows)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("sort_by", sorted(ITEMS_SORTABLE_COLUMNS))
+async def test_item_sorts_are_index_backed(
+    dbsession: AsyncSession, sort_by: str
+) -> None:
+    """Test that every sortable item column is paged through its index."""
+    repository = ItemRepository(session=dbsession)
+    first_page = await repository.get_all(limit=1, sort_by=sort_by)
+    cursor = next_cursor(first_page, limit=1, sort_by=sort_by)
+
+    for kwargs in ({}, {"cursor": cursor}):
+        plan = await _query_plan(
+            dbsession,
+            lambda kwargs=kwargs: repository.get_all(
+                limit=1, sort_by=sort_by, **kwargs
+            ),
+        )
+        assert ITEMS_SORTABLE_COLUMNS[sort_by] in plan
+        assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("field", sorted(ITEMS_FILTERABLE_COLUMNS))
+async def test_item_filters_are_index_backed(
+    dbsession: AsyncSession, field: str
+) -> None:
+    """Test that every filterable item column is looked up through its index."""
+    repository = ItemRepository(session=dbsession)
+    plan = await _query_plan(
+        dbsession, lambda: repository.get_all(filters={field: "Item 1"})
+    )
+    assert f"USING INDEX {ITEMS_FILTERABLE_COLUMNS[field]}" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.anyio
+async def test_unsupported_sort_and_filter_are_rejected(
+    dbsession: AsyncSession,
+) -> None:
+    """Test that columns outside of the allow-list can not be queried."""
+    repository = ItemRepository(session=dbsession)
+    assert [item.id for item in await repository.get_all(sort_by="id")] == [1, 2]
+
+    with pytest.raises(InvalidQueryError, match="Sorting by 'hashed' is not"):
+        await repository.get_all(sort_by="hashed")
+    with pytest.raises(InvalidQueryError, match="Filtering by 'hashed' is not"):
+        await repository.get_all(filters={"hashed__prefix": "x"})
+    with pytest.raises(InvalidQueryError, match="Unknown filter operator 'like'"):
+        await repository.get_all(filters={"name__like": "Item%"})
+
+
+async def _walk(repository, limit: int, **query) -> list[int]:
+    """Read every page of a query through cursors and return the item ids."""
+    ids: list[int] = []
+    cursor = None
+    while True:
+        page = await repository.get_all(limit=limit, cursor=cursor, **query)
+        ids.extend(item.id for item in page)
+        cursor = next_cursor(
+            page, limit=limit, sort_by=query.get("sort_by"), order=query.get("order")
+        )
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "query",
+    [
+        {"filters": {"price__gte": 1.0, "price__lt": 3.0}},
+        {"filters": {"name__in": ["Shared 0", "Shared 2", "Missing"]}},
+        {"filters": {"name__prefix": "Shared"}, "sort_by": "price", "order": "desc"},
+        {"filters": {"description__prefix": "Odd"}, "sort_by": "-name"},
+        {"sort_by": "name,-price"},
+        {"sort_by": "-price,name", "order": "desc"},
+        {"filters": {"price__lte": 2.0}, "sort_by": "name,price"},
+        {"filters": {"name": "Shared 1"}, "sort_by": "price"},
+        {"filters": {"price__gt": 0.0}, "sort_by": "-description"},
+        {"sort_by": "description,-price"},
+        {"sort_by": "price", "order": "desc"},
+    ],
+)
+async def test_queries_match_in_memory_repository(
+    dbsession: AsyncSession, query: dict
+) -> None:
+    """Test that filters and multi-column sorts return the same pages as in memory."""
+    repository = ItemRepository(session=dbsession)
+    await repository.create_many(
+        [
+            ItemCreate(
+                name=f"Shared {i % 3}",
+                description=f"Odd {i}" if i % 2 else None,
+                price=float(i % 4),
+            )
+            for i in range(20)
+        ]
+    )
+    in_memory = InMemoryRepository(
+        initial_data=InMemoryStore(
+            [Item.model_validate(item) for item in await repository.get_all()],
+            indexes=["name"],
+            sorted_fields=ITEMS_SORTABLE_COLUMNS,
+        )
+    )
+
+    expected = [item.id for item in await in_memory.get_all(**query)]
+    assert expected
+    assert [item.id for item in await repository.get_all(**query)] == expected
+    assert await _walk(repository, limit=3, **query) == expected
+    assert await _walk(in_memory, limit=3, **query) == expected
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("prefix", ["a", "A", "ap", "B"])
+async def test_prefix_filter_is_case_sensitive(
+    dbsession: AsyncSession, prefix: str
+) -> None:
+    """Test that prefix filters match mixed-case names like `str.startswith`."""
+    names = ["apple", "Apple", "apricot", "a", "B", "banana", "Banana", "Zebra"]
+    repository = ItemRepository(session=dbsession)
+    await repository.create_many([ItemCreate(name=name, price=1.0) for name in names])
+
+    page = await repository.get_all(filters={"name__prefix": prefix}, sort_by="name")
+    assert [item.name for item in page] == sorted(
+        name for name in names if name.startswith(prefix)
+    )
+
+
+@pytest.mark.anyio
+async def test_prefix_filter_compares_in_c_collation_on_postgres(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that Postgres prefix ranges compare bytes, not the database collation."""
+    session = AsyncSession(
+        bind=create_async_engine("postgresql+asyncpg://user@localhost/db")
+    )
+    statements: list[str] = []
+
+    async def scalar(statement) -> int:
+        statements.append(str(statement.compile(dialect=session.bind.dialect)))
+        return 0
+
+    monkeypatch.setattr(session, "scalar", scalar)
+    await ItemRepository(session=session).count({"name__prefix": "a"})
+    await session.bind.dispose()
+
+    assert '(item.name COLLATE "C") >=' in statements[0]
+    assert '(item.name COLLATE "C") <' in statements[0]
+
+
+@pytest.mark.anyio
+async def test_get_all_with_total_is_single_statement(
+    dbsession: AsyncSession,
+) -> None:
+    """Test that the total comes from a window count in the page's own statement."""
+    repository = ItemRepository(session=dbsession)
+    await repository.create_many(
+        [ItemCreate(name=f"Total {i}", price=float(i)) for i in range(7)]
+    )
+    filters = {"name__prefix": "Total", "price__gte": 2.0}
+
+    with count_statements(dbsession) as statements:
+        first, total = await repository.get_all_with_total(
+            limit=2, filters=filters, sort_by="-price"
+        )
+    assert len(statements) == 1
+    assert "OVER ()" in statements[0]
+    assert [item.price for item in first] == [6.0, 5.0]
+    assert total == await repository.count(filters) == 5
+
+    # Pages after a cursor and past the end report the same total.
+    cursor = next_cursor(first, limit=2, sort_by="-price")
+    second, total = await repository.get_all_with_total(
+        limit=2, filters=filters, sort_by="-price", cursor=cursor
+    )
+    assert [item.price for item in second] == [4.0, 3.0]
+    assert total == 5
+    assert await repository.get_all_with_total(skip=10, filters=filters) == ([], 5)
+
+
+@pytest.mark.anyio
+async def test_large_totals_are_cached(
+    dbsession: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that totals above the threshold are served from the cache."""
+    monkeypatch.setattr(settings, "LIST_TOTAL_CACHE_MIN_ROWS", 2)
+    repository = ItemRepository(session=dbsession)
+    list_total_cache.clear()
+    try:
+        _, total = await repository.get_all_with_total(limit=1)
+        await repository.create(ItemCreate(name="Not counted yet", price=1.0))
+        with count_statements(dbsession) as statements:
+            _, cached_total = await repository.get_all_with_total(limit=1)
+    finally:
+        list_total_cache.clear()
+
+    assert cached_total == total == 2
+    assert "OVER ()" not in statements[0]
@@ -0,0 +1,101 @@
+import fnmatch
+from typing import Any, AsyncIterator
+
+import pytest
+from app.api.items.schemas import Item, ItemUpdate
+from app.common.base_repositories.cached_repository import CachedRepository
+from app.common.base_repositories.in_memory_repository import InMemoryRepository
+from app.common.cache import (
+    CacheBackend,
+    InMemoryCacheBackend,
+    LRUCache,
+    RedisCacheBackend,
+)
+from app.core.metrics import CACHE_EVICTIONS, CACHE_HITS
+from app.core.settings import CacheBackendType, Settings
+
+
+class FakeRedis:
+    """Minimal stand-in for `redis.asyncio.Redis` used by `RedisCacheBackend`."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, px: int | None = None) -> None:
+        self.data[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def scan_iter(self, match: str) -> AsyncIterator[str]:
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    """Test that the LRU cache drops the least recently used entry when full."""
+    cache = LRUCache(name="test_lru", maxsize=2)
+    evictions = CACHE_EVICTIONS.labels("test_lru")._value.get()
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert CACHE_EVICTIONS.labels("test_lru")._value.get() == evictions + 1
+
+
+def test_lru_cache_expires_entries() -> None:
+    """Test that entries are not returned once their TTL has passed."""
+    cache = LRUCache(name="test_ttl", maxsize=10, ttl=60)
+
+    cache.set("default", 1)
+    cache.set("expired", 2, ttl=-1)
+
+    assert cache.get("default") == 1
+    assert cache.get("expired") is None
+    assert len(cache) == 1
+
+
+def test_repository_cache_is_disabled_by_default() -> None:
+    """Test that caching is opt-in, the memory backend is only safe with one worker."""
+    default = Settings.model_fields["REPOSITORY_CACHE_BACKEND"].default
+    assert default == CacheBackendType.NONE
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache_backend(request: pytest.FixtureRequest) -> CacheBackend:
+    """Cache backends exposing the same contract."""
+    if request.param == "redis":
+        return RedisCacheBackend(name="test_items", client=FakeRedis(), ttl=60)
+    return InMemoryCacheBackend(name="test_items", maxsize=10, ttl=60)
+
+
+@pytest.mark.anyio
+async def test_cached_repository_read_through(cache_backend: CacheBackend) -> None:
+    """Test that reads are cached and writes invalidate the cached entry."""
+    data: list[Any] = [Item(id=1, name="Item 1", price=1.0)]
+    repository = CachedRepository(
+        InMemoryRepository(initial_data=data), cache=cache_backend, schema=Item
+    )
+    hits = CACHE_HITS.labels("test_items")._value.get()
+
+    assert (await repository.get_by_id(1)).name == "Item 1"
+    # Change the underlying data behind the cache's back, the cached copy is served.
+    data[0] = Item(id=1, name="Changed", price=1.0)
+    assert (await repository.get_by_id(1)).name == "Item 1"
+    assert CACHE_HITS.labels("test_items")._value.get() == hits + 1
+
+    await repository.update(1, ItemUpdate(name="Updated", price=2.0))
+    assert (await repository.get_by_id(1)).name == "Updated"
+
+    await repository.delete(1)
+    assert await repository.get_by_id(1) is None
@@ -0,0 +1,271 @@
+import asyncio
+from typing import Iterator
+
+import pytest
+from app.api.items.exceptions import ItemNotFoundError
+from app.api.items.schemas import (
+    Item,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemFilters,
+    ItemUpdate,
+)
+from app.api.items.service import ItemService
+from app.common.base_exceptions import InvalidCursorError
+from app.common.base_repositories.in_memory_repository import (
+    InMemoryRepository,
+    InMemoryStore,
+    StoreSnapshot,
+)
+from app.common.filtering import FilterOperator
+from app.common.pagination import Cursor, encode_cursor, next_cursor
+
+
+@pytest.fixture
+def repository() -> InMemoryRepository[Item]:
+    """In-memory repository with items sharing prices to exercise tie-breaking."""
+    return InMemoryRepository(
+        initial_data=[
+            Item(id=i, name=f"Item {i}", price=float(i % 3)) for i in range(1, 11)
+        ]
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("order", ["asc", "desc"])
+async def test_cursor_pagination_matches_offset(
+    repository: InMemoryRepository[Item], order: str
+) -> None:
+    """Test that walking with cursors returns the same rows as a single sorted read."""
+    expected = await repository.get_all(sort_by="price", order=order)
+
+    seen: list[Item] = []
+    cursor = None
+    while True:
+        page = await repository.get_all(
+            limit=3, sort_by="price", order=order, cursor=cursor
+        )
+        seen.extend(page)
+        cursor = next_cursor(page, limit=3, sort_by="price", order=order)
+        if cursor is None:
+            break
+
+    assert [item.id for item in seen] == [item.id for item in expected]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        Cursor(sort_by="price", order="asc", values=[[1.0]], id=1),
+        Cursor(sort_by="price", order="asc", values=[1.0], id=True),
+    ],
+    ids=["list-value", "bool-id"],
+)
+async def test_crafted_cursor_is_rejected(
+    repository: InMemoryRepository[Item], cursor: Cursor
+) -> None:
+    """Test that cursors with values no sort column can hold are rejected."""
+    with pytest.raises(InvalidCursorError):
+        await repository.get_all(sort_by="price", cursor=encode_cursor(cursor))
+
+
+@pytest.mark.anyio
+async def test_bulk_writes_with_missing_ids_change_nothing(
+    repository: InMemoryRepository[Item],
+) -> None:
+    """Test that missing ids are reported before anything is written."""
+    service = ItemService(repository)
+
+    with pytest.raises(ItemNotFoundError):
+        await service.update_items(
+            [
+                ItemBulkUpdate(id=1, name="Updated", price=1.0),
+                ItemBulkUpdate(id=999, name="Ghost", price=1.0),
+            ]
+        )
+    with pytest.raises(ItemNotFoundError):
+        await service.delete_items([2, 999])
+
+    assert (await repository.get_by_id(1)).name == "Item 1"
+    assert await repository.get_by_id(2) is not None
+
+
+@pytest.mark.anyio
+async def test_store_indexes_follow_writes() -> None:
+    """Test that hash indexes and sorted views are kept in sync with writes."""
+    store = InMemoryStore(
+        [Item(id=5, name="Five", price=5.0), Item(id=2, name="Two", price=2.0)],
+        indexes=["name"],
+        sorted_fields=["price"],
+    )
+    repository = InMemoryRepository(initial_data=store)
+
+    created = await repository.create(ItemCreate(name="Two", price=9.0))
+    await repository.update(5, ItemUpdate(name="Two", price=1.0))
+    await repository.delete(2)
+    # Ids come from a counter, a deleted id is never handed out again.
+    assert (await repository.create(ItemCreate(name="Six", price=6.0))).id == 7
+
+    assert created.id == 6
+    assert [item.id for item in store] == [5, 6, 7]
+    with store.read() as snapshot:
+        assert snapshot.lookup([("name", FilterOperator.EQ, "Two")]) == {5, 6}
+        assert [item.id for item in snapshot.scan("price", True)] == [6, 7, 5]
+    filtered = await repository.get_all(filters={"name": "Two"}, sort_by="-price")
+    assert [item.id for item in filtered] == [6, 5]
+
+
+@pytest.mark.anyio
+async def test_store_scales_to_large_data(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that lookups and writes do not scan the rows of a large store."""
+    size = 100_000
+    store = InMemoryStore(
+        (Item(id=i, name=f"Item {i % 100}", price=float(i % 997)) for i in range(size)),
+        indexes=["name"],
+        sorted_fields=["price"],
+    )
+    repository = InMemoryRepository(initial_data=store)
+    # Rows visited by full scans, and by seeks in sorted views.
+    visited = {"iter": 0, "scan": 0}
+    iter_rows, scan = StoreSnapshot.__iter__, StoreSnapshot.scan
+
+    def count(rows: Iterator[Item] | None, kind: str) -> Iterator[Item] | None:
+        def counted() -> Iterator[Item]:
+            for row in rows:
+                visited[kind] += 1
+                yield row
+
+        return None if rows is None else counted()
+
+    monkeypatch.setattr(
+        StoreSnapshot, "__iter__", lambda snapshot: count(iter_rows(snapshot), "iter")
+    )
+    monkeypatch.setattr(
+        StoreSnapshot,
+        "scan",
+        lambda snapshot, *args: count(scan(snapshot, *args), "scan"),
+    )
+
+    for i in range(1000):
+        item = await repository.create(ItemCreate(name="New", price=float(i)))
+        assert (await repository.get_by_id(item.id)) == item
+        await repository.update(i, ItemUpdate(name="Updated", price=1.0))
+        await repository.delete(size - i - 1)
+    page = await repository.get_all(limit=10, sort_by="price", order="desc")
+    cursor = next_cursor(page, limit=10, sort_by="price", order="desc")
+    await repository.get_all(limit=10, sort_by="price", order="desc", cursor=cursor)
+    filtered = await repository.get_all(filters={"name": "Item 7"}, limit=10)
+
+    # Two pages read from the sorted view, the filter is served by the hash index.
+    assert visited == {"iter": 0, "scan": 20}
+    assert [item.name for item in filtered] == ["Item 7"] * 10
+    assert len(store) == size
+
+
+def test_snapshot_is_not_changed_by_writes() -> None:
+    """Test that writes copy the rows held by a snapshot instead of changing them."""
+    store = InMemoryStore([Item(id=1, name="One", price=1.0)], sorted_fields=["price"])
+    with store.read() as snapshot:
+        store.insert(Item(id=2, name="Two", price=2.0))
+        store.replace(Item(id=1, name="Changed", price=3.0))
+
+        assert [item.name for item in snapshot] == ["One"]
+    assert [item.name for item in store] == ["Changed", "Two"]
+    with store.read() as snapshot:
+        assert [item.id for item in snapshot.scan("price", False)] == [2, 1]
+
+
+@pytest.mark.anyio
+async def test_writes_after_reads_do_not_copy_large_store(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that writes only copy the rows while a reader still holds them."""
+    size = 100_000
+    store = InMemoryStore(
+        (Item(id=i, name=f"Item {i % 100}", price=float(i % 997)) for i in range(size)),
+        indexes=["name"],
+        sorted_fields=["price"],
+    )
+    repository = InMemoryRepository(initial_data=store)
+    copies: list[int] = []
+    copy = StoreSnapshot.copy
+
+    def counting_copy(snapshot: StoreSnapshot[Item]) -> StoreSnapshot[Item]:
+        copies.append(len(snapshot))
+        return copy(snapshot)
+
+    monkeypatch.setattr(StoreSnapshot, "copy", counting_copy)
+
+    for i in range(200):
+        await repository.get_all(limit=10, sort_by="price")
+        await repository.count(filters={"name": "Item 7"})
+        await repository.get_existing_ids([i])
+        await repository.create(ItemCreate(name="New", price=float(i)))
+    assert copies == []
+    assert len(store) == size + 200
+
+    rows = iter(store)
+    next(rows)
+    await repository.create(ItemCreate(name="New", price=0.0))
+    await repository.create(ItemCreate(name="New", price=0.0))
+    assert copies == [size + 200]
+    rows.close()
+    await repository.create(ItemCreate(name="New", price=0.0))
+    assert copies == [size + 200]
+
+
+@pytest.mark.anyio
+async def test_concurrent_crud_through_item_service() -> None:
+    """Test invariants under thousands of interleaved CRUD calls and paged reads."""
+    writers, readers = 3000, 20
+    store = InMemoryStore([], indexes=["name"], sorted_fields=["price"])
+    service = ItemService(InMemoryRepository(initial_data=store))
+    created_ids: list[int] = []
+
+    async def write(n: int) -> None:
+        item = await service.create_item(
+            ItemCreate(name=f"New {n % 10}", price=float(n % 7))
+        )
+        created_ids.append(item.id)
+        await asyncio.sleep(0)
+        await service.update_item(
+            item.id, ItemUpdate(name=f"Updated {n % 10}", price=float(n % 5))
+        )
+        await asyncio.sleep(0)
+        if n % 3 == 0:
+            await service.delete_item(item.id)
+
+    async def read(n: int) -> None:
+        filters = ItemFilters(name=f"Updated {n % 10}") if n % 2 else None
+        for _ in range(5):
+            keys: list[tuple[float, int]] = []
+            cursor = None
+            while True:
+                page = await service.get_items(
+                    limit=50, filters=filters, sort_by="price", cursor=cursor
+                )
+                keys.extend((item.price, item.id) for item in page)
+                cursor = next_cursor(page, limit=50, sort_by="price")
+                if cursor is None:
+                    break
+                await asyncio.sleep(0)
+            # Pages seek past the previous one, whatever was written in between.
+            assert keys == sorted(set(keys))
+
+    await asyncio.gather(
+        *(write(n) for n in range(writers)), *(read(n) for n in range(readers))
+    )
+
+    assert len(set(created_ids)) == writers
+    remaining = list(store)
+    assert len(remaining) == writers - len(range(0, writers, 3))
+    assert [item.id for item in remaining] == sorted(item.id for item in remaining)
+    assert all(item.name.startswith("Updated") for item in remaining)
+
+    with store.read() as snapshot:
+        for n in range(10):
+            ids = snapshot.lookup([("name", FilterOperator.EQ, f"Updated {n}")])
+            assert ids == {item.id for item in remaining if item.name == f"Updated {n}"}
+        by_price = [(item.price, item.id) for item in snapshot.scan("price", False)]
+    assert by_price == sorted((item.price, item.id) for item in remaining)
@@ -0,0 +1 @@
+# Make tests.test_db directory a proper package
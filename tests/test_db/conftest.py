@@ -0,0 +1,29 @@
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+from app.api.items.models import ItemModel
+from app.db.meta import meta
+from app.db.utils import create_db_engine, create_read_db_engine
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@pytest.fixture
+async def engines(
+    tmp_path: Path,
+) -> AsyncGenerator[tuple[AsyncEngine, AsyncEngine], None]:
+    """Primary and read-only engines on a seeded database file."""
+    db_file = tmp_path / "routing.db"
+    engine = create_db_engine(f"sqlite+aiosqlite:///{db_file}")
+    async with engine.begin() as conn:
+        await conn.run_sync(meta.create_all, tables=[ItemModel.__table__])
+        await conn.execute(insert(ItemModel), [{"id": 1, "name": "Item", "price": 1.0}])
+    read_engine = create_read_db_engine(
+        f"sqlite+aiosqlite:///file:{db_file}?mode=ro&uri=true"
+    )
+    try:
+        yield engine, read_engine
+    finally:
+        await read_engine.dispose()
+        await engine.dispose()
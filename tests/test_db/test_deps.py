@@ -0,0 +1,120 @@
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from app.api.items.repository import ItemRepository
+from app.api.items.schemas import Item, ItemCreate, ItemUpdate
+from app.common.base_repositories.cached_repository import CachedRepository
+from app.common.cache import InMemoryCacheBackend
+from app.db.deps import get_db_session
+from app.db.session import AFTER_COMMIT_KEY, RoutingSession
+from prometheus_client import REGISTRY
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+
+def _request(engines: tuple[AsyncEngine, AsyncEngine]) -> SimpleNamespace:
+    engine, read_engine = engines
+    session_factory = async_sessionmaker(
+        engine,
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        read_bind=read_engine.sync_engine,
+    )
+    return SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(db_session_factory=session_factory))
+    )
+
+
+def _hold_time_count(engine: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "db_connection_hold_seconds_count", {"engine": engine}
+        )
+        or 0
+    )
+
+
+@pytest.mark.anyio
+async def test_get_db_session_commits_only_writes(
+    engines: tuple[AsyncEngine, AsyncEngine],
+) -> None:
+    """Test that read-only requests skip the commit and write requests commit."""
+    engine, _ = engines
+    commits: list[bool] = []
+    event.listen(engine.sync_engine, "commit", lambda conn: commits.append(True))
+    request = _request(engines)
+
+    dependency = get_db_session(request)
+    session = await anext(dependency)
+    await dependency.aclose()
+    assert commits == []
+
+    read_holds = _hold_time_count("read")
+    dependency = get_db_session(request)
+    session = await anext(dependency)
+    await ItemRepository(session=session).get_by_id(1)
+    with pytest.raises(StopAsyncIteration):
+        await anext(dependency)
+    assert commits == []
+    assert _hold_time_count("read") == read_holds + 1
+
+    dependency = get_db_session(request)
+    session = await anext(dependency)
+    await ItemRepository(session=session).create(ItemCreate(name="New", price=2.0))
+    with pytest.raises(StopAsyncIteration):
+        await anext(dependency)
+    assert commits == [True]
+
+    dependency = get_db_session(request)
+    session = await anext(dependency)
+    assert len(await ItemRepository(session=session).get_all()) == 2
+    await dependency.aclose()
+
+
+@pytest.mark.anyio
+async def test_get_db_session_invalidates_cache_after_commit(
+    engines: tuple[AsyncEngine, AsyncEngine],
+) -> None:
+    """Test that a read racing an uncommitted update can not keep a stale entry."""
+    request = _request(engines)
+    cache = InMemoryCacheBackend(name="test_items", maxsize=10, ttl=60)
+
+    def cached(session: Any) -> CachedRepository[Item]:
+        return CachedRepository(ItemRepository(session=session), cache, schema=Item)
+
+    writer = get_db_session(request)
+    await cached(await anext(writer)).update(1, ItemUpdate(name="Updated", price=1.0))
+
+    # A concurrent request reads the committed row, and caches it, before the commit.
+    reader = get_db_session(request)
+    assert (await cached(await anext(reader)).get_by_id(1)).name == "Item"
+    with pytest.raises(StopAsyncIteration):
+        await anext(reader)
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(writer)
+
+    reader = get_db_session(request)
+    assert (await cached(await anext(reader)).get_by_id(1)).name == "Updated"
+    await reader.aclose()
+
+
+@pytest.mark.anyio
+async def test_get_db_session_drops_after_commit_callbacks_on_rollback(
+    engines: tuple[AsyncEngine, AsyncEngine],
+) -> None:
+    """Test that callbacks of a rolled back request never run."""
+    calls: list[str] = []
+
+    async def callback() -> None:
+        calls.append("called")
+
+    dependency = get_db_session(_request(engines))
+    session = await anext(dependency)
+    await ItemRepository(session=session).on_commit(callback)
+    with pytest.raises(RuntimeError):
+        await dependency.athrow(RuntimeError("boom"))
+
+    assert calls == []
+    assert AFTER_COMMIT_KEY not in session.sync_session.info
@@ -0,0 +1,62 @@
+import pytest
+from app.api.items.models import ItemModel
+from app.api.items.repository import ItemRepository
+from app.api.items.schemas import ItemCreate
+from app.db.session import RoutingSession
+from sqlalchemy import event, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+
+def _record_statements(engine: AsyncEngine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    return statements
+
+
+@pytest.mark.anyio
+async def test_reads_use_read_engine_until_first_write(
+    engines: tuple[AsyncEngine, AsyncEngine],
+) -> None:
+    """Test that reads are routed to the replica and stick to the primary once written."""
+    engine, read_engine = engines
+    primary_statements = _record_statements(engine)
+    read_statements = _record_statements(read_engine)
+    session_factory = async_sessionmaker(
+        engine,
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        read_bind=read_engine.sync_engine,
+    )
+
+    async with session_factory() as session:
+        repository = ItemRepository(session=session)
+        assert (await repository.get_by_id(1)).name == "Item"
+        assert len(await repository.get_all()) == 1
+        assert primary_statements == []
+        assert len(read_statements) == 2
+
+        created = await repository.create(ItemCreate(name="New", price=2.0))
+        read_count = len(read_statements)
+        # Not committed yet, only the primary can see it.
+        assert (await repository.get_by_id(created.id)).name == "New"
+        assert len(await repository.get_all()) == 2
+        assert len(read_statements) == read_count
+
+        await session.execute(select(ItemModel).with_for_update())
+        assert len(read_statements) == read_count
+
+
+@pytest.mark.anyio
+async def test_read_engine_is_read_only(
+    engines: tuple[AsyncEngine, AsyncEngine],
+) -> None:
+    """Test that the read-only engine refuses writes."""
+    _, read_engine = engines
+    async with read_engine.connect() as conn:
+        with pytest.raises(OperationalError, match="readonly"):
+            await conn.execute(text("DELETE FROM item"))
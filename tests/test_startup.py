@@ -0,0 +1,90 @@
+import subprocess
+import sys
+
+from app.api.users.repository import get_user_inmemory_data
+from app.scripts.profile_startup import parse_importtime
+
+# Sum of the self import time of all `app` modules. Generous on purpose to absorb
+# slow CI hosts, password hashing is checked on its own below.
+APP_IMPORT_BUDGET_MS = 750
+
+
+def test_app_import_time_budget():
+    """Test that importing the application does no expensive work at import time."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.api.application"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = [
+        item
+        for item in parse_importtime(result.stderr)
+        if item.module == "app" or item.module.startswith("app.")
+    ]
+    offenders = sorted(times, key=lambda item: item.self_us, reverse=True)[:5]
+    assert sum(item.self_us for item in times) / 1000 < APP_IMPORT_BUDGET_MS, offenders
+
+
+def test_no_password_is_hashed_on_import():
+    """Test that importing the application does not hash any password."""
+    code = "\n".join(
+        [
+            "import pwdlib",
+            "def hash(self, password, *args, **kwargs):",
+            "    raise RuntimeError('Password hashed on import')",
+            "pwdlib.PasswordHash.hash = hash",
+            "import app.api.application",
+        ]
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_telemetry_backends_are_imported_lazily():
+    """Test that OpenTelemetry instrumentors and exporters are not imported eagerly."""
+    lazy_modules = [
+        "opentelemetry.exporter.otlp.proto.grpc.trace_exporter",
+        "opentelemetry.instrumentation.fastapi",
+        "opentelemetry.instrumentation.logging",
+    ]
+    code = (
+        "import sys, app.api.application; "
+        f"print([m for m in {lazy_modules!r} if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_in_memory_users_are_seeded_lazily():
+    """Test that the seeded users are built once, each with its own password hash."""
+    users = get_user_inmemory_data()
+    assert [user.email for user in users] == [
+        "john@example.com",
+        "jane@example.com",
+        "admin@mail.com",
+    ]
+    assert users[0].hashed_password != users[1].hashed_password
+    assert get_user_inmemory_data() is users
+
+
+def test_parse_importtime():
+    """Test parsing of `-X importtime` output."""
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   app.core.settings",
+            "import time:        30 |        150 | app",
+            "unrelated warning",
+        ]
+    )
+    assert [
+        (t.module, t.self_us, t.cumulative_us) for t in parse_importtime(output)
+    ] == [
+        ("app.core.settings", 120, 120),
+        ("app", 30, 150),
+    ]